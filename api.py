@@ -0,0 +1,154 @@
+"""
+Serves the leaderboards as a read-only JSON API from the snapshot written by cli.py.
+
+The server only reads api.json: every body and its ETag are encoded once when the
+snapshot is loaded, so a request is a dictionary lookup and the scoring pipeline (and
+pandas) is never imported. The snapshot is reloaded when cli.py replaces it.
+
+Usage (from the repository root):
+    python cli.py --out output
+    python api.py --snapshot output/api.json --port 8000
+
+Endpoints (see utils/api.py):
+    GET /v1
+    GET /v1/districts/<district>
+    GET /v1/districts/<district>/leaderboards[/<group>/<tier>]
+    GET /v1/districts/<district>/clubs[/<club number>]
+    GET /v1/districts/<district>/winners/<quarter>
+
+Every response carries a strong ETag; a request whose If-None-Match matches it gets 304.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+logger = logging.getLogger("api")
+
+# ------------------ Snapshot ------------------ #
+# path -> (body bytes, ETag). The whole dict is swapped on reload, so a request
+# always sees one consistent snapshot.
+
+_responses = {}
+_snapshot = {"path": None, "mtime_ns": None, "checked_at": 0.0, "generated_at": None}
+_snapshot_lock = threading.Lock()
+
+def encode_snapshot(snapshot: dict) -> dict:
+    """
+    Encodes every resource of a snapshot once.
+
+    The ETag is the digest of the body, so it is strong and changes exactly when the
+    data behind that resource changes; resources of a district whose data did not
+    change keep answering 304 after another district is refreshed.
+
+    Returns:
+        dict: Path -> (body bytes, ETag).
+    """
+    responses = {}
+    for path, resource in snapshot["resources"].items():
+        body = json.dumps(resource, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        responses[path] = (body, '"' + hashlib.sha256(body).hexdigest()[:32] + '"')
+    return responses
+
+def load_snapshot(path: str) -> None:
+    """Reads and encodes the snapshot at path, replacing the one being served."""
+    global _responses
+
+    stat = os.stat(path)
+    with open(path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    responses = encode_snapshot(snapshot)
+    with _snapshot_lock:
+        _responses = responses
+        _snapshot.update(path=path, mtime_ns=stat.st_mtime_ns, generated_at=snapshot.get("generated_at"))
+    logger.info("Serving %d resources generated at %s", len(responses), snapshot.get("generated_at"))
+
+def _reload_if_changed() -> None:
+    """Reloads the snapshot when its file was replaced; checked at most every API_RELOAD_SECONDS."""
+    now = time.monotonic()
+    with _snapshot_lock:
+        if now - _snapshot["checked_at"] < float(os.environ.get("API_RELOAD_SECONDS", 5)):
+            return
+        _snapshot["checked_at"] = now
+        path, mtime_ns = _snapshot["path"], _snapshot["mtime_ns"]
+    try:
+        if os.stat(path).st_mtime_ns != mtime_ns:
+            load_snapshot(path)
+    except (OSError, ValueError) as e:
+        logger.warning("Keeping the previous snapshot: %s", e)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match uses the weak comparison: W/ prefixes are ignored, '*' matches anything."""
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+# ------------------ HTTP ------------------ #
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so clients polling the API reuse their connection
+    server_version = "LeaderboardAPI/1"
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body: bool):
+        _reload_if_changed()
+        path = urlsplit(self.path).path.rstrip("/") or "/v1"
+        response = _responses.get(path)
+        if response is None:
+            body = json.dumps({"error": "not found", "path": path}).encode("utf-8")
+            self._send(404, body, None, send_body)
+            return
+
+        body, etag = response
+        if _etag_matches(self.headers.get("If-None-Match", ""), etag):
+            self._send(304, b"", etag, send_body=False)
+            return
+        self._send(200, body, etag, send_body)
+
+    def _send(self, status: int, body: bytes, etag, send_body: bool):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"public, max-age={int(os.environ.get('API_MAX_AGE_SECONDS', 60))}")
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        if send_body and body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("%s " + format, self.address_string(), *args)
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the leaderboards written by cli.py as a read-only JSON API.")
+    parser.add_argument("--snapshot", default=os.path.join("output", "api.json"), help="api.json written by cli.py.")
+    parser.add_argument("--host", default=os.environ.get("API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("API_PORT", 8000)))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    load_snapshot(args.snapshot)
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    server.daemon_threads = True
+    logger.info("Listening on http://%s:%d/v1", args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
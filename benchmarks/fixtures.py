@@ -0,0 +1,204 @@
+import os
+from io import BytesIO
+import numpy as np
+import pandas as pd
+from utils.helpers import (CLUB_PERFORMANCE_READ_KWARGS, EXCEL_READ_KWARGS, LOCAL_SOURCE_EXTENSIONS,
+                           MEMBERSHIP_LIST_READ_KWARGS, form_read_kwargs, seed_source)
+from utils.metrics import SCORING_RULES
+from utils.history import LEGACY_COLUMNS
+
+TESTDATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "testdata", "clubperformance")
+
+# The dashboard exports in testdata predate the current column names and have no CSP or Net Growth column
+FIXTURE_COLUMNS = LEGACY_COLUMNS
+
+# Quarter -> (base export, latest export); the base of a quarter is the export that closed the previous one.
+# Q1 borrows the season's own June export, since the previous season is not always in testdata.
+QUARTER_EXPORTS = {
+    "Q1": ("06.csv", "09.csv"),
+    "Q2": ("09.csv", "12.csv"),
+    "Q3": ("12.csv", "03.csv"),
+    "Q4": ("03.csv", "06.csv"),
+}
+
+QUARTER_WINDOWS = {
+    "Q1": ("07-01", "09-30", 0),
+    "Q2": ("10-01", "12-31", 0),
+    "Q3": ("01-01", "03-31", 1),
+    "Q4": ("04-01", "06-30", 1),
+}
+
+AWARD_CODES = ["PM1", "PM2", "PM3", "PM4", "PM5", "DL1", "DL2", "DL3", "DL4", "EC5", "DTM", "FF"]
+
+def read_export(season: str, filename: str) -> pd.DataFrame:
+    """
+    Reads a club performance export from testdata into a plain frame, footer row included.
+    The pipeline never sees this frame: district_sources writes it back out as export bytes.
+    """
+    df = pd.read_csv(os.path.join(TESTDATA_DIR, f"({season})", filename)).rename(columns=FIXTURE_COLUMNS)
+    df["CSP"] = np.where(pd.to_numeric(df["Goals Met"], errors="coerce") >= 5, "Y", "N")
+    df["Net Growth"] = pd.to_numeric(df["Active Members"], errors="coerce") - pd.to_numeric(df["Mem. Base"], errors="coerce")
+    df.loc[df["Club Name"].isna(), ["CSP", "Net Growth"]] = None
+    return df
+
+def scale_exports(df_base: pd.DataFrame, df_latest: pd.DataFrame, n_clubs: int, rng: np.random.Generator) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Builds a synthetic district of n_clubs by sampling clubs present in both exports.
+    Every sampled club gets a fresh Club Number and name, and a jittered member count.
+    """
+    base = df_base[df_base["Club Name"].notna()].copy()
+    latest = df_latest[df_latest["Club Name"].notna()].copy()
+    base["Club Number"] = base["Club Number"].astype(int)
+    latest["Club Number"] = latest["Club Number"].astype(int)
+    latest = latest[latest["Club Number"].isin(base["Club Number"])].set_index("Club Number")
+    base = base.set_index("Club Number").loc[latest.index]
+
+    picks = rng.integers(0, len(latest), n_clubs)
+    club_numbers = np.arange(10_000_000, 10_000_000 + n_clubs)
+    names = base["Club Name"].to_numpy()[picks] + " " + club_numbers.astype(str)
+    jitter = rng.integers(-3, 4, n_clubs)
+
+    def scaled(df):
+        out = df.iloc[picks].reset_index()
+        out["Club Number"] = club_numbers
+        out["Club Name"] = names
+        out["Active Members"] = (pd.to_numeric(out["Active Members"]) + jitter).clip(lower=0)
+        return out
+
+    return scaled(base), scaled(latest)
+
+def _random_dates(rng: np.random.Generator, start: str, end: str, n: int) -> pd.Series:
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    seconds = rng.integers(0, int((end - start).total_seconds()) + 1, n)
+    return pd.Series(start + pd.to_timedelta(seconds, unit="s"))
+
+def edu_achievements(clubs: pd.DataFrame, year_start: str, quarter_end: str, rng: np.random.Generator) -> pd.DataFrame:
+    """Synthetic education achievements log: a few members per club completing random awards."""
+    n = len(clubs) * 4
+    picks = rng.integers(0, len(clubs), n)
+    return pd.DataFrame({
+        "Club": clubs["Club Number"].to_numpy()[picks],
+        "Name": clubs["Club Name"].to_numpy()[picks],
+        "Award": rng.choice(AWARD_CODES, n),
+        "Date": _random_dates(rng, year_start, quarter_end, n),
+        "Member": "Member " + rng.integers(0, 5, n).astype(str),
+    })
+
+def form_responses(clubs: pd.DataFrame, source: str, year_start: str, quarter_end: str, rng: np.random.Generator) -> pd.DataFrame:
+    """Synthetic Google Form responses for one source sheet, with every date column its rules read."""
+    n = max(len(clubs) // 4, 1)
+    picks = rng.integers(0, len(clubs), n)
+    df = pd.DataFrame({
+        "Select Your Club": clubs["Club Name"].to_numpy()[picks] + " ---- " + clubs["Club Number"].to_numpy()[picks].astype(str)
+    })
+    for col in dict.fromkeys(rule["date_col"] for rule in SCORING_RULES if rule["source"] == source):
+        fmt = "%m/%d/%Y %H:%M:%S" if col == "Timestamp" else "%m/%d/%Y"
+        df[col] = _random_dates(rng, year_start, quarter_end, n).dt.strftime(fmt)
+    return df
+
+def membership_list(clubs: pd.DataFrame, rng: np.random.Generator) -> pd.DataFrame:
+    """Synthetic membership list: three members per club, mostly enrolled in Pathways."""
+    n = len(clubs) * 3
+    return pd.DataFrame({
+        "Club Number": np.repeat(clubs["Club Number"].to_numpy(), 3),
+        "Is Pathways Enrolled": np.where(rng.random(n) < 0.9, "Yes", "No"),
+    })
+
+def export_bytes(df: pd.DataFrame, footer: str) -> bytes:
+    """
+    A club performance export as the dashboard writes it: every field quoted, Club Numbers
+    zero-padded, counts without decimals and a "Month of ..., As of ..." footer line.
+    """
+    body = df[df["Club Name"].notna()].copy()
+    for column in body.columns:
+        if body[column].dtype.kind == "f":
+            body[column] = body[column].astype("Int64")
+    body["Club Number"] = body["Club Number"].astype(int).astype(str).str.zfill(8)
+    return body.to_csv(index=False, quoting=1).encode("utf-8") + footer.encode("utf-8") + b"\n"
+
+def excel_bytes(df: pd.DataFrame, title: str) -> bytes:
+    """An Excel export with a title row above the header, as the education achievements report has."""
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer) as writer:
+        pd.DataFrame([[title]]).to_excel(writer, sheet_name="Sheet1", index=False, header=False)
+        df.to_excel(writer, sheet_name="Sheet1", index=False, startrow=1)
+    return buffer.getvalue()
+
+def district_sources(df_base: pd.DataFrame, df_latest: pd.DataFrame, season: str, quarter: str,
+                     seed: int = 0) -> tuple[dict, list[tuple[str, str, dict, bytes]]]:
+    """
+    Every source of the pipeline for one district and quarter, as the raw bytes the real
+    files have. The quarter base also stands in for the closed last quarter.
+
+    Returns:
+        tuple: (quarter settings env, [(secret_key, kind, read_kwargs, raw bytes)]).
+    """
+    rng = np.random.default_rng(seed)
+    start_year = int(season.split("-")[0])
+    start, end, year_offset = QUARTER_WINDOWS[quarter]
+    year_start = f"{start_year}-07-01"
+    quarter_start = f"{start_year + year_offset}-{start}"
+    quarter_end = f"{start_year + year_offset}-{end}"
+    footer = f"Month of {pd.Timestamp(quarter_end):%b}, As of {pd.Timestamp(quarter_end):%m/%d/%Y}"
+
+    settings = {
+        "Current_Quarter": quarter,
+        "PROGRAM_YEAR": season,
+        "QUARTER_START_DATE": quarter_start,
+        "QUARTER_END_DATE": quarter_end,
+    }
+
+    clubs = df_latest[df_latest["Club Name"].notna()][["Club Number", "Club Name"]].copy()
+    clubs["Club Number"] = clubs["Club Number"].astype(int)
+
+    exports = {
+        "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + quarter: df_latest,
+        "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_BASE_" + quarter: df_base,
+    }
+    last_quarter = {"Q2": "Q1", "Q3": "Q2", "Q4": "Q3"}.get(quarter)
+    if last_quarter is not None:
+        exports["GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + last_quarter] = df_base
+
+    sources = [(secret_key, "drive_csv", CLUB_PERFORMANCE_READ_KWARGS, export_bytes(df, footer))
+               for secret_key, df in exports.items()]
+    sources.append(("GOOGLE_DRIVE_FILE_ID_EDU_ACHIEVEMENTS", "drive_excel", EXCEL_READ_KWARGS,
+                    excel_bytes(edu_achievements(clubs, year_start, quarter_end, rng), "Education Achievements")))
+    for source in dict.fromkeys(rule["source"] for rule in SCORING_RULES):
+        df = form_responses(clubs, source, year_start, quarter_end, rng)
+        sources.append((source, "sheet_csv", form_read_kwargs(source), df.to_csv(index=False).encode("utf-8")))
+    sources.append(("GOOGLE_DRIVE_FILE_ID_MEMBERSHIP_LIST", "sheet_csv", MEMBERSHIP_LIST_READ_KWARGS,
+                    membership_list(clubs, rng).to_csv(index=False).encode("utf-8")))
+    return settings, sources
+
+def install_district(df_base: pd.DataFrame, df_latest: pd.DataFrame, season: str, quarter: str, seed: int = 0) -> int:
+    """
+    Points every source of the pipeline at local data for one district and quarter. Each
+    source's bytes are seeded into the source cache, which parses them as a download would
+    (only the download is skipped).
+
+    Returns:
+        int: Number of clubs in the district.
+    """
+    settings, sources = district_sources(df_base, df_latest, season, quarter, seed)
+    os.environ.update(settings)
+    for secret_key, kind, read_kwargs, content in sources:
+        os.environ[secret_key] = f"local-{secret_key}"
+        seed_source(secret_key, kind, content, **read_kwargs)
+    return int(df_latest["Club Name"].notna().sum())
+
+def write_district(directory: str, df_base: pd.DataFrame, df_latest: pd.DataFrame, season: str, quarter: str,
+                   seed: int = 0) -> dict:
+    """
+    Writes every source of one district and quarter as files for the local backend.
+
+    Returns:
+        dict: Env that points the pipeline at the files (backend, directory and quarter settings).
+    """
+    os.makedirs(directory, exist_ok=True)
+    settings, sources = district_sources(df_base, df_latest, season, quarter, seed)
+    env = {**settings, "SOURCE_BACKEND": "local", "LOCAL_SOURCE_DIR": directory}
+    for secret_key, kind, _, content in sources:
+        env[secret_key] = secret_key + LOCAL_SOURCE_EXTENSIONS[kind]
+        with open(os.path.join(directory, env[secret_key]), "wb") as f:
+            f.write(content)
+    return env
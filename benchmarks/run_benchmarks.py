@@ -0,0 +1,143 @@
+"""
+Benchmarks the leaderboard pipeline against the exports in testdata/clubperformance
+and against synthetic districts scaled up from them.
+
+Usage (from the repository root):
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 100 1000 --repeat 3
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+from benchmarks.fixtures import QUARTER_EXPORTS, install_district, read_export, scale_exports
+from utils.helpers import (
+    clear_source_cache,
+    generate_leaderboard_excel,
+    get_merged_club_data,
+    load_data_club_performance,
+    prepare_excellence_champions_data,
+    prepare_leadership_innovators_data,
+    prepare_pathways_pioneers_data,
+)
+from utils.leaderboard import group_meta, incentives_tiers, rank_all_leaderboards
+from utils.shared_cache import clear_shared_cache
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+def measure(fn, repeat: int) -> tuple[object, float, float]:
+    """
+    Runs fn `repeat` times untraced for the best wall time, then once under tracemalloc for peak memory.
+
+    Returns:
+        tuple: (result of the last run, best seconds, peak MiB)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, best, peak / 2**20
+
+def run_district(dataset: str, df_base: pd.DataFrame, df_latest: pd.DataFrame, season: str, quarter: str, repeat: int) -> list[dict]:
+    """Times every pipeline stage on one district and returns one result row per stage."""
+    # A fresh snapshot store per district, away from the real one
+    os.environ["SNAPSHOT_DIR"] = tempfile.mkdtemp(prefix="pqd-bench-")
+    clear_source_cache()
+    n_clubs = install_district(df_base, df_latest, season, quarter)
+
+    results = []
+    def record(stage, fn):
+        result, seconds, peak_mb = measure(fn, repeat)
+        results.append({
+            "dataset": dataset,
+            "clubs": n_clubs,
+            "stage": stage,
+            "seconds": round(seconds, 6),
+            "peak_mb": round(peak_mb, 3),
+            "rows_per_second": round(n_clubs / seconds, 1) if seconds > 0 else None,
+        })
+        print(f"{dataset:>16} {n_clubs:>8} {stage:<36} {seconds:>10.4f}s {peak_mb:>10.1f} MiB")
+        return result
+
+    df_club_performance, _ = record("load_data_club_performance", load_data_club_performance)
+    record("prepare_pathways_pioneers_data", lambda: prepare_pathways_pioneers_data(df_club_performance))
+    record("prepare_leadership_innovators_data", lambda: prepare_leadership_innovators_data(df_club_performance))
+    record("prepare_excellence_champions_data", lambda: prepare_excellence_champions_data(df_club_performance))
+    def uncached(fn):
+        # Without this every repeat after the first is a shared cache hit
+        def run():
+            clear_shared_cache()
+            return fn()
+        return run
+
+    df_merged, _ = record("get_merged_club_data", uncached(get_merged_club_data))
+    record("rank_all_leaderboards", lambda: rank_all_leaderboards(df_merged))
+    record("generate_leaderboard_excel", lambda: generate_leaderboard_excel(df_merged, group_meta, incentives_tiers))
+    return results
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--season", default="2024-2025", help="testdata season folder, e.g. 2024-2025")
+    parser.add_argument("--quarter", default="Q2", choices=sorted(QUARTER_EXPORTS))
+    parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_SIZES, help="synthetic district sizes in clubs")
+    parser.add_argument("--repeat", type=int, default=1, help="untraced runs per stage; the best time is kept")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<UTC timestamp>.json)")
+    args = parser.parse_args()
+
+    os.environ["SOURCE_CACHE_TTL_SECONDS"] = str(10**9)
+
+    base_file, latest_file = QUARTER_EXPORTS[args.quarter]
+    df_base = read_export(args.season, base_file)
+    df_latest = read_export(args.season, latest_file)
+
+    started = datetime.now(timezone.utc)
+    results = run_district(f"testdata {args.season}", df_base, df_latest, args.season, args.quarter, args.repeat)
+    rng = np.random.default_rng(0)
+    for size in args.sizes:
+        df_base_scaled, df_latest_scaled = scale_exports(df_base, df_latest, size, rng)
+        results += run_district("synthetic", df_base_scaled, df_latest_scaled, args.season, args.quarter, args.repeat)
+
+    output = args.output or os.path.join(RESULTS_DIR, started.strftime("%Y%m%dT%H%M%SZ") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "timestamp": started.isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "season": args.season,
+            "quarter": args.quarter,
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"Results written to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Measures cold-start cost of the app, optionally against an older commit.
+
+Every measurement runs in a fresh interpreter:
+    first_element   `streamlit run app.py` until a browser session gets the first element
+                    of the leaderboard page (the app redirects there)
+    page_imports    the top-level imports of the leaderboard page, i.e. what has to be
+                    loaded before the page can put anything on screen
+    pipeline        importing the full data pipeline (utils.leaderboard)
+With --cold-bytecode each run gets an empty bytecode cache, as in a container image
+that was built without `python -m compileall`.
+
+Usage (from the repository root):
+    python benchmarks/startup.py
+    python benchmarks/startup.py --baseline HEAD~1 --repeat 5 --cold-bytecode
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+
+IMPORT_TIMER = "import time; t = time.perf_counter(); {imports}; print(time.perf_counter() - t)"
+
+def page_imports(tree: str) -> str:
+    """The import statements at the top of the leaderboard page, before its first other statement."""
+    page = glob.glob(os.path.join(tree, "pages", "1_*Leaderboard.py"))[0]
+    with open(page, encoding="utf-8") as f:
+        module = ast.parse(f.read())
+    imports = []
+    for node in module.body:
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            break
+        imports.append(ast.unparse(node))
+    return "; ".join(imports)
+
+def _env(cold_bytecode: bool) -> dict:
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1" if cold_bytecode else ""}
+    if cold_bytecode:
+        env["PYTHONPYCACHEPREFIX"] = tempfile.mkdtemp(prefix="pycache-")
+    return env
+
+def time_imports(tree: str, imports: str, cold_bytecode: bool) -> float:
+    result = subprocess.run([sys.executable, "-c", IMPORT_TIMER.format(imports=imports)],
+                            cwd=tree, env=_env(cold_bytecode), capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _first_element(port: int, deadline: float) -> None:
+    """
+    Opens a session the way the browser does (a websocket on /_stcore/stream asking for a
+    script run) and waits until the server sends the first element of the page.
+    """
+    from websockets.exceptions import WebSocketException
+    from websockets.sync.client import connect
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    while True:
+        try:
+            websocket = connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=["streamlit"], open_timeout=1)
+            break
+        except (OSError, WebSocketException):
+            if time.perf_counter() > deadline:
+                raise
+            time.sleep(0.01)
+
+    with websocket:
+        request = BackMsg()
+        request.rerun_script.query_string = ""
+        request.rerun_script.page_script_hash = ""
+        websocket.send(request.SerializeToString())
+        while True:
+            message = ForwardMsg()
+            message.ParseFromString(websocket.recv(timeout=max(deadline - time.perf_counter(), 0)))
+            if message.WhichOneof("type") == "delta" and message.delta.WhichOneof("type") == "new_element":
+                return
+
+def time_server(tree: str, cold_bytecode: bool, timeout: float = 60) -> float:
+    """Seconds from launching the Streamlit server until a new session receives its first rendered element."""
+    port = _free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless=true",
+         f"--server.port={port}", "--server.address=127.0.0.1", "--browser.gatherUsageStats=false"],
+        cwd=tree, env=_env(cold_bytecode), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        _first_element(port, started + timeout)
+        return time.perf_counter() - started
+    except (OSError, TimeoutError) as e:
+        raise TimeoutError(f"Streamlit did not render the page within {timeout}s") from e
+    finally:
+        server.terminate()
+        server.wait()
+
+def measure_tree(label: str, tree: str, repeat: int, cold_bytecode: bool) -> list[dict]:
+    stages = {
+        "first_element": lambda: time_server(tree, cold_bytecode),
+        "page_imports": lambda: time_imports(tree, page_imports(tree), cold_bytecode),
+        "pipeline": lambda: time_imports(tree, "import utils.leaderboard", cold_bytecode),
+    }
+    results = []
+    for stage, fn in stages.items():
+        runs = [fn() for _ in range(repeat)]
+        results.append({"tree": label, "stage": stage, "median_ms": statistics.median(runs) * 1000,
+                        "min_ms": min(runs) * 1000, "runs": repeat})
+        print(f"{label:>10}  {stage:<13} median {results[-1]['median_ms']:8.1f} ms   min {results[-1]['min_ms']:8.1f} ms")
+    return results
+
+def export_tree(ref: str) -> str:
+    """Extracts the files of a commit into a temporary folder."""
+    target = tempfile.mkdtemp(prefix="startup-baseline-")
+    archive = subprocess.run(["git", "archive", "--format=tar", ref], cwd=REPO_ROOT, capture_output=True, check=True).stdout
+    with tempfile.TemporaryFile() as f:
+        f.write(archive)
+        f.seek(0)
+        with tarfile.open(fileobj=f) as tar:
+            tar.extractall(target)
+    return target
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", help="git ref to compare against, e.g. HEAD~1")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per measurement; the median is reported")
+    parser.add_argument("--cold-bytecode", action="store_true", help="start every process with an empty bytecode cache")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/startup-<UTC timestamp>.json)")
+    args = parser.parse_args()
+
+    started = datetime.now(timezone.utc)
+    results = []
+    if args.baseline:
+        results += measure_tree(args.baseline, export_tree(args.baseline), args.repeat, args.cold_bytecode)
+    results += measure_tree("current", REPO_ROOT, args.repeat, args.cold_bytecode)
+
+    output = args.output or os.path.join(RESULTS_DIR, "startup-" + started.strftime("%Y%m%dT%H%M%SZ") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({
+            "timestamp": started.isoformat(),
+            "baseline": args.baseline,
+            "cold_bytecode": args.cold_bytecode,
+            "repeat": args.repeat,
+            "results": results,
+        }, f, indent=2)
+    print(f"Results written to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Computes the leaderboards without Streamlit and writes them to disk, e.g. from cron.
+
+Sources and quarter settings come from the same environment variables as the app.
+
+Usage (from the repository root):
+    python cli.py --out output
+    python cli.py --out output --manifest districts.json --workers 4
+
+For each district the output folder receives:
+    District_<id>_Leaderboard.xlsx   the workbook offered by the leaderboard page
+    District_<id>_Leaderboards.csv   every ranked (Club Group, tier) leaderboard, one after another
+    District_<id>_Clubs.csv          the merged per-club scores
+and run.json records the update date of each district and any district that failed.
+api.json holds every response of the JSON API for all districts (serve it with api.py).
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+
+import pandas as pd
+from utils.api import WINNER_QUARTERS, api_snapshot, district_resources, winners_secret_key
+from utils.diagnostics import export_json
+from utils.helpers import get_merged_club_data, leaderboard_excel_bytes, load_incentive_winners
+from utils.leaderboard import group_meta, incentives_tiers, rank_all_leaderboards
+
+def ranked_leaderboards_frame(leaderboards: dict) -> pd.DataFrame:
+    """Stacks the ranked leaderboards into one frame with 'Leaderboard Group' and 'Leaderboard Tier' columns."""
+    frames = []
+    for (group_name, tier_name), df_ranked in leaderboards.items():
+        df_ranked = df_ranked.copy()
+        df_ranked.insert(0, 'Leaderboard Tier', tier_name)
+        df_ranked.insert(0, 'Leaderboard Group', group_name)
+        frames.append(df_ranked)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def write_district(out_dir: str, district: str, df_merged: pd.DataFrame) -> list[str]:
+    """
+    Ranks one district and writes its workbook and CSVs.
+
+    Returns:
+        list[str]: Paths written.
+    """
+    prefix = os.path.join(out_dir, f"District_{district}")
+    paths = [f"{prefix}_Leaderboard.xlsx", f"{prefix}_Leaderboards.csv", f"{prefix}_Clubs.csv"]
+
+    with open(paths[0], "wb") as f:
+        f.write(leaderboard_excel_bytes(df_merged, group_meta, incentives_tiers))
+    ranked_leaderboards_frame(rank_all_leaderboards(df_merged)).to_csv(paths[1], index=False)
+    df_merged.to_csv(paths[2], index=False)
+    return paths
+
+def published_winners(district: str, env: dict = None) -> dict:
+    """Winners frame of every quarter whose winners workbook is configured for the district."""
+    winners = {}
+    for quarter in WINNER_QUARTERS:
+        secret_key = winners_secret_key(district, quarter)
+        if (env or {}).get(secret_key):
+            os.environ[secret_key] = env[secret_key]  # Manifest entries set it for the workers only
+        if os.environ.get(secret_key):
+            df_winners = load_incentive_winners(secret_key)
+            if not df_winners.empty:
+                winners[quarter] = df_winners
+    return winners
+
+def write_api_snapshot(out_dir: str, resources: dict, generated_at: str) -> str:
+    """Writes api.json atomically, so a running api.py never reads half a file."""
+    path = os.path.join(out_dir, "api.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(api_snapshot(resources, generated_at, os.environ.get("Current_Quarter")), f, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+    return path
+
+def run(out_dir: str, manifest: str = None, workers: int = None) -> dict:
+    """
+    Runs the pipeline for the configured district, or for every district of a manifest,
+    and writes the artifacts to out_dir.
+
+    Returns:
+        dict: The run summary also written to run.json.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    summary = {'generated_at': datetime.now(timezone.utc).isoformat(timespec="seconds"),
+               'quarter': os.environ.get("Current_Quarter"),
+               'districts': {}, 'errors': {}}
+    resources = {}
+
+    if manifest:
+        # Imported here: the process pool is only needed for manifest runs
+        from utils.districts import load_manifest, run_districts, district_frame
+        districts = load_manifest(manifest)
+        env_of = {entry['district']: entry['env'] for entry in districts}
+        result = run_districts(districts, max_workers=workers)
+        summary['errors'] = result['errors']
+        for district, update_date in result['update_dates'].items():
+            df_district = district_frame(result, district).drop(columns='District')
+            paths = write_district(out_dir, district, df_district)
+            summary['districts'][district] = {'update_date': update_date, 'clubs': len(df_district), 'files': paths}
+            resources[district] = district_resources(district, df_district, update_date, published_winners(district, env_of[district]))
+    else:
+        district = os.environ.get("DISTRICT", "91")
+        try:
+            df_merged, update_date = get_merged_club_data()
+            paths = write_district(out_dir, district, df_merged)
+            summary['districts'][district] = {'update_date': update_date, 'clubs': len(df_merged), 'files': paths}
+            resources[district] = district_resources(district, df_merged, update_date, published_winners(district))
+        except Exception as e:
+            summary['errors'][district] = f"{type(e).__name__}: {e}"
+
+    if resources:
+        summary['api_snapshot'] = write_api_snapshot(out_dir, resources, summary['generated_at'])
+
+    with open(os.path.join(out_dir, "run.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compute and export the incentive leaderboards without Streamlit.")
+    parser.add_argument("--out", default="output", help="Folder for the workbooks, CSVs and run.json.")
+    parser.add_argument("--manifest", help="Districts manifest to run every district of (see districts.example.json).")
+    parser.add_argument("--workers", type=int, help="Worker processes for a manifest run (default DISTRICT_WORKERS or CPU count).")
+    parser.add_argument("--diagnostics", action="store_true", help="Also write the stage timings to diagnostics.json.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    summary = run(args.out, manifest=args.manifest, workers=args.workers)
+    if args.diagnostics:
+        with open(os.path.join(args.out, "diagnostics.json"), "w") as f:
+            f.write(export_json())
+
+    for district, info in summary['districts'].items():
+        logging.info("District %s: %d clubs, data as of %s", district, info['clubs'], info['update_date'])
+    for district, error in summary['errors'].items():
+        logging.error("District %s failed: %s", district, error)
+    return 1 if summary['errors'] or not summary['districts'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
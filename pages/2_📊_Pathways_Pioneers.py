@@ -1,5 +1,6 @@
 import streamlit as st
-from utils.helpers import load_data_club_performance, prepare_pathways_pioneers_data
+from utils.helpers import get_tier_data
+from utils.widgets import show_data_freshness, stop_if_data_unavailable
 
 # ------------------ HEADER ------------------ #
 st.markdown(
@@ -17,9 +18,10 @@ st.markdown(
 
 st.markdown("<h2 style='text-align: center;'>📊 Pathways Pioneers – Detailed Breakdown</h2>", unsafe_allow_html=True)
 
-df_club_performance, update_date = load_data_club_performance()
-
-df_pathways_pioneers = prepare_pathways_pioneers_data(df_club_performance)
+# Shared with every other session and the leaderboard; computed once per data version
+with stop_if_data_unavailable():
+    df_pathways_pioneers, update_date = get_tier_data("Pathways Pioneers")
+show_data_freshness()
 
 # ------------------ Display ------------------ #
 # Extract date from filename
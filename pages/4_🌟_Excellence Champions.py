@@ -1,5 +1,6 @@
 import streamlit as st
-from utils.helpers import load_data_club_performance, prepare_excellence_champions_data
+from utils.helpers import get_tier_data
+from utils.widgets import show_data_freshness, stop_if_data_unavailable
 
 # ------------------ HEADER ------------------ #
 st.markdown(
@@ -18,9 +19,10 @@ st.markdown(
 st.markdown("<h2 style='text-align: center;'> 🌟 Excellence Champions – Detailed Breakdown</h2>", unsafe_allow_html=True)
 
 # ------------------ Load and Prepare Data ------------------ #
-df_club_performance, update_date = load_data_club_performance()
-
-df_excellence_champions = prepare_excellence_champions_data(df_club_performance)
+# Shared with every other session and the leaderboard; computed once per data version
+with stop_if_data_unavailable():
+    df_excellence_champions, update_date = get_tier_data("Excellence Champions")
+show_data_freshness()
 
 # ------------------ Display ------------------ #
 # Extract date from filename
@@ -0,0 +1,76 @@
+import pandas as pd
+import streamlit as st
+from utils.diagnostics import stage_summary, counters, export_json, reset
+from utils.shared_cache import shared_cache_info
+from utils.helpers import source_health
+
+# ------------------ HEADER ------------------ #
+st.markdown("<h2 style='text-align: center;'>🩺 Diagnostics</h2>", unsafe_allow_html=True)
+st.markdown("<p style='text-align: center;'>Timings of the loaders, scorers and page stages in this app process.</p>", unsafe_allow_html=True)
+
+# ------------------ STAGE TIMINGS ------------------ #
+st.markdown("### ⏱️ Stage Timings")
+st.caption("Rolling percentiles over the most recent calls of each stage; Errors counts the calls that raised.")
+
+df_summary = stage_summary()
+if df_summary.empty:
+    st.info("No stages recorded yet. Open the leaderboard to populate the numbers.")
+else:
+    st.dataframe(
+        df_summary.style.format({
+            'p50 ms': '{:.1f}', 'p90 ms': '{:.1f}', 'p99 ms': '{:.1f}', 'Max ms': '{:.1f}',
+            'Rows In': '{:.0f}', 'Rows Out': '{:.0f}', 'Bytes': '{:,.0f}',
+        }, na_rep='–'),
+        use_container_width=True,
+        hide_index=True
+    )
+
+# ------------------ COUNTERS ------------------ #
+st.markdown("### 🔢 Cache Counters")
+counts = counters()
+if counts:
+    st.dataframe(
+        [{'Counter': name, 'Count': value} for name, value in sorted(counts.items())],
+        use_container_width=True,
+        hide_index=True
+    )
+else:
+    st.caption("No counters recorded yet.")
+
+# ------------------ SOURCES ------------------ #
+st.markdown("### 📡 Sources")
+st.caption("Stale sources are served from their last good copy; an open circuit skips requests until its cooldown ends.")
+health = source_health()
+if health:
+    for row in health:
+        row['Last Good'] = pd.to_datetime(row['Last Good'], unit='s', utc=True) if row['Last Good'] else None
+    st.dataframe(health, use_container_width=True, hide_index=True)
+else:
+    st.caption("No sources loaded yet.")
+
+# ------------------ SHARED CACHE ------------------ #
+st.markdown("### 🗄️ Shared Cache")
+st.caption("Results shared by every session of this server process, one per data version.")
+entries = shared_cache_info()
+if entries:
+    st.dataframe(entries, use_container_width=True, hide_index=True)
+else:
+    st.caption("Nothing cached yet.")
+
+# ------------------ EXPORT ------------------ #
+st.markdown("---")
+col1, col2 = st.columns(2)
+with col1:
+    st.download_button(
+        label="📥 Download Diagnostics Log (JSON)",
+        data=export_json,
+        file_name="diagnostics.json",
+        mime="application/json",
+        use_container_width=True
+    )
+with col2:
+    if st.button("🧹 Reset Diagnostics", use_container_width=True):
+        reset()
+        st.rerun()
+
+st.markdown("⬅️ Use the left sidebar to return to the leaderboard.")
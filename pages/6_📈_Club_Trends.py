@@ -0,0 +1,48 @@
+import streamlit as st
+from utils.diagnostics import timed_stage
+from utils.history import load_history, club_trend, district_trend, rolling_mean
+
+# ------------------ HEADER ------------------ #
+st.markdown("<h2 style='text-align: center;'>📈 Club Trends</h2>", unsafe_allow_html=True)
+st.markdown("<p style='text-align: center;'>Membership, Pathways progress and tier points across every archived quarter.</p>", unsafe_allow_html=True)
+
+with timed_stage("page:history_load"):
+    df_history = load_history()
+
+if df_history.empty:
+    st.info("No archived club performance exports found. Set HISTORY_DIR to the folder holding the (YYYY-YYYY)/MM.csv exports.")
+    st.stop()
+
+# ------------------ CLUB PICKER ------------------ #
+latest_names = df_history.drop_duplicates('Club Number', keep='last').set_index('Club Number')['Club Name']
+club_number = st.selectbox(
+    "Club",
+    options=latest_names.sort_values().index.tolist(),
+    format_func=lambda number: f"{latest_names[number]} ({number})"
+)
+
+with timed_stage("page:club_trend"):
+    df_club = club_trend(df_history, club_number)
+    df_club['Active Members (4Q avg)'] = rolling_mean(df_club, 'Active Members', window=4)
+    df_club = df_club.set_index('Period Label')
+
+# ------------------ CLUB CHARTS ------------------ #
+st.markdown("### 👥 Membership")
+st.line_chart(df_club[['Mem. Base', 'Active Members', 'Active Members (4Q avg)']])
+
+st.markdown("### 🎓 Level Completions per Quarter")
+st.bar_chart(df_club[['Level 1s (Quarter)', 'Level 2s (Quarter)', 'Level 3s (Quarter)',
+                      'Level 4s, Path Completions, or DTM Awards (Quarter)']])
+
+st.markdown("### 🏅 Tier Points per Quarter")
+st.caption("Points derived from the club performance export only; form-based awards are not archived.")
+st.line_chart(df_club[['Pathways Pioneers (Export)', 'Leadership Innovators (Export)']])
+
+with st.expander("All periods"):
+    st.dataframe(df_club, use_container_width=True)
+
+# ------------------ DISTRICT ------------------ #
+st.markdown("### 🌍 District Totals")
+st.line_chart(district_trend(df_history, ['Active Members', 'New Members (Quarter)', 'Level 1s (Quarter)']))
+
+st.markdown("⬅️ Use the left sidebar to return to the leaderboard.")
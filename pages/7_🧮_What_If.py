@@ -0,0 +1,57 @@
+import time
+import streamlit as st
+from utils.groups import incentives_tiers
+
+# ------------------ HEADER ------------------ #
+st.markdown("<h2 style='text-align: center;'>🧮 What-If Simulator</h2>", unsafe_allow_html=True)
+st.markdown("<p style='text-align: center;'>See how many points and which rank a club would reach with a few more achievements.</p>", unsafe_allow_html=True)
+
+# The point vectors are built once per data version and shared by every session;
+# every widget change below only recomputes the selected club
+with st.spinner("Loading club points..."):
+    from utils.diagnostics import timed_stage
+    from utils.simulator import get_simulation_base, lever_points, simulate_club, simulator_levers
+    from utils.widgets import show_data_freshness, stop_if_data_unavailable
+
+    with stop_if_data_unavailable():
+        base = get_simulation_base()
+show_data_freshness()
+st.caption(f"📅 Starting from the data of {base['update_date']}")
+
+# ------------------ CLUB PICKER ------------------ #
+clubs = base['clubs'].sort_values('Club Name')
+club_number = st.selectbox(
+    "Club",
+    options=clubs['Club Number'].tolist(),
+    format_func=lambda number: f"{clubs.loc[clubs['Club Number'] == number, 'Club Name'].iloc[0]} ({number})"
+)
+row = base['row_of'][club_number]
+st.caption(f"Ranked within {base['clubs'].loc[row, 'Club Group']}.")
+
+# ------------------ LEVERS ------------------ #
+changes = {}
+for tier, column in zip(incentives_tiers, st.columns(len(incentives_tiers))):
+    with column:
+        st.markdown(f"##### {incentives_tiers[tier]['Name']}")
+        for lever in simulator_levers()[tier]:
+            current = int(base['points'][lever['column']][row])
+            key = f"what_if:{club_number}:{lever['column']}"
+            if lever['kind'] == "once":
+                earned = current >= lever['points']
+                value = st.checkbox(f"{lever['label']} (+{lever['points']})", value=earned, disabled=earned, key=key)
+            else:
+                value = st.number_input(f"{lever['label']} (+{lever['points']} each)", min_value=0, max_value=20, step=1, key=key)
+            changes[lever['column']] = lever_points(lever, current, value)
+
+# ------------------ RESULT ------------------ #
+started = time.perf_counter()
+with timed_stage("page:what_if"):
+    df_result = simulate_club(base, club_number, changes)
+elapsed_ms = (time.perf_counter() - started) * 1000
+
+st.markdown("### 📋 Result")
+st.dataframe(df_result, use_container_width=True, hide_index=True)
+st.caption(f"Recomputed in {elapsed_ms:.1f} ms. Group Rank is only given to clubs with points in the tier; "
+           "other clubs are taken as they are now.")
+
+st.markdown("⬅️ Use the left sidebar to return to the leaderboard.")
@@ -1,5 +1,6 @@
 #!/bin/bash
-streamlit run app.py \
+exec streamlit run app.py \
   --server.port=${PORT:-8080} \
   --server.address=0.0.0.0 \
-  --server.enableCORS=false
+  --server.enableCORS=false \
+  --server.fileWatcherType=none
@@ -0,0 +1,24 @@
+import os
+import sys
+import pytest
+
+# The app runs from the repository root; make its packages importable from here too
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.fixtures import QUARTER_EXPORTS, read_export, write_district
+from utils.helpers import reset_pipeline_state
+
+@pytest.fixture
+def local_district(tmp_path, monkeypatch):
+    """Points the pipeline at local source files of one district (2024-2025 Q2) and a fresh snapshot store."""
+    base_file, latest_file = QUARTER_EXPORTS["Q2"]
+    env = write_district(str(tmp_path / "sources"), read_export("2024-2025", base_file),
+                         read_export("2024-2025", latest_file), "2024-2025", "Q2")
+    env["SNAPSHOT_DIR"] = str(tmp_path / "snapshots")
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    reset_pipeline_state()
+    yield env
+    reset_pipeline_state()
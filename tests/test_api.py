@@ -0,0 +1,97 @@
+import http.client
+import json
+import os
+import threading
+from http.server import ThreadingHTTPServer
+import pandas as pd
+import pytest
+import api
+from utils.api import _winner_records, api_snapshot
+
+def _write_snapshot(path, quarter: str, mtime_ns: int = None) -> None:
+    resources = {"91": {"/v1/districts/91": {"district": "91", "update_date": "2025-01-15"}}}
+    with open(path, "w") as f:
+        json.dump(api_snapshot(resources, "2025-01-15T08:00:00", quarter), f)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Serves a small snapshot; yields (request function, snapshot path)."""
+    monkeypatch.setenv("API_RELOAD_SECONDS", "0")
+    path = tmp_path / "api.json"
+    _write_snapshot(path, "Q2")
+    api.load_snapshot(str(path))
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), api.ApiHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    def request(target, method="GET", headers=None):
+        connection = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1])
+        try:
+            connection.request(method, target, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, dict(response.getheaders()), response.read()
+        finally:
+            connection.close()
+
+    yield request, path
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_winner_records_serialize_dates():
+    df_winners = pd.DataFrame({
+        'Club Number': [1234, 5678],
+        'Award Date': pd.to_datetime(["2025-01-15", "2025-01-16"]),
+        'Unnamed: 2': [None, None],
+    })
+
+    records = _winner_records(df_winners)
+
+    assert records == [{'Club Number': 1234, 'Award Date': "2025-01-15T00:00:00"},
+                       {'Club Number': 5678, 'Award Date': "2025-01-16T00:00:00"}]
+    json.dumps(records)
+
+def test_etag_match_answers_304(server):
+    request, _ = server
+    status, headers, body = request("/v1/districts/91")
+    assert status == 200 and json.loads(body)['district'] == "91"
+
+    status, _, body = request("/v1/districts/91", headers={"If-None-Match": headers['ETag']})
+    assert (status, body) == (304, b"")
+    status, _, _ = request("/v1/districts/91", headers={"If-None-Match": "W/" + headers['ETag']})
+    assert status == 304
+    status, _, _ = request("/v1/districts/91", headers={"If-None-Match": '"another"'})
+    assert status == 200
+
+def test_unknown_path_answers_404(server):
+    request, _ = server
+    status, headers, body = request("/v1/districts/42/clubs")
+    assert status == 404
+    assert 'ETag' not in headers
+    assert json.loads(body) == {"error": "not found", "path": "/v1/districts/42/clubs"}
+
+def test_head_sends_headers_without_body(server):
+    request, _ = server
+    _, get_headers, get_body = request("/v1")
+    status, headers, body = request("/v1", method="HEAD")
+    assert (status, body) == (200, b"")
+    assert headers['ETag'] == get_headers['ETag']
+    assert headers['Content-Length'] == str(len(get_body))
+
+def test_replaced_snapshot_is_reloaded(server):
+    request, path = server
+    _, headers, body = request("/v1")
+    assert json.loads(body)['quarter'] == "Q2"
+    district_etag = request("/v1/districts/91")[1]['ETag']
+
+    # A later mtime than the served file, whatever the filesystem's timestamp resolution
+    _write_snapshot(path, "Q3", mtime_ns=os.stat(path).st_mtime_ns + 1_000_000_000)
+
+    status, _, body = request("/v1", headers={"If-None-Match": headers['ETag']})
+    assert status == 200
+    assert json.loads(body)['quarter'] == "Q3"
+    # Resources whose data did not change keep their ETag
+    status, _, _ = request("/v1/districts/91", headers={"If-None-Match": district_etag})
+    assert status == 304
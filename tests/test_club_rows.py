@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+import utils.helpers as helpers
+from utils.diagnostics import counters
+from utils.helpers import CLUB_BASE_COLUMNS, CLUB_OTHER_COLUMNS, derive_club_rows, incremental_club_rows
+from utils.schema import apply_schema
+
+@pytest.fixture
+def exports(local_district):
+    """(base, latest, last quarter) exports of the local district, as load_data_club_performance reads them."""
+    df_base, _ = helpers.load_frozen_club_performance_data(
+        secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_BASE_Q2", quarter="BASE_Q2")
+    df_latest, _ = helpers.load_club_performance_data(secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_Q2")
+    df_last_quarter, _ = helpers.load_frozen_club_performance_data(
+        secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_Q1", quarter="Q1")
+    return df_base, df_latest, df_last_quarter
+
+def _changed_clubs(df_base, df_latest, df_last_quarter) -> int:
+    """
+    Runs incremental_club_rows, checks it against a full derivation (with the schema the
+    pipeline applies to both) and returns how many clubs it re-derived.
+    """
+    before = counters().get("club_rows.changed", 0)
+    df = incremental_club_rows(df_base, df_latest, df_last_quarter, CLUB_BASE_COLUMNS, CLUB_OTHER_COLUMNS)
+    expected = derive_club_rows(df_base, df_latest, df_last_quarter, CLUB_BASE_COLUMNS, CLUB_OTHER_COLUMNS)
+    pd.testing.assert_frame_equal(apply_schema(df), apply_schema(expected))
+    return counters().get("club_rows.changed", 0) - before
+
+def _edit(df: pd.DataFrame, rows: list[int], column: str) -> pd.DataFrame:
+    df = df.copy()
+    df.loc[rows, column] = df.loc[rows, column] + 1
+    return df
+
+def test_only_changed_clubs_are_rederived(exports):
+    df_base, df_latest, df_last_quarter = exports
+    clubs = _changed_clubs(df_base, df_latest, df_last_quarter)
+    assert clubs >= len(df_base)
+
+    assert _changed_clubs(df_base, df_latest, df_last_quarter) == 0
+    assert _changed_clubs(df_base, _edit(df_latest, [0, 5, 9], 'Level 1s'), df_last_quarter) == 3
+
+def test_clubs_that_leave_or_join_the_latest_export(exports):
+    df_base, df_latest, df_last_quarter = exports
+    _changed_clubs(df_base, df_latest, df_last_quarter)
+
+    # A club of the base export drops out of the live export
+    assert _changed_clubs(df_base, df_latest.drop(index=[3]).reset_index(drop=True), df_last_quarter) == 1
+
+    # A club chartered this quarter appears in the live export only
+    new_club = df_latest.iloc[[3]].assign(**{'Club Number': 99999999, 'Club Name': "New Club"})
+    df_grown = pd.concat([df_latest, new_club], ignore_index=True)
+    assert _changed_clubs(df_base, df_grown, df_last_quarter) == 2
+
+    # ...and leaves again: its row is dropped without re-deriving anything
+    assert _changed_clubs(df_base, df_latest, df_last_quarter) == 0
+
+def test_changed_base_or_last_quarter_rederives_every_club(exports):
+    df_base, df_latest, df_last_quarter = exports
+    clubs = _changed_clubs(df_base, df_latest, df_last_quarter)
+
+    df_corrected_base = _edit(df_base, [2], 'Mem. Base')
+    assert _changed_clubs(df_corrected_base, df_latest, df_last_quarter) == clubs
+
+    df_corrected_last_quarter = _edit(df_last_quarter, [2], 'Level 2s')
+    assert _changed_clubs(df_corrected_base, df_latest, df_corrected_last_quarter) == clubs
@@ -0,0 +1,16 @@
+import pytest
+from utils.diagnostics import instrument, stage_summary
+
+def test_instrument_records_calls_that_raise():
+    @instrument("test.flaky_stage")
+    def flaky(fail: bool):
+        if fail:
+            raise ValueError("bad source")
+        return "ok"
+
+    assert flaky(False) == "ok"
+    with pytest.raises(ValueError):
+        flaky(True)
+
+    [row] = stage_summary().query("Stage == 'test.flaky_stage'").to_dict('records')
+    assert (row['Calls'], row['Errors']) == (2, 1)
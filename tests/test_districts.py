@@ -0,0 +1,70 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from benchmarks.fixtures import QUARTER_EXPORTS, read_export, scale_exports, write_district
+from utils.districts import _run_district, district_frame, load_manifest, run_districts
+from utils.helpers import get_merged_club_data, reset_pipeline_state
+
+SEASON = "2024-2025"
+QUARTER = "Q2"
+
+def _run_alone(monkeypatch, env: dict) -> pd.DataFrame:
+    """The merged frame of one district, computed in this process with nothing else cached."""
+    with monkeypatch.context() as m:
+        for key, value in env.items():
+            m.setenv(key, value)
+        reset_pipeline_state()
+        try:
+            df_merged, _ = get_merged_club_data()
+        finally:
+            reset_pipeline_state()
+    return df_merged
+
+def test_run_districts_two_entry_manifest(tmp_path, monkeypatch):
+    base_file, latest_file = QUARTER_EXPORTS[QUARTER]
+    df_base, df_latest = read_export(SEASON, base_file), read_export(SEASON, latest_file)
+    small_base, small_latest = scale_exports(df_base, df_latest, 40, np.random.default_rng(1))
+
+    # Both districts use the same file names in their own directories, so a worker that
+    # kept its source cache between districts would hand the second one the first one's clubs
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path / "snapshots"))  # load_manifest gives each district a store under it
+    manifest = {
+        "districts": [
+            {"district": "91", "env": write_district(str(tmp_path / "91"), df_base, df_latest, SEASON, QUARTER)},
+            {"district": "71", "env": write_district(str(tmp_path / "71"), small_base, small_latest, SEASON, QUARTER, seed=1)},
+        ],
+    }
+    path = tmp_path / "districts.json"
+    path.write_text(json.dumps(manifest))
+    districts = load_manifest(str(path))
+
+    # One worker runs both districts in turn
+    result = run_districts(districts, max_workers=1)
+
+    assert result['errors'] == {}
+    assert set(result['update_dates']) == {"91", "71"}
+    for entry in districts:
+        clubs = district_frame(result, entry["district"])
+        assert (clubs['District'] == entry["district"]).all()
+        expected = _run_alone(monkeypatch, entry["env"])
+        pd.testing.assert_frame_equal(clubs.drop(columns='District'), expected.reset_index(drop=True))
+
+def test_run_district_does_not_inherit_sources(tmp_path, monkeypatch):
+    base_file, latest_file = QUARTER_EXPORTS[QUARTER]
+    env = write_district(str(tmp_path / "91"), read_export(SEASON, base_file), read_export(SEASON, latest_file),
+                         SEASON, QUARTER)
+    env["SNAPSHOT_DIR"] = str(tmp_path / "snapshots")
+    expected = _run_alone(monkeypatch, env)
+
+    # The entry leaves the membership list to the local backend's default file name; the
+    # parent's own setting for it (and its program year) must not reach the district
+    entry_env = {key: value for key, value in env.items() if key != "GOOGLE_DRIVE_FILE_ID_MEMBERSHIP_LIST"}
+    monkeypatch.setenv("GOOGLE_DRIVE_FILE_ID_MEMBERSHIP_LIST", "another-district-membership.csv")
+    monkeypatch.setenv("PROGRAM_YEAR", "1999-2000")
+
+    district, df_merged, _, error = _run_district({"district": "91", "env": entry_env})
+
+    assert error is None
+    pd.testing.assert_frame_equal(df_merged.drop(columns='District'), expected.reset_index(drop=True))
+    assert os.environ["GOOGLE_DRIVE_FILE_ID_MEMBERSHIP_LIST"] == "another-district-membership.csv"
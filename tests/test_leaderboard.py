@@ -0,0 +1,25 @@
+import threading
+import utils.leaderboard as leaderboard
+
+def test_older_build_does_not_replace_a_newer_one(monkeypatch):
+    monkeypatch.setattr(leaderboard, "_materialized", None)
+    monkeypatch.setattr(leaderboard, "_materialized_sequence", 0)
+    versions = iter(["v1", "v2"])
+    monkeypatch.setattr(leaderboard, "pipeline_version", lambda: next(versions))
+
+    older_started, newer_built = threading.Event(), threading.Event()
+    def build(version):
+        if version == "v1":
+            older_started.set()
+            newer_built.wait(5)  # The build of the older sources finishes last
+        return {'version': version}
+    monkeypatch.setattr(leaderboard, "_build_leaderboards", build)
+
+    older = threading.Thread(target=leaderboard.materialize_leaderboards)
+    older.start()
+    older_started.wait(5)
+    assert leaderboard.materialize_leaderboards()['version'] == "v2"
+    newer_built.set()
+    older.join()
+
+    assert leaderboard._materialized['version'] == "v2"
@@ -0,0 +1,219 @@
+from datetime import datetime
+import pandas as pd
+import pytest
+from utils.metrics import (SCORING_RULES, calculate_points, compute_triple_crown_points, evaluate_scoring_rules,
+                           parse_dates, rank_leaderboards, triple_crown_members)
+
+# ------------------ Dates ------------------ #
+def test_parse_dates_detects_each_column_separately():
+    # Two sheets share the column name "Timestamp" but not its format
+    month_first = pd.Series(["10/02/2024 09:00:00", "12/01/2024 10:30:00"], name="Timestamp")
+    day_first = pd.Series(["02/10/2024 09:00:00", "25/11/2024 10:30:00"], name="Timestamp")
+
+    assert parse_dates(month_first).tolist() == [pd.Timestamp("2024-10-02 09:00"), pd.Timestamp("2024-12-01 10:30")]
+    assert parse_dates(day_first).tolist() == [pd.Timestamp("2024-10-02 09:00"), pd.Timestamp("2024-11-25 10:30")]
+    assert parse_dates(month_first).tolist() == [pd.Timestamp("2024-10-02 09:00"), pd.Timestamp("2024-12-01 10:30")]
+
+# ------------------ Form Scoring Rules ------------------ #
+# The per-form scorers the rules replaced: (name, tier, source, date column, points, aggregation)
+BASELINE_RULES = [
+    ("Humorous Contest", "Pathways Pioneers", "GOOGLE_DRIVE_FILE_ID_CONTESTS", "Date the Humorous Speech Contest was held", 10, "max"),
+    ("TableTopics Contest", "Pathways Pioneers", "GOOGLE_DRIVE_FILE_ID_CONTESTS", "Date the Table Topics Contest was held", 10, "max"),
+    ("Evaluation Contest", "Pathways Pioneers", "GOOGLE_DRIVE_FILE_ID_CONTESTS", "Date the Evaluation Contest was held", 10, "max"),
+    ("International Contest", "Pathways Pioneers", "GOOGLE_DRIVE_FILE_ID_CONTESTS", "Date the International Speech Contest was held", 10, "max"),
+    ("MOT", "Leadership Innovators", "GOOGLE_DRIVE_FILE_ID_MOMENTS_OF_TRUTH", "Date the MOT session was conducted", 15, "max"),
+    ("Pathways_Completion_Celebration", "Leadership Innovators", "GOOGLE_DRIVE_FILE_ID_PATHWAYS_COMPLETION_CELEBRATION", "Date of the celebration event", 10, "max"),
+    ("Mentorship_Programme", "Leadership Innovators", "GOOGLE_DRIVE_FILE_ID_MENTORSHIP_PROGRAM", "Timestamp", 10, "max"),
+    ("Distinguished_Club_Partners", "Leadership Innovators", "GOOGLE_DRIVE_FILE_ID_DCP", "Timestamp", 50, "max"),
+    ("Successful_Transition_Handover", "Leadership Innovators", "GOOGLE_DRIVE_FILE_ID_STH", "Date the transition meeting or handover session took place", 20, "max"),
+    ("Quality_Initiatives", "Excellence Champions", "GOOGLE_DRIVE_FILE_ID_QIS", "Timestamp", 15, "sum"),
+    ("Member_Onboarding", "Excellence Champions", "GOOGLE_DRIVE_FILE_ID_MEMBER_ONBOARDING", "Timestamp", 10, "max"),
+]
+
+@pytest.fixture
+def quarter_q2(monkeypatch):
+    monkeypatch.setenv("Current_Quarter", "Q2")
+    monkeypatch.setenv("QUARTER_START_DATE", "2024-10-01")
+    monkeypatch.setenv("QUARTER_END_DATE", "2024-12-31")
+
+def _responses(date_col: str) -> pd.DataFrame:
+    """Submissions in, on the edges of and outside the 2024-10-01 .. 2024-12-31 window."""
+    timestamp = date_col == "Timestamp"
+    def at(date, time="09:15:00"):
+        return f"{date} {time}" if timestamp else date
+    return pd.DataFrame([
+        ("Alpha Club ---- 1001", at("10/15/2024")),
+        ("Alpha Club ---- 1001", at("11/20/2024")),
+        ("Beta Club ---- 1002", at("10/01/2024", "00:00:00")),    # first day
+        ("Gamma Club ---- 1003", at("09/30/2024", "23:59:00")),   # before the quarter
+        ("Gamma Club ---- 1003", at("01/01/2025", "00:00:01")),   # after the quarter
+        ("Delta Club ---- 1004", None),
+        ("No club number", at("10/15/2024")),
+        ("Epsilon Club ---- 1005", at("12/31/2024", "15:00:00")),  # last day; the window ends at its midnight
+    ], columns=["Select Your Club", date_col])
+
+@pytest.mark.parametrize("name, tier, source, date_col, points, agg", BASELINE_RULES, ids=[r[0] for r in BASELINE_RULES])
+def test_scoring_rule_matches_baseline(quarter_q2, name, tier, source, date_col, points, agg):
+    [rule] = [rule for rule in SCORING_RULES if rule["name"] == name]
+    assert (rule["tier"], rule["source"], rule["date_col"], rule["points"], rule["agg"]) == (tier, source, date_col, points, agg)
+
+    scores = evaluate_scoring_rules({source: _responses(date_col)}, [rule])
+
+    expected = {1001: points * (2 if agg == "sum" else 1), 1002: points}
+    if date_col != "Timestamp":
+        expected[1005] = points  # A plain date on the last day is its midnight
+    assert dict(zip(scores["Club Number"], scores[name])) == expected
+
+def test_scoring_rules_are_the_baseline_rules():
+    assert [rule["name"] for rule in SCORING_RULES] == [rule[0] for rule in BASELINE_RULES]
+
+def test_scoring_rules_of_one_sheet_score_together(quarter_q2):
+    rules = [rule for rule in SCORING_RULES if rule["source"] == "GOOGLE_DRIVE_FILE_ID_CONTESTS"]
+    df = pd.DataFrame({
+        "Select Your Club": ["Alpha Club ---- 1001", "Beta Club ---- 1002"],
+        "Date the Humorous Speech Contest was held": ["10/15/2024", "09/15/2024"],
+        "Date the Table Topics Contest was held": ["10/15/2024", "11/15/2024"],
+        "Date the Evaluation Contest was held": [None, None],
+        "Date the International Speech Contest was held": ["02/15/2025", "12/01/2024"],
+    })
+    scores = evaluate_scoring_rules({"GOOGLE_DRIVE_FILE_ID_CONTESTS": df}, rules).set_index("Club Number")
+    assert scores.loc[1001].tolist() == [10, 10, 0, 0]
+    assert scores.loc[1002].tolist() == [0, 10, 0, 10]
+
+def test_calculate_points_matches_baseline(quarter_q2):
+    df = pd.DataFrame({
+        "Club Number": [1001, 1002],
+        "Level 1s": [2, 0], "Level 2s": [1, 0], "Add. Level 2s": [1, 0], "Level 3s": [1, 0],
+        "Off. Trained Round 1": [7, 6], "Off. Trained Round 2": [7, 7],
+    })
+    df_edu = pd.DataFrame({
+        "Club Number": [1001, 1001, 1001, 1002],
+        "Award": ["PM4", "DL5", "DTM", "FF"],
+    })
+    df_tc = pd.DataFrame({"Club Number": [1002], "TC Points": [120]})
+
+    points = calculate_points(df, df_edu, df_tc).set_index("Club Number")
+    columns = ["L1 Points", "L2 Points", "L3 Points", "COT R1 Points", "COT R2 Points",
+               "L4 Points", "L5 Points", "DTM Points", "TC Points", "Early10_Distinguished"]
+    assert points.loc[1001, columns].tolist() == [20, 40, 30, 20, 0, 40, 50, 60, 0, 0]
+    assert points.loc[1002, columns].tolist() == [0, 0, 0, 0, 0, 0, 0, 0, 120, 30]
+
+# ------------------ Triple Crown ------------------ #
+def _achievements(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["Club Number", "Member", "Award", "Date"])
+
+def _members(df: pd.DataFrame, **kwargs) -> set:
+    tc = triple_crown_members(df, **kwargs)
+    return set(zip(tc["Club Number"], tc["Member"]))
+
+@pytest.mark.parametrize("awards, earned", [
+    (["PM1", "PM2", "PM3"], True),
+    (["PM2", "PM3", "PM4"], True),
+    (["PM3", "PM4", "PM5"], True),
+    (["PM5", "PM3", "PM4"], True),            # Any order
+    ([" pm1", "Pm2 ", "PM3"], True),          # Codes are normalised
+    (["PM1", "PM1", "PM2", "PM2", "PM3"], True),
+    (["PM1", "PM2", "PM4"], False),
+    (["PM1", "PM2", "DL3"], False),           # Levels of different paths
+    (["PM1", "PM2"], False),
+    (["DTM", "FF", "PM1", "PM2"], False),
+], ids=lambda value: ",".join(value) if isinstance(value, list) else str(value))
+def test_triple_crown_needs_three_consecutive_levels_of_one_path(awards, earned):
+    df = _achievements([(1001, "Ann", award, "2024-10-15") for award in awards])
+    assert _members(df) == ({(1001, "Ann")} if earned else set())
+
+def test_triple_crown_is_per_member_and_club():
+    df = _achievements([
+        # Levels split between two members do not count
+        (1001, "Ann", "PM1", "2024-10-15"), (1001, "Ann", "PM2", "2024-10-15"), (1001, "Bob", "PM3", "2024-10-15"),
+        # Two members of one club
+        (1002, "Cat", "DL1", "2024-10-15"), (1002, "Cat", "DL2", "2024-10-15"), (1002, "Cat", "DL3", "2024-10-15"),
+        (1002, "Dan", "EC2", "2024-10-15"), (1002, "Dan", "EC3", "2024-10-15"), (1002, "Dan", "EC4", "2024-10-15"),
+        # One member with two runs counts once
+        (1003, "Eve", "PM1", "2024-10-15"), (1003, "Eve", "PM2", "2024-10-15"), (1003, "Eve", "PM3", "2024-10-15"),
+        (1003, "Eve", "DL1", "2024-10-15"), (1003, "Eve", "DL2", "2024-10-15"), (1003, "Eve", "DL3", "2024-10-15"),
+        (1004, None, "PM1", "2024-10-15"), (1004, None, "PM2", "2024-10-15"), (1004, None, "PM3", "2024-10-15"),
+    ])
+    assert _members(df) == {(1002, "Cat"), (1002, "Dan"), (1003, "Eve")}
+
+    points = compute_triple_crown_points(df)
+    assert dict(zip(points["Club Number"], points["TC Points"])) == {1002: 120, 1003: 60}
+
+def test_triple_crown_counts_only_runs_completed_from_start_date():
+    df = _achievements([
+        # Completed before the quarter
+        (1001, "Ann", "PM1", "2024-07-10"), (1001, "Ann", "PM2", "2024-08-10"), (1001, "Ann", "PM3", "2024-09-10"),
+        # Completed in the quarter on earlier levels
+        (1001, "Bob", "PM1", "2024-07-10"), (1001, "Bob", "PM2", "2024-08-10"), (1001, "Bob", "PM3", "2024-10-01"),
+        # Earlier run; another level in the quarter does not earn a second one
+        (1002, "Cat", "DL1", "2024-07-10"), (1002, "Cat", "DL2", "2024-08-10"), (1002, "Cat", "DL3", "2024-09-10"),
+        (1002, "Cat", "DL4", "2024-11-10"),
+    ])
+    start = datetime(2024, 10, 1)
+    assert _members(df, start_date=start) == {(1001, "Bob")}
+    assert _members(df) == {(1001, "Ann"), (1001, "Bob"), (1002, "Cat")}
+
+def test_triple_crown_of_empty_log():
+    tc = triple_crown_members(_achievements([]))
+    assert tc.empty and list(tc.columns) == ["Club Number", "Member"]
+
+# ------------------ Ranking ------------------ #
+def _clubs(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=["Club Name", "Club Group", "Tier A", "Tier B", "Total Club Points"])
+
+def _ranked(df: pd.DataFrame, tier: str, group: str, top_n: int = 3) -> list[tuple]:
+    ranking = rank_leaderboards(df, ["Tier A", "Tier B"], top_n=top_n)
+    run = ranking[(ranking["Tier"] == tier) & (ranking["Club Group"] == group)]
+    ranks = [None if pd.isna(rank) else int(rank) for rank in run["Group Rank"]]
+    return list(zip(df["Club Name"].to_numpy()[run["Row"].to_numpy()], ranks, run["Top N"].tolist()))
+
+def test_rank_orders_by_tier_then_total_then_name():
+    df = _clubs([
+        ("Delta", "Spark", 40, 0, 200),
+        ("Beta", "Spark", 50, 0, 100),
+        ("Alpha", "Spark", 50, 0, 100),
+        ("Gamma", "Spark", 50, 0, 120),
+        ("Echo", "Spark", 0, 0, 300),
+    ])
+    assert _ranked(df, "Tier A", "Spark") == [
+        ("Gamma", 1, True), ("Alpha", 2, True), ("Beta", 3, True), ("Delta", 4, False), ("Echo", None, False),
+    ]
+
+def test_rank_top_n_includes_clubs_tied_with_the_cutoff():
+    df = _clubs([
+        ("Alpha", "Spark", 60, 0, 100),
+        ("Bravo", "Spark", 50, 0, 90),
+        ("Charlie", "Spark", 40, 0, 80),
+        ("Delta", "Spark", 40, 0, 80),     # Tied with the third place on both keys
+        ("Echo", "Spark", 40, 0, 79),      # Same tier points, fewer Total Club Points
+        ("Foxtrot", "Spark", 10, 0, 500),
+    ])
+    assert _ranked(df, "Tier A", "Spark") == [
+        ("Alpha", 1, True), ("Bravo", 2, True), ("Charlie", 3, True), ("Delta", 4, True),
+        ("Echo", 5, False), ("Foxtrot", 6, False),
+    ]
+    assert [top for *_, top in _ranked(df, "Tier A", "Spark", top_n=1)] == [True, False, False, False, False, False]
+    assert [top for *_, top in _ranked(df, "Tier A", "Spark", top_n=4)] == [True, True, True, True, False, False]
+
+def test_rank_with_fewer_clubs_than_top_n():
+    df = _clubs([
+        ("Alpha", "Spark", 10, 0, 10),
+        ("Bravo", "Spark", 0, 0, 0),
+    ])
+    assert _ranked(df, "Tier A", "Spark") == [("Alpha", 1, True), ("Bravo", None, False)]
+
+def test_rank_runs_each_group_and_tier_separately():
+    df = _clubs([
+        ("Alpha", "Spark", 10, 30, 40),
+        ("Bravo", "Rising", 20, 10, 30),
+        ("Charlie", "Spark", 20, 0, 20),
+        ("Delta", None, 90, 90, 180),      # No group: on no leaderboard
+    ])
+    assert _ranked(df, "Tier A", "Spark") == [("Charlie", 1, True), ("Alpha", 2, True)]
+    assert _ranked(df, "Tier B", "Spark") == [("Alpha", 1, True), ("Charlie", None, False)]
+    assert _ranked(df, "Tier A", "Rising") == [("Bravo", 1, True)]
+    assert "Delta" not in df["Club Name"].to_numpy()[rank_leaderboards(df, ["Tier A", "Tier B"])["Row"].to_numpy()]
+
+def test_rank_of_empty_frame():
+    ranking = rank_leaderboards(_clubs([]), ["Tier A"])
+    assert ranking.empty and list(ranking.columns) == ["Tier", "Club Group", "Row", "Group Rank", "Top N"]
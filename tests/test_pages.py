@@ -0,0 +1,26 @@
+import glob
+import os
+from streamlit.testing.v1 import AppTest
+from conftest import ROOT
+
+def _page(prefix: str) -> str:
+    return glob.glob(os.path.join(ROOT, "pages", prefix + "_*.py"))[0]
+
+def test_missing_club_performance_export_stops_with_error(local_district):
+    os.remove(os.path.join(local_district["LOCAL_SOURCE_DIR"], local_district["GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_Q2"]))
+
+    for page in ("1", "2", "7"):
+        at = AppTest.from_file(_page(page), default_timeout=60).run()
+        assert not at.exception
+        assert any("GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_Q2" in error.value for error in at.error)
+        assert len(at.dataframe) == 0
+
+def test_source_without_fallback_is_not_reported_as_last_good_copy(local_district):
+    os.remove(os.path.join(local_district["LOCAL_SOURCE_DIR"], local_district["GOOGLE_DRIVE_FILE_ID_QIS"]))
+
+    at = AppTest.from_file(_page("4"), default_timeout=60).run()
+    assert not at.exception
+    warnings = [warning.value for warning in at.warning]
+    assert any("no earlier copy" in warning for warning in warnings)
+    assert not any("last good copy" in warning for warning in warnings)
+    assert len(at.dataframe) == 1
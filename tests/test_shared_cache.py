@@ -0,0 +1,86 @@
+import threading
+import time
+import pytest
+from utils.diagnostics import counters
+from utils.shared_cache import _in_flight, clear_shared_cache, shared_cache_info, shared_result, single_flight
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_shared_cache()
+    yield
+    clear_shared_cache()
+
+def _joined() -> int:
+    return counters().get("single_flight.joined", 0)
+
+def _run_joined(key, compute, callers: int):
+    """Runs compute for key on a leader thread and `callers` more threads that join it while it runs."""
+    started, release = threading.Event(), threading.Event()
+    def leader_compute():
+        started.set()
+        release.wait(5)
+        return compute()
+
+    outcomes = []
+    def call(fn):
+        try:
+            outcomes.append(single_flight(key, fn))
+        except Exception as e:
+            outcomes.append(e)
+
+    threads = [threading.Thread(target=call, args=(leader_compute,))]
+    threads[0].start()
+    started.wait(5)
+    joined_before = _joined()
+    threads += [threading.Thread(target=call, args=(compute,)) for _ in range(callers)]
+    for thread in threads[1:]:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while _joined() < joined_before + callers and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+def test_concurrent_callers_share_one_computation():
+    calls = []
+    def compute():
+        calls.append(1)
+        return ["result"]
+
+    outcomes = _run_joined("key", compute, callers=4)
+
+    assert len(calls) == 1
+    assert len(outcomes) == 5 and all(outcome is outcomes[0] for outcome in outcomes)
+
+def test_exception_reaches_every_waiter_and_releases_the_key():
+    def compute():
+        raise ValueError("source unavailable")
+
+    outcomes = _run_joined("key", compute, callers=3)
+
+    assert len(outcomes) == 4 and all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert "key" not in _in_flight
+    assert single_flight("key", lambda: "recovered") == "recovered"
+
+def test_new_version_evicts_older_ones():
+    shared_result("merged", "v1", lambda: "old")
+    shared_result("tier", "v1", lambda: "other name")
+    assert shared_result("merged", "v1", lambda: "recomputed") == "old"
+
+    assert shared_result("merged", "v2", lambda: "new") == "new"
+
+    assert {(row['Name'], row['Version']) for row in shared_cache_info()} == {("merged", "v2"), ("tier", "v1")}
+
+def test_size_bound_drops_least_recently_used(monkeypatch):
+    monkeypatch.setenv("SHARED_CACHE_MAX_MB", "1")
+    chunk = 400 * 1024
+    shared_result("a", "v1", lambda: b"a" * chunk)
+    shared_result("b", "v1", lambda: b"b" * chunk)
+    shared_result("a", "v1", lambda: b"recomputed")  # "a" is used again, so "b" is the least recent
+
+    shared_result("c", "v1", lambda: b"c" * chunk)
+
+    assert [row['Name'] for row in shared_cache_info()] == ["a", "c"]
+    assert sum(row['Bytes'] for row in shared_cache_info()) <= 2**20
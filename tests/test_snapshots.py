@@ -0,0 +1,43 @@
+import os
+import pandas as pd
+import pyarrow.parquet as pq
+from benchmarks.fixtures import read_export
+from utils.history import archived_exports, build_history
+from utils.snapshots import find_snapshot, load_snapshot, save_snapshot
+
+def test_snapshot_is_keyed_by_file_id(tmp_path, monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path))
+    df = pd.DataFrame({"Club Number": [1, 2], "Club Name": ["A", "B"]})
+    save_snapshot(df, "2024-2025", "BASE_Q2", "file-a", "09/30/2024")
+
+    loaded, update_date = load_snapshot("2024-2025", "BASE_Q2", "file-a")
+    pd.testing.assert_frame_equal(loaded, df)
+    assert update_date == "09/30/2024"
+
+    # The quarter now points at another export: its snapshot is not served for it
+    assert find_snapshot("2024-2025", "BASE_Q2", "file-b") is None
+    assert load_snapshot("2024-2025", "BASE_Q2", "file-b") is None
+
+def test_snapshot_with_other_file_id_in_metadata_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path))
+    path = save_snapshot(pd.DataFrame({"Club Number": [1]}), "2024-2025", "Q1", "file-a", "09/30/2024")
+    table = pq.read_table(path)
+    pq.write_table(table.replace_schema_metadata({**table.schema.metadata, b"file_id": b"file-b"}), path)
+
+    assert os.path.exists(path)
+    assert load_snapshot("2024-2025", "Q1", "file-a") is None
+
+def test_history_reads_the_snapshot_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    monkeypatch.setenv("HISTORY_DIR", str(tmp_path / "no-archive"))
+    export = read_export("2024-2025", "09.csv")
+    export = export[export["Club Name"].notna()].astype({"Club Number": int})
+    older = save_snapshot(export, "2024-2025", "Q1", "old-file", "09/30/2024")
+    newer = save_snapshot(export, "2024-2025", "Q1", "corrected-file", "09/30/2024")
+    os.utime(older, ns=(os.stat(newer).st_mtime_ns - 10**9,) * 2)
+    save_snapshot(export, "2024-2025", "BASE_Q2", "file-a", "09/30/2024")  # Quarter bases are not history
+
+    assert archived_exports() == [("2024-2025", "Q1", newer)]
+    history = build_history()
+    assert set(history["Period Label"]) == {"2024-2025 Q1"}
+    assert set(history["Club Number"]) == set(export["Club Number"])
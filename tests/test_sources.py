@@ -0,0 +1,187 @@
+import os
+import threading
+import time
+import pandas as pd
+import pytest
+import utils.helpers as helpers
+from utils.diagnostics import counters
+from utils.helpers import ClubPerformanceUnavailable, get_merged_club_data, source_health
+
+def _failing_source(local_district, secret_key):
+    os.remove(os.path.join(local_district["LOCAL_SOURCE_DIR"], local_district[secret_key]))
+
+def _count_fetches(monkeypatch, file_id):
+    calls = []
+    load_source = helpers._load_source
+    def counted(kind, fetched_id, read_kwargs, **kwargs):
+        if fetched_id == file_id:
+            calls.append(kind)
+        return load_source(kind, fetched_id, read_kwargs, **kwargs)
+    monkeypatch.setattr(helpers, "_load_source", counted)
+    return calls
+
+def test_failed_source_is_fetched_once_per_run(local_district, monkeypatch):
+    secret_key = "GOOGLE_DRIVE_FILE_ID_QIS"
+    _failing_source(local_district, secret_key)
+    calls = _count_fetches(monkeypatch, local_district[secret_key])
+
+    get_merged_club_data()
+    assert len(calls) == 1
+    [health] = [row for row in source_health() if row['Source'] == secret_key]
+    assert health['Stale'] and health['Circuit'] == 'closed'
+
+    # The next run tries it again
+    helpers.clear_shared_cache()
+    get_merged_club_data()
+    assert len(calls) == 2
+
+def test_another_run_does_not_reset_the_fetch_round(local_district, monkeypatch):
+    secret_key = "GOOGLE_DRIVE_FILE_ID_QIS"
+    _failing_source(local_district, secret_key)
+    calls = _count_fetches(monkeypatch, local_district[secret_key])
+
+    version = helpers.pipeline_version()
+    assert len(calls) == 1
+
+    # Another session starts its own run while this one is still loading
+    other_run = threading.Thread(target=helpers.begin_fetch_round)
+    other_run.start()
+    other_run.join()
+
+    get_merged_club_data(version)
+    assert len(calls) == 1
+
+def test_retries_wait_only_for_the_time_left(monkeypatch):
+    monkeypatch.setenv("SOURCE_FETCH_RETRIES", "5")
+    monkeypatch.setenv("SOURCE_RETRY_BACKOFF_SECONDS", "0.01")
+    monkeypatch.setenv("SOURCE_FETCH_DEADLINE_SECONDS", "0.3")
+    timeouts = []
+    def slow_failure(kind, file_id, read_kwargs, previous=None, timeout=None):
+        timeouts.append(timeout)
+        time.sleep(min(timeout, 0.1))  # A request that runs into its timeout
+        raise TimeoutError("read timed out")
+    monkeypatch.setattr(helpers, "_load_source", slow_failure)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        helpers._load_with_retries("drive_csv", "file-id", {})
+
+    assert time.monotonic() - start < 0.45
+    assert 1 < len(timeouts) <= 6
+    assert timeouts[0] <= 0.3
+    assert all(later < earlier for earlier, later in zip(timeouts, timeouts[1:]))
+
+def test_failed_club_performance_export_is_fetched_once_per_run(local_district, monkeypatch):
+    secret_key = "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_Q2"
+    _failing_source(local_district, secret_key)
+    calls = _count_fetches(monkeypatch, local_district[secret_key])
+
+    with pytest.raises(ClubPerformanceUnavailable):
+        get_merged_club_data()
+    assert len(calls) == 1
+
+def test_unstorable_last_good_copy_is_logged(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path))
+    df = pd.DataFrame({'Mixed': [1, "one"]})  # Parquet cannot store a column of ints and strings
+    failures = counters().get("source_fetch.last_good_save_failed", 0)
+
+    helpers._save_last_good(("drive_csv", "file-id", (), "drive"), df, "digest")
+
+    assert counters().get("source_fetch.last_good_save_failed", 0) == failures + 1
+    assert "Could not persist the last good copy of file-id" in caplog.text
+    assert not os.listdir(tmp_path / "last_good")
+
+class _Response:
+    def __init__(self, status_code: int, content: bytes = b"", etag: str = None):
+        self.status_code, self.content = status_code, content
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+def test_unchanged_drive_file_is_not_parsed_again(tmp_path, monkeypatch):
+    import requests
+
+    monkeypatch.setenv("SOURCE_BACKEND", "drive")
+    monkeypatch.setenv("SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setenv("SOURCE_CACHE_TTL_SECONDS", "0")  # Every read revalidates
+    monkeypatch.setenv("GOOGLE_DRIVE_FILE_ID_TEST", "file-1")
+    helpers.reset_pipeline_state()
+
+    body = b"Club Number,Points\n1234,5\n5678,10\n"
+    responses = [_Response(200, body, '"v1"'), _Response(304, etag='"v1"'), _Response(200, body, '"v2"')]
+    requests_made = []
+    def get(url, headers=None, timeout=None):
+        requests_made.append(headers)
+        return responses[len(requests_made) - 1]
+    monkeypatch.setattr(requests, "get", get)
+
+    parses = []
+    parse_source = helpers._parse_source
+    def counted_parse(kind, content, read_kwargs):
+        parses.append(kind)
+        return parse_source(kind, content, read_kwargs)
+    monkeypatch.setattr(helpers, "_parse_source", counted_parse)
+
+    try:
+        df = helpers._get_source("GOOGLE_DRIVE_FILE_ID_TEST", "sheet_csv", {})
+        assert df['Points'].tolist() == [5, 10]
+
+        # Not modified: the request is conditional and the cached frame is served
+        assert helpers._get_source("GOOGLE_DRIVE_FILE_ID_TEST", "sheet_csv", {}) is df
+        assert requests_made[1] == {"If-None-Match": '"v1"'}
+
+        # Downloaded again, but the bytes are the same: not parsed again
+        assert helpers._get_source("GOOGLE_DRIVE_FILE_ID_TEST", "sheet_csv", {}) is df
+        assert len(requests_made) == 3
+        assert parses == ["sheet_csv"]
+    finally:
+        helpers.reset_pipeline_state()
+
+def _membership_list(title: bool, club_column: str) -> bytes:
+    """Thirty members of three clubs; one member of club 5678 is not enrolled, near the end of the file."""
+    rows = [f"Name,{club_column},Is Pathways Enrolled,Joined"]
+    for i in range(30):
+        club = [1234, 5678, 91011][i % 3]
+        enrolled = "No" if i == 28 else (" yes " if i % 5 == 0 else "Yes")
+        name = f'"Member, {i}\nsecond line"' if i % 7 == 0 else f"Member {i}"  # Quoted newlines as well
+        rows.append(f"{name},{club},{enrolled},2025-01-01")
+    if title:
+        rows.insert(0, "District 91 membership list,,,")
+    return ("\n".join(rows) + "\n").encode()
+
+# Smaller than the title and header lines, and than a few rows; pyarrow needs a quoted row to fit one block
+@pytest.mark.parametrize("chunk_bytes", [48, 64, 100])
+@pytest.mark.parametrize("title, club_column", [(True, "Club Number"), (False, "Club ID")])
+def test_membership_list_is_folded_across_chunks(monkeypatch, chunk_bytes, title, club_column):
+    from io import BytesIO
+    from utils.metrics import pathway_enrollment_scores
+
+    monkeypatch.setenv("SOURCE_CHUNK_BYTES", str(chunk_bytes))
+    content = _membership_list(title, club_column)
+    chunks = counters().get("source_parse.chunks", 0)
+
+    df = helpers._parse_source("sheet_csv", BytesIO(content), helpers.MEMBERSHIP_LIST_READ_KWARGS)
+
+    assert counters().get("source_parse.chunks", 0) - chunks > 1
+    expected = pathway_enrollment_scores(pd.read_csv(BytesIO(content), dtype=str))
+    pd.testing.assert_frame_equal(df, expected)
+    assert dict(zip(df['Club Number'], df['100%_Pathway_Registration'])) == {1234: 10, 5678: 0, 91011: 10}
+
+def test_parse_error_is_not_taken_for_an_unconfigured_source(monkeypatch, caplog):
+    monkeypatch.setenv("SOURCE_BACKEND", "drive")
+    monkeypatch.delenv("GOOGLE_DRIVE_FILE_ID_TEST", raising=False)
+    def missing_column(secret_key, kind, **read_kwargs):
+        raise KeyError("Is Pathways Enrolled")
+    monkeypatch.setattr(helpers, "fetch_source", missing_column)
+
+    # Not configured for this district: nothing to report
+    df = helpers.load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_TEST", ["Club Number", "Points"])
+    assert list(df.columns) == ["Club Number", "Points"] and df.empty
+    assert "GOOGLE_DRIVE_FILE_ID_TEST" not in caplog.text
+
+    # Configured, but the file cannot be parsed: reported
+    monkeypatch.setenv("GOOGLE_DRIVE_FILE_ID_TEST", "file-1")
+    assert helpers.load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_TEST", ["Club Number", "Points"]).empty
+    assert "Could not load GOOGLE_DRIVE_FILE_ID_TEST" in caplog.text
@@ -0,0 +1,149 @@
+import re
+import pandas as pd
+from utils.groups import group_meta, incentives_tiers
+from utils.helpers import TIER_POINT_COLUMNS
+from utils.leaderboard import rank_all_leaderboards
+
+# ------------------ API Snapshot ------------------ #
+# The JSON API (api.py) serves a snapshot written by cli.py: every response body is
+# precomputed here, keyed by its path, so the server never runs the pipeline. Resources:
+#   /v1                                              districts in the snapshot
+#   /v1/districts/<district>                         update date, groups, tiers and links
+#   /v1/districts/<district>/leaderboards            every (group, tier) leaderboard
+#   /v1/districts/<district>/leaderboards/<group>/<tier>
+#   /v1/districts/<district>/clubs                   tier points and breakdown of every club
+#   /v1/districts/<district>/clubs/<club number>
+#   /v1/districts/<district>/winners/<quarter>       published incentive winners of a quarter
+
+WINNER_QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+
+def slug(name: str) -> str:
+    """URL segment of a group or tier name, e.g. 'Spark Clubs' -> 'spark-clubs'."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+def winners_secret_key(district: str, quarter: str) -> str:
+    """Env var holding the file ID of a quarter's winners workbook, as used by the leaderboard page."""
+    return f"D{district}_{quarter}_INCENTIVE_WINNERS"
+
+def _leaderboard_entries(df_ranked: pd.DataFrame, tier_name: str) -> list[dict]:
+    return [
+        {
+            'group_rank': None if pd.isna(rank) else int(rank),
+            'top_3': bool(top),
+            'club_number': int(number),
+            'club_name': name,
+            'tier_points': int(points),
+            'total_club_points': int(total),
+        }
+        for rank, top, number, name, points, total in zip(
+            df_ranked['Group Rank'], df_ranked['Top 3'], df_ranked['Club Number'],
+            df_ranked['Club Name'], df_ranked[tier_name], df_ranked['Total Club Points'])
+    ]
+
+def _club_records(df_merged: pd.DataFrame, leaderboards: dict) -> dict[int, dict]:
+    standings = {}  # (club number, tier) -> (group rank, top 3)
+    for (_, tier_name), df_ranked in leaderboards.items():
+        for number, rank, top in zip(df_ranked['Club Number'], df_ranked['Group Rank'], df_ranked['Top 3']):
+            standings[(int(number), tier_name)] = (None if pd.isna(rank) else int(rank), bool(top))
+
+    clubs = {}
+    for record in df_merged.to_dict('records'):
+        number = int(record['Club Number'])
+        tiers = {}
+        for tier_name, columns in TIER_POINT_COLUMNS.items():
+            rank, top = standings.get((number, tier_name), (None, False))
+            tiers[slug(tier_name)] = {
+                'name': tier_name,
+                'points': int(record[tier_name]),
+                'group_rank': rank,
+                'top_3': top,
+                'breakdown': {column: int(record[column]) for column in columns if column in record},
+            }
+        clubs[number] = {
+            'club_number': number,
+            'club_name': record['Club Name'],
+            'club_group': record['Club Group'],
+            'active_members': int(record['Active Members']),
+            'total_club_points': int(record['Total Club Points']),
+            'tiers': tiers,
+        }
+    return clubs
+
+def _json_value(value):
+    """A workbook cell as a JSON value: dates and times as ISO strings, numpy scalars as Python ones."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value.item() if hasattr(value, "item") else value
+
+def _winner_records(df_winners: pd.DataFrame) -> list[dict]:
+    """Rows of a winners workbook as JSON objects; empty columns are dropped."""
+    df_winners = df_winners.dropna(axis=1, how='all').dropna(axis=0, how='all')
+    df_winners = df_winners.loc[:, [not str(column).startswith("Unnamed") for column in df_winners.columns]]
+    return [
+        {str(key): _json_value(value) for key, value in row.items() if not pd.isna(value)}
+        for row in df_winners.to_dict('records')
+    ]
+
+def district_resources(district: str, df_merged: pd.DataFrame, update_date: str, winners: dict = None) -> dict:
+    """
+    Every API resource of one district.
+
+    Args:
+        district (str): District number.
+        df_merged (pd.DataFrame): Merged club frame of the district.
+        update_date (str): Club performance update date.
+        winners (dict): Quarter -> winners frame, for the quarters that have been published.
+
+    Returns:
+        dict: Path -> JSON-serialisable body.
+    """
+    prefix = f"/v1/districts/{district}"
+    leaderboards = rank_all_leaderboards(df_merged)
+    resources = {}
+
+    all_boards = []
+    for (group_name, tier_name), df_ranked in leaderboards.items():
+        board = {'group': group_name, 'tier': tier_name, 'update_date': update_date,
+                 'clubs': _leaderboard_entries(df_ranked, tier_name)}
+        resources[f"{prefix}/leaderboards/{slug(group_name)}/{slug(tier_name)}"] = board
+        all_boards.append(board)
+    resources[f"{prefix}/leaderboards"] = {'district': district, 'update_date': update_date, 'leaderboards': all_boards}
+
+    clubs = _club_records(df_merged, leaderboards)
+    for number, club in clubs.items():
+        resources[f"{prefix}/clubs/{number}"] = {'district': district, 'update_date': update_date, **club}
+    resources[f"{prefix}/clubs"] = {'district': district, 'update_date': update_date, 'clubs': list(clubs.values())}
+
+    for quarter, df_winners in (winners or {}).items():
+        resources[f"{prefix}/winners/{quarter}"] = {'district': district, 'quarter': quarter,
+                                                    'winners': _winner_records(df_winners)}
+
+    resources[prefix] = {
+        'district': district,
+        'update_date': update_date,
+        'clubs': len(df_merged),
+        'groups': [{'slug': slug(info['Name']), 'name': info['Name'], 'description': info['Description']}
+                   for info in group_meta.values()],
+        'tiers': [{'slug': slug(info['Name']), 'name': info['Name'], 'description': info['Description']}
+                  for info in incentives_tiers.values()],
+        'winners': sorted(winners or {}),
+        'links': [path for path in resources if "/clubs/" not in path],
+    }
+    return resources
+
+def api_snapshot(district_resources_by_id: dict, generated_at: str, quarter: str = None) -> dict:
+    """
+    The snapshot written for api.py: the resources of every district plus the /v1 index.
+
+    Returns:
+        dict: {'generated_at', 'quarter', 'resources': {path: body}}.
+    """
+    resources = {}
+    for district_id in sorted(district_resources_by_id):
+        resources.update(district_resources_by_id[district_id])
+    resources["/v1"] = {
+        'generated_at': generated_at,
+        'quarter': quarter,
+        'districts': [f"/v1/districts/{district_id}" for district_id in sorted(district_resources_by_id)],
+    }
+    return {'generated_at': generated_at, 'quarter': quarter, 'resources': resources}
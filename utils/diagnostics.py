@@ -0,0 +1,134 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+import pandas as pd
+
+# ------------------ Stage Instrumentation ------------------ #
+# Every instrumented stage appends one event (duration, rows in/out, bytes fetched, whether
+# it raised) to a
+# rolling window per stage; cache hits and misses are plain counters. Both live in the
+# process, so every session of the app reports into the same numbers.
+
+_events = {}
+_counters = {}
+_diagnostics_lock = threading.Lock()
+
+def _window() -> int:
+    return int(os.environ.get("DIAGNOSTICS_WINDOW", 500))
+
+def _row_count(value):
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, tuple) and value and isinstance(value[0], pd.DataFrame):
+        return len(value[0])
+    return None
+
+def record_stage(stage: str, seconds: float, rows_in=None, rows_out=None, bytes_fetched=None, error: bool = False) -> None:
+    """Appends one timing event for a stage; `error` marks a call that raised."""
+    event = {
+        "stage": stage,
+        "at": time.time(),
+        "seconds": seconds,
+        "rows_in": rows_in,
+        "rows_out": rows_out,
+        "bytes": bytes_fetched,
+        "error": error,
+    }
+    with _diagnostics_lock:
+        events = _events.get(stage)
+        if events is None:
+            events = _events[stage] = deque(maxlen=_window())
+        events.append(event)
+
+def count(name: str, n: int = 1) -> None:
+    """Increments a counter, e.g. 'source_cache.hit'."""
+    with _diagnostics_lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+@contextmanager
+def timed_stage(stage: str, rows_in=None):
+    """
+    Times the enclosed block as one event of `stage`.
+    The yielded dict may be filled with 'rows_out' and 'bytes' before the block ends.
+    A block that raises is recorded as an error.
+    """
+    info = {"rows_in": rows_in, "rows_out": None, "bytes": None}
+    start = time.perf_counter()
+    error = True
+    try:
+        yield info
+        error = False
+    finally:
+        record_stage(stage, time.perf_counter() - start, info["rows_in"], info["rows_out"], info["bytes"], error)
+
+def instrument(stage: str):
+    """
+    Decorator recording the duration of every call. Rows in are taken from the first
+    DataFrame argument, rows out from a returned DataFrame (or the first item of a returned tuple).
+    A call that raises is recorded too, as an error.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            rows_in = next((len(a) for a in (*args, *kwargs.values()) if isinstance(a, pd.DataFrame)), None)
+            start = time.perf_counter()
+            result, error = None, True
+            try:
+                result = fn(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                record_stage(stage, time.perf_counter() - start, rows_in, _row_count(result), error=error)
+        return wrapper
+    return decorator
+
+def stage_summary() -> pd.DataFrame:
+    """
+    Aggregates the rolling window of every stage.
+
+    Returns:
+        pd.DataFrame: One row per stage with call count, calls that raised, p50/p90/p99 and
+        max duration in ms, mean rows in/out and total bytes fetched.
+    """
+    with _diagnostics_lock:
+        events = [e for stage_events in _events.values() for e in stage_events]
+
+    columns = ['Stage', 'Calls', 'Errors', 'p50 ms', 'p90 ms', 'p99 ms', 'Max ms', 'Rows In', 'Rows Out', 'Bytes']
+    if not events:
+        return pd.DataFrame(columns=columns)
+
+    df = pd.DataFrame(events)
+    df["ms"] = df["seconds"] * 1000
+    grouped = df.groupby("stage")
+    summary = pd.DataFrame({
+        'Calls': grouped.size(),
+        'Errors': grouped["error"].sum(),
+        'p50 ms': grouped["ms"].quantile(0.5),
+        'p90 ms': grouped["ms"].quantile(0.9),
+        'p99 ms': grouped["ms"].quantile(0.99),
+        'Max ms': grouped["ms"].max(),
+        'Rows In': grouped["rows_in"].mean(),
+        'Rows Out': grouped["rows_out"].mean(),
+        'Bytes': grouped["bytes"].sum(min_count=1),
+    }).rename_axis('Stage').reset_index()
+    return summary.sort_values('p50 ms', ascending=False).reset_index(drop=True)[columns]
+
+def counters() -> dict:
+    with _diagnostics_lock:
+        return dict(_counters)
+
+def export_json() -> str:
+    """Returns the raw events in the rolling windows and the counters as a JSON document."""
+    with _diagnostics_lock:
+        events = [e for stage_events in _events.values() for e in stage_events]
+        counts = dict(_counters)
+    return json.dumps({"exported_at": time.time(), "counters": counts, "events": events}, indent=2, default=str)
+
+def reset() -> None:
+    with _diagnostics_lock:
+        _events.clear()
+        _counters.clear()
@@ -0,0 +1,106 @@
+import os
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from utils.helpers import get_merged_club_data, reset_pipeline_state
+
+# ------------------ Multi-District Runs ------------------ #
+# The pipeline reads its sources and quarter config from environment variables, so each
+# district of a manifest runs in its own worker process with that district's variables set.
+# A worker may run several districts in turn, so it restores its environment and resets
+# the pipeline's process caches after each one; nothing leaks from one district to the next.
+# Nor does anything leak from the parent: a district sees only the sources and quarter
+# settings of its own manifest entry.
+
+DISTRICT_ENV_PREFIXES = ("GOOGLE_DRIVE_FILE_ID_", "QUARTER_")
+DISTRICT_ENV_KEYS = ("Current_Quarter", "PROGRAM_YEAR", "DISTRICT")
+
+def load_manifest(path: str = None) -> list[dict]:
+    """
+    Reads a districts manifest (DISTRICTS_MANIFEST, default "districts.json").
+
+    The manifest holds optional "defaults" shared by every district and a list of
+    "districts", each with a "district" number and its own "env" overrides:
+
+        {
+          "defaults": {"Current_Quarter": "Q2", "QUARTER_START_DATE": "2025-10-01", ...},
+          "districts": [
+            {"district": "91", "env": {"GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_Q2": "...", ...}}
+          ]
+        }
+
+    Returns:
+        list[dict]: One {'district', 'env'} entry per district with defaults applied.
+    """
+    path = path or os.environ.get("DISTRICTS_MANIFEST", "districts.json")
+    with open(path) as f:
+        manifest = json.load(f)
+
+    defaults = manifest.get("defaults", {})
+    districts = []
+    for entry in manifest["districts"]:
+        district = str(entry["district"])
+        env = {**defaults, **entry.get("env", {})}
+        # Each district gets its own snapshot store under SNAPSHOT_DIR
+        env.setdefault("SNAPSHOT_DIR", os.path.join(os.environ.get("SNAPSHOT_DIR", os.path.join("data", "snapshots")), f"district-{district}"))
+        districts.append({"district": district, "env": {k: str(v) for k, v in env.items()}})
+    return districts
+
+def _run_district(entry: dict) -> tuple[str, pd.DataFrame, str, str]:
+    """Runs the full pipeline for one district inside a worker process."""
+    saved_env = os.environ.copy()
+    for key in list(os.environ):
+        if key.startswith(DISTRICT_ENV_PREFIXES) or key in DISTRICT_ENV_KEYS:
+            del os.environ[key]
+    os.environ.update(entry["env"])
+    os.environ["DISTRICT"] = entry["district"]
+    try:
+        df_merged, update_date = get_merged_club_data()
+        df_merged = df_merged.copy()  # The pipeline result is shared; add the column to a copy
+        df_merged.insert(0, 'District', entry["district"])
+        return entry["district"], df_merged, update_date, None
+    except Exception as e:
+        return entry["district"], None, None, f"{type(e).__name__}: {e}"
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        reset_pipeline_state()
+
+def run_districts(districts: list[dict], max_workers: int = None) -> dict:
+    """
+    Computes every district of a manifest in parallel, one process per CPU core.
+
+    Args:
+        districts (list[dict]): Entries from load_manifest.
+        max_workers (int, optional): Pool size; DISTRICT_WORKERS or the CPU count by default.
+
+    Returns:
+        dict: {'merged', 'update_dates', 'errors'} where 'merged' holds every club of every
+        district with a 'District' column, and 'errors' maps failed districts to their error.
+    """
+    if not districts:
+        return {'merged': pd.DataFrame(), 'update_dates': {}, 'errors': {}}
+
+    max_workers = max_workers or int(os.environ.get("DISTRICT_WORKERS", os.cpu_count() or 1))
+    max_workers = min(max_workers, len(districts))
+
+    frames, update_dates, errors = [], {}, {}
+    # max_tasks_per_child would need Python 3.11; the image runs 3.9, so workers reset themselves
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        for district, df_merged, update_date, error in pool.map(_run_district, districts):
+            if error is not None:
+                errors[district] = error
+                continue
+            frames.append(df_merged)
+            update_dates[district] = update_date
+
+    merged = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    return {'merged': merged, 'update_dates': update_dates, 'errors': errors}
+
+def district_frame(result: dict, district: str) -> pd.DataFrame:
+    """Returns the clubs of one district from a run_districts result."""
+    merged = result['merged']
+    if merged.empty:
+        return merged
+    return merged[merged['District'] == str(district)].reset_index(drop=True)
@@ -1,20 +1,677 @@
 import pandas as pd
-import streamlit as st
 import re
+import sys
+import random
+import json
+import logging
 from datetime import datetime
-import requests
-from utils.metrics import *
-import pandas as pd
-from openpyxl.styles import PatternFill
+from utils.metrics import (
+    assign_grouping,
+    calculate_performance_points,
+    compute_triple_crown_points,
+    empty_pathway_enrollment,
+    evaluate_scoring_rules,
+    merge_award_points,
+    pathway_enrollment_frame,
+    rank_leaderboards,
+    rules_for_tier,
+    update_pathway_enrollment,
+    SCORING_RULES,
+)
 from io import BytesIO
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl import Workbook
 import os
+import time
+import hashlib
+import mmap
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from utils.snapshots import snapshot_dir, program_year, find_snapshot, load_snapshot, save_snapshot
+from utils.diagnostics import count, instrument, timed_stage
+from utils.shared_cache import clear_shared_cache, shared_result, single_flight
+from utils.schema import CLUB_PERFORMANCE_SCHEMA, apply_schema, fill_numeric
+
+# requests and openpyxl are imported where they are used: a run served from cached
+# sources or snapshots never needs them, and they add noticeably to cold start.
+
+logger = logging.getLogger(__name__)
+
+def warn(message: str) -> None:
+    """
+    Reports a recoverable loader problem. It is always logged, and also shown on the page
+    when running inside a Streamlit app; this module never imports Streamlit itself, so
+    the pipeline runs headless (see cli.py).
+    """
+    logger.warning(message)
+    st = sys.modules.get("streamlit")
+    if st is not None and st.runtime.exists():
+        st.warning(message)
+
+# ------------------ Source Fetch Layer ------------------ #
+# Sources are named by the env var holding their file ID and read through a backend
+# chosen with SOURCE_BACKEND:
+#   drive: downloads the file from Google Drive / Sheets (default)
+#   local: memory-maps the file from LOCAL_SOURCE_DIR; the env var holds a path relative
+#          to it, or is left unset to read "<env var name>.csv" / ".xlsx"
+SOURCE_URLS = {
+    "drive_csv": "https://drive.google.com/uc?export=download&id={file_id}",
+    "drive_excel": "https://drive.google.com/uc?export=download&id={file_id}",
+    "sheet_csv": "https://docs.google.com/spreadsheets/d/{file_id}/export?format=csv",
+}
+
+LOCAL_SOURCE_EXTENSIONS = {
+    "drive_csv": ".csv",
+    "drive_excel": ".xlsx",
+    "sheet_csv": ".csv",
+}
+
+_source_cache = {}
+_source_cache_lock = threading.Lock()
+
+def source_backend() -> str:
+    backend = os.environ.get("SOURCE_BACKEND", "drive")
+    if backend not in SOURCE_BACKENDS:
+        raise ValueError(f"Unknown SOURCE_BACKEND {backend!r}, expected one of {sorted(SOURCE_BACKENDS)}")
+    return backend
+
+def _response_validators(response) -> dict:
+    """ETag and Last-Modified of a response, used to revalidate the cached copy."""
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+@contextmanager
+def _open_drive_source(kind: str, file_id: str, previous=None, timeout: float = None):
+    """
+    Downloads a file, conditional on the ETag / Last-Modified of the previous cache entry.
+    Yields (file-like content or None if the server answered 304, validators).
+    `timeout` caps the connect and read timeouts, e.g. to the time left before a deadline.
+    """
+    import requests
+
+    url = SOURCE_URLS[kind].format(file_id=file_id)
+    connect_timeout = float(os.environ.get("SOURCE_CONNECT_TIMEOUT_SECONDS", 5))
+    read_timeout = float(os.environ.get("SOURCE_FETCH_TIMEOUT_SECONDS", 20))
+    if timeout is not None:
+        connect_timeout, read_timeout = min(connect_timeout, timeout), min(read_timeout, timeout)
+
+    headers = {}
+    if previous is not None:
+        if previous[3].get("etag"):
+            headers["If-None-Match"] = previous[3]["etag"]
+        if previous[3].get("last_modified"):
+            headers["If-Modified-Since"] = previous[3]["last_modified"]
+
+    with timed_stage(f"fetch:{kind}") as info:
+        response = requests.get(url, headers=headers, timeout=(connect_timeout, read_timeout))
+        if response.status_code == 304 and previous is not None:
+            yield None, {**previous[3], **{k: v for k, v in _response_validators(response).items() if v}}
+            return
+        response.raise_for_status()
+        info["bytes"] = len(response.content)
+    yield BytesIO(response.content), _response_validators(response)
+
+@contextmanager
+def _open_local_source(kind: str, file_id: str, previous=None, timeout: float = None):
+    """
+    Memory-maps a file under LOCAL_SOURCE_DIR. A file whose size and mtime match the
+    previous cache entry is not opened. Yields (file-like content or None, validators).
+    """
+    path = os.path.join(os.environ.get("LOCAL_SOURCE_DIR", os.path.join("data", "sources")), file_id)
+    stat = os.stat(path)
+    validators = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if previous is not None and previous[3] == validators:
+        yield None, validators
+        return
+
+    if stat.st_size == 0:
+        yield BytesIO(), validators  # Empty files cannot be memory-mapped
+        return
+
+    with open(path, "rb") as f:
+        with timed_stage(f"fetch:{kind}") as info:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            info["bytes"] = stat.st_size
+        with content:
+            yield content, validators
+
+SOURCE_BACKENDS = {
+    "drive": _open_drive_source,
+    "local": _open_local_source,
+}
+
+def _load_source(kind: str, file_id: str, read_kwargs: dict, previous=None, timeout: float = None):
+    """
+    Reads a single source file through the configured backend and parses it. Returns the
+    frame, a digest of the raw bytes and the backend's validators.
+
+    When the backend reports the file unchanged, or its bytes hash to the previous digest,
+    the file is not parsed again and None is returned for the frame. `timeout` bounds the
+    backend's waits in seconds.
+    """
+    with SOURCE_BACKENDS[source_backend()](kind, file_id, previous, timeout=timeout) as (content, validators):
+        if content is None:
+            count("source_fetch.not_modified")
+            return None, previous[2], validators
+
+        digest = hashlib.sha1(content.getbuffer() if isinstance(content, BytesIO) else content).hexdigest()
+        if previous is not None and digest == previous[2]:
+            count("source_fetch.unchanged")
+            return None, digest, validators
+
+        with timed_stage(f"parse:{kind}") as info:
+            content.seek(0)
+            df = _parse_source(kind, content, read_kwargs)
+            info["rows_out"] = len(df)
+    return df, digest, validators
+
+def _parse_source(kind: str, content, read_kwargs: dict) -> pd.DataFrame:
+    """Parses the raw bytes of a source of the given kind (a BytesIO or memory map)."""
+    if kind == "drive_excel":
+        # The zip reader behind read_excel needs a seekable() file object
+        return _parse_excel(content if isinstance(content, BytesIO) else BytesIO(content), **read_kwargs)
+    return _parse_csv(content, **read_kwargs)
+
+def _parse_csv(content, columns: tuple = None, dtypes: tuple = (), aggregate: str = None, **read_kwargs) -> pd.DataFrame:
+    """
+    Parses a CSV source. A source that declares its columns is read with pyarrow, parsing
+    only those columns, straight into their declared dtypes; a declared column the file
+    lacks comes back empty. Rows with a different number of fields, like the
+    "Month of ..., As of ..." footer of the club performance export, are skipped and
+    kept as text in df.attrs["skipped_rows"].
+
+    A source that declares an aggregate (one of CSV_AGGREGATES) is never held as a whole
+    frame: it is streamed in chunks and only the aggregate is returned and cached.
+    """
+    if aggregate is not None:
+        return CSV_AGGREGATES[aggregate](content)
+
+    if columns is None:
+        return pd.read_csv(content, dtype=dict(dtypes) or None, **read_kwargs)
+
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    skipped = []
+    def skip(row):
+        skipped.append(row.text)
+        return "skip"
+
+    table = pv.read_csv(
+        pa.BufferReader(content.getbuffer() if isinstance(content, BytesIO) else content),
+        parse_options=pv.ParseOptions(newlines_in_values=True, invalid_row_handler=skip),
+        convert_options=pv.ConvertOptions(
+            include_columns=list(columns),
+            include_missing_columns=True,
+            column_types={column: pa.type_for_alias(dtype) for column, dtype in dtypes},
+        ),
+    )
+    df = table.to_pandas()
+    df.attrs["skipped_rows"] = skipped
+    return df
+
+def _parse_excel(content, columns: tuple = None, dtypes: tuple = (), **read_kwargs) -> pd.DataFrame:
+    """Parses an Excel source; a source that declares its columns only has those (if present) converted."""
+    if columns is not None:
+        wanted = frozenset(columns)
+        read_kwargs["usecols"] = lambda column: column in wanted
+    return pd.read_excel(content, dtype=dict(dtypes) or None, **read_kwargs)
+
+def _csv_chunks(content, columns: tuple, header: str):
+    """
+    Yields the given columns of a CSV source as text frames of at most SOURCE_CHUNK_BYTES
+    of the file each, so memory does not grow with the file. The header is the first
+    line if it mentions `header`, otherwise the second (some exports put a title above it).
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pv
+
+    buffer = pa.py_buffer(content.getbuffer() if isinstance(content, BytesIO) else content)
+    head = buffer[:64 * 1024].to_pybytes()
+    skip_rows = 0 if header.encode() in head.split(b"\n", 1)[0] else 1
+    # The first block has to hold the skipped title and the header line
+    header_end = len(b"\n".join(head.split(b"\n", skip_rows + 1)[:skip_rows + 1])) + 1
+    reader = pv.open_csv(
+        pa.BufferReader(buffer),
+        read_options=pv.ReadOptions(
+            skip_rows=skip_rows,
+            block_size=max(int(os.environ.get("SOURCE_CHUNK_BYTES", 1 << 20)), header_end),
+        ),
+        parse_options=pv.ParseOptions(newlines_in_values=True, invalid_row_handler=lambda row: "skip"),
+        convert_options=pv.ConvertOptions(
+            include_columns=list(columns),
+            include_missing_columns=True,
+            column_types={column: pa.string() for column in columns},
+        ),
+    )
+    for batch in reader:
+        count("source_parse.chunks")
+        yield batch.to_pandas()
+
+def _aggregate_pathway_enrollment(content) -> pd.DataFrame:
+    """Club Number | 100%_Pathway_Registration of a membership list, folded chunk by chunk."""
+    state = empty_pathway_enrollment()
+    for chunk in _csv_chunks(content, MEMBERSHIP_LIST_COLUMNS, header="Is Pathways Enrolled"):
+        club_numbers = chunk["Club Number"].fillna(chunk["Club ID"])  # Some exports call it Club ID
+        state = update_pathway_enrollment(state, club_numbers, chunk["Is Pathways Enrolled"])
+    return pathway_enrollment_frame(state)
+
+CSV_AGGREGATES = {
+    "pathway_enrollment": _aggregate_pathway_enrollment,
+}
+
+def source_file_id(secret_key: str, kind: str) -> Optional[str]:
+    """File ID (or local path) a source is read from, or None if it is not configured."""
+    file_id = os.environ.get(secret_key)
+    if not file_id and source_backend() == "local":
+        file_id = secret_key + LOCAL_SOURCE_EXTENSIONS[kind]
+    return file_id or None
+
+def _source_cache_key(secret_key: str, kind: str, read_kwargs: dict) -> tuple:
+    file_id = source_file_id(secret_key, kind)
+    if file_id is None:
+        raise KeyError(f"{secret_key} is not configured")
+    return (kind, file_id, tuple(sorted(read_kwargs.items())), source_backend())
+
+# ------------------ Fetch Policy ------------------ #
+# A fetch is retried with jittered exponential backoff on transient errors, within a
+# per-source deadline. After SOURCE_BREAKER_THRESHOLD failed fetches in a row the source's
+# circuit opens: for SOURCE_BREAKER_COOLDOWN_SECONDS no request is made, then one trial
+# fetch decides whether it closes again. While a source cannot be fetched, the last good
+# copy is served: the expired cache entry, or the copy persisted under
+# <SNAPSHOT_DIR>/last_good when the process has none yet.
+#
+# A pipeline run reads some sources several times (the version check, then each loader),
+# so every run opens a fetch round (see pipeline_version): a fetch that fails is tried
+# and counted once per round, and later reads in the same round get its outcome. The
+# round belongs to the run that opened it (a context variable), so another session or
+# the materializer starting its own run does not reset it.
+
+_source_health = {}  # cache_key -> {'secret_key', 'good_at', 'error', 'failures', 'opened_at'}
+_fetch_round = contextvars.ContextVar("fetch_round", default=None)  # cache_key -> error, of the caller's run
+
+class SourceUnavailable(ConnectionError):
+    """Raised without a request while a source's circuit is open."""
+
+def _is_transient(e: Exception) -> bool:
+    """Timeouts, dropped connections, 429 and 5xx are worth retrying; anything else is not."""
+    response = getattr(e, "response", None)
+    if response is not None:
+        return response.status_code == 429 or response.status_code >= 500
+    return isinstance(e, (ConnectionError, TimeoutError)) or type(e).__module__.startswith(("requests", "urllib3"))
+
+def _load_with_retries(kind: str, file_id: str, read_kwargs: dict, previous=None):
+    """
+    _load_source with jittered exponential backoff on transient errors, bounded by
+    SOURCE_FETCH_DEADLINE_SECONDS: each attempt may wait only for the time left, and no
+    attempt starts once it is up.
+    """
+    retries = int(os.environ.get("SOURCE_FETCH_RETRIES", 2))
+    backoff = float(os.environ.get("SOURCE_RETRY_BACKOFF_SECONDS", 0.5))
+    deadline = time.monotonic() + float(os.environ.get("SOURCE_FETCH_DEADLINE_SECONDS", 45))
+
+    for attempt in range(retries + 1):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"No time left to fetch {file_id} within SOURCE_FETCH_DEADLINE_SECONDS")
+        try:
+            return _load_source(kind, file_id, read_kwargs, previous=previous, timeout=remaining)
+        except Exception as e:
+            delay = random.uniform(0, backoff * 2 ** attempt)  # Full jitter
+            if attempt == retries or not _is_transient(e) or time.monotonic() + delay >= deadline:
+                raise
+            count("source_fetch.retry")
+            time.sleep(delay)
+
+def begin_fetch_round() -> None:
+    """Starts a new pipeline run for the caller: sources that failed in its previous run are tried again."""
+    _fetch_round.set({})
+
+def _circuit_open(cache_key: tuple) -> bool:
+    """True while the source's circuit is open; after the cooldown one trial fetch is let through."""
+    with _source_cache_lock:
+        health = _source_health.get(cache_key)
+        if health is None or health['opened_at'] is None:
+            return False
+        if time.monotonic() - health['opened_at'] < float(os.environ.get("SOURCE_BREAKER_COOLDOWN_SECONDS", 120)):
+            return True
+        health['opened_at'] = None  # Half-open: the next failure opens it again
+        health['failures'] = int(os.environ.get("SOURCE_BREAKER_THRESHOLD", 3)) - 1
+        return False
+
+def _record_fetch(cache_key: tuple, secret_key: str, error: Exception = None) -> None:
+    with _source_cache_lock:
+        health = _source_health.setdefault(cache_key, {'secret_key': secret_key, 'good_at': None, 'error': None,
+                                                       'failures': 0, 'opened_at': None})
+        if error is None:
+            health.update(good_at=time.time(), error=None, failures=0, opened_at=None)
+            return
+        health['error'] = f"{type(error).__name__}: {error}"
+        health['failures'] += 1
+        if health['failures'] >= int(os.environ.get("SOURCE_BREAKER_THRESHOLD", 3)) and health['opened_at'] is None:
+            health['opened_at'] = time.monotonic()
+            count("source_breaker.opened")
+
+def _last_good_path(cache_key: tuple) -> str:
+    name = hashlib.sha1(repr(cache_key).encode()).hexdigest()[:20]
+    return os.path.join(snapshot_dir(), "last_good", name + ".parquet")
+
+def _save_last_good(cache_key: tuple, df: pd.DataFrame, digest: str) -> None:
+    """Persists a freshly parsed source so a restarted process still has a fallback."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path = _last_good_path(cache_key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               b"digest": digest.encode(), b"good_at": str(time.time()).encode(),
+                                               b"attrs": json.dumps(df.attrs).encode()})
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        # Mixed-type columns cannot always be stored; the in-memory copy still serves as fallback
+        logger.warning("Could not persist the last good copy of %s: %s: %s", cache_key[1], type(e).__name__, e)
+        count("source_fetch.last_good_save_failed")
+
+def _load_last_good(cache_key: tuple):
+    """Returns (frame, digest, good_at) from the persisted copy, or None."""
+    path = _last_good_path(cache_key)
+    if not os.path.exists(path):
+        return None
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, memory_map=True)
+    metadata = table.schema.metadata or {}
+    df = table.to_pandas()
+    df.attrs.update(json.loads(metadata.get(b"attrs", b"{}")))
+    return df, metadata.get(b"digest", b"").decode(), float(metadata.get(b"good_at", b"0"))
+
+def source_health() -> list[dict]:
+    """
+    Fetch state of every source loaded in this process.
+
+    Returns:
+        list[dict]: 'Source', 'Last Good' (epoch seconds or None), 'Stale' (True while the
+        last good copy is served in place of a fresh one), 'Circuit' ('open' or 'closed') and 'Error'.
+    """
+    with _source_cache_lock:
+        return [{
+            'Source': health['secret_key'],
+            'Last Good': health['good_at'],
+            'Stale': health['error'] is not None,
+            'Circuit': 'open' if health['opened_at'] is not None else 'closed',
+            'Error': health['error'],
+        } for health in _source_health.values()]
+
+def stale_sources() -> list[dict]:
+    """The rows of source_health whose data could not be refreshed."""
+    return [row for row in source_health() if row['Stale']]
+
+def _get_source(secret_key: str, kind: str, read_kwargs: dict) -> pd.DataFrame:
+    """
+    Return the parsed frame for a source. The cached copy is served as is for
+    SOURCE_CACHE_TTL_SECONDS; after that it is revalidated with the backend
+    and only read and parsed again if the file changed. The returned frame is shared with the cache.
+    Concurrent misses for the same source share one download. If the source cannot be
+    fetched, its last good copy is returned (see Fetch Policy); only a source that was
+    never loaded raises. A source that already failed in this fetch round is not fetched again.
+
+    Cache entries are (fetched_at, frame, digest, validators).
+    """
+    cache_key = _source_cache_key(secret_key, kind, read_kwargs)
+    ttl = float(os.environ.get("SOURCE_CACHE_TTL_SECONDS", 300))
+
+    with _source_cache_lock:
+        entry = _source_cache.get(cache_key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        count("source_cache.hit")
+        return entry[1]
+
+    def refresh():
+        count("source_cache.miss")
+        failed_fetches = _fetch_round.get()
+        with _source_cache_lock:
+            failed = failed_fetches.get(cache_key) if failed_fetches is not None else None
+        if failed is not None:
+            count("source_fetch.failed_this_round")
+            return _fallback(failed)
+        try:
+            if _circuit_open(cache_key):
+                count("source_breaker.short_circuit")
+                raise SourceUnavailable(f"{secret_key} is failing; retrying after the cooldown")
+            df, digest, validators = _load_with_retries(kind, cache_key[1], read_kwargs, previous=entry)
+        except Exception as e:
+            if not isinstance(e, SourceUnavailable):
+                _record_fetch(cache_key, secret_key, e)
+            if failed_fetches is not None:
+                with _source_cache_lock:
+                    failed_fetches[cache_key] = e
+            return _fallback(e)
+
+        _record_fetch(cache_key, secret_key)
+        if df is None:
+            df = entry[1]  # Unchanged since the cached copy was parsed
+        else:
+            _save_last_good(cache_key, df, digest)
+        with _source_cache_lock:
+            _source_cache[cache_key] = (time.monotonic(), df, digest, validators)
+        return df
+
+    def _fallback(error: Exception) -> pd.DataFrame:
+        """Serves the last good copy; the expired entry stays expired so the next call tries again."""
+        if entry is not None:
+            count("source_fetch.fallback")
+            return entry[1]
+        last_good = _load_last_good(cache_key)
+        if last_good is None:
+            raise error
+        count("source_fetch.fallback")
+        df, digest, good_at = last_good
+        with _source_cache_lock:
+            _source_cache[cache_key] = (float("-inf"), df, digest, {})
+            _source_health[cache_key]['good_at'] = good_at
+        return df
+
+    # Sessions that miss at the same time wait for one download instead of starting their own
+    return single_flight(("source", cache_key), refresh)
+
+def fetch_source(secret_key: str, kind: str, **read_kwargs) -> pd.DataFrame:
+    """
+    Loads a source file through the shared TTL cache.
+
+    Args:
+        secret_key (str): Env var holding the Google Drive file ID.
+        kind (str): One of SOURCE_URLS ("drive_csv", "drive_excel", "sheet_csv").
+        **read_kwargs: Extra arguments for pd.read_csv / pd.read_excel.
+
+    Returns:
+        pd.DataFrame: A private copy of the parsed frame, safe to modify.
+    """
+    return _get_source(secret_key, kind, read_kwargs).copy()
+
+def prefetch_sources(sources: list[tuple[str, str, dict]]) -> None:
+    """
+    Downloads independent sources in parallel on a bounded thread pool and warms the cache,
+    so the loaders that follow are served from memory. Failures are left for the loaders to report.
+
+    Args:
+        sources (list): (secret_key, kind, read_kwargs) tuples.
+    """
+    sources = list(dict.fromkeys((key, kind, tuple(sorted(kw.items()))) for key, kind, kw in sources))
+    if not sources:
+        return
+
+    max_workers = min(int(os.environ.get("SOURCE_FETCH_WORKERS", 8)), len(sources))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Each download runs in the caller's context, so its failures count toward the caller's fetch round
+        futures = [pool.submit(contextvars.copy_context().run, _get_source, key, kind, dict(kw))
+                   for key, kind, kw in sources]
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                pass
+
+def sources_version(sources: list[tuple[str, str, dict]]) -> str:
+    """
+    Returns a short hash of the content currently cached for the given sources.
+    It changes whenever any of the underlying files changes.
+    """
+    digests = []
+    with _source_cache_lock:
+        for key, kind, kw in sources:
+            try:
+                entry = _source_cache.get(_source_cache_key(key, kind, dict(kw)))
+            except KeyError:
+                entry = None
+            digests.append(f"{key}={entry[2] if entry else 'missing'}")
+    return hashlib.sha1("|".join(sorted(digests)).encode()).hexdigest()[:16]
+
+def clear_source_cache() -> None:
+    """Drop every cached source so the next load downloads fresh copies."""
+    with _source_cache_lock:
+        _source_cache.clear()
+    begin_fetch_round()
+
+def reset_pipeline_state() -> None:
+    """
+    Forgets everything this process learnt about its sources and results: cached sources,
+    fetch health, reused club rows and shared results. Used between districts that run
+    one after another in the same worker process.
+    """
+    with _source_cache_lock:
+        _source_cache.clear()
+        _source_health.clear()
+    begin_fetch_round()
+    with _club_rows_lock:
+        _club_rows_cache.clear()
+    clear_shared_cache()
+
+def seed_source(secret_key: str, kind: str, content: bytes, **read_kwargs) -> None:
+    """
+    Stores the raw bytes of a source, e.g. a local fixture, as its cached copy. They are
+    parsed as a download would be and served like one until they expire from the TTL cache.
+    """
+    cache_key = _source_cache_key(secret_key, kind, read_kwargs)
+    df = _parse_source(kind, BytesIO(content), read_kwargs)
+    digest = hashlib.sha1(content).hexdigest()
+    with _source_cache_lock:
+        _source_cache[cache_key] = (time.monotonic(), df, digest, {})
+
+# ------------------ Source Declarations ------------------ #
+# Each source declares the columns the pipeline reads and their dtypes as read kwargs
+# ("columns", "dtypes"), so only those are parsed. They are tuples, so that they can be
+# part of the source cache key.
+
+CLUB_BASE_COLUMNS = ['District', 'Division', 'Area', 'Club Number', 'Club Name',
+                     'Club Status', 'Mem. Base', 'Active Members', 'Net Growth']
+
+CLUB_OTHER_COLUMNS = ['Club Number', 'CSP', 'Goals Met', 'Level 1s', 'Level 2s', 'Add. Level 2s', 'Level 3s',
+                      'Level 4s, Path Completions, or DTM Awards',
+                      'Add. Level 4s, Path Completions, or DTM award', 'New Members',
+                      'Add. New Members', 'Off. Trained Round 1', 'Off. Trained Round 2',
+                      'Mem. dues on time Oct', 'Mem. dues on time Apr', 'Off. List On Time',
+                      'Club Distinguished Status']
+
+CLUB_PERFORMANCE_COLUMNS = tuple(dict.fromkeys(CLUB_BASE_COLUMNS + CLUB_OTHER_COLUMNS))
+
+CLUB_PERFORMANCE_READ_KWARGS = {
+    "columns": CLUB_PERFORMANCE_COLUMNS,
+    "dtypes": tuple(
+        (col, "int64" if col == 'Club Number' else
+              "string" if CLUB_PERFORMANCE_SCHEMA.get(col, 'category') == 'category' else
+              CLUB_PERFORMANCE_SCHEMA[col])
+        for col in CLUB_PERFORMANCE_COLUMNS
+    ),
+}
+
+EDU_ACHIEVEMENTS_COLUMNS = ("Club", "Name", "Award", "Date", "Member")
+
+EXCEL_READ_KWARGS = {
+    "sheet_name": "Sheet1",
+    "skiprows": 1,
+    "columns": EDU_ACHIEVEMENTS_COLUMNS,
+    "dtypes": (("Name", "string"), ("Award", "string")),
+}
+
+# The membership list has a row per member; only its per-club aggregate is kept (see _csv_chunks)
+MEMBERSHIP_LIST_COLUMNS = ("Club Number", "Club ID", "Is Pathways Enrolled")
+
+MEMBERSHIP_LIST_READ_KWARGS = {"aggregate": "pathway_enrollment"}
+
+def form_read_kwargs(source: str) -> dict:
+    """Read kwargs of a form responses sheet: the club answer and the date columns of its rules, as text."""
+    columns = tuple(dict.fromkeys(["Select Your Club"] + [r["date_col"] for r in SCORING_RULES if r["source"] == source]))
+    return {"columns": columns, "dtypes": tuple((col, "string") for col in columns)}
+
+def form_sources(tier: str) -> list[tuple[str, str, dict]]:
+    """Form response sheets read by the scoring rules of one tier."""
+    return [(source, "sheet_csv", form_read_kwargs(source)) for source in dict.fromkeys(r["source"] for r in rules_for_tier(tier))]
+
+PATHWAYS_PIONEERS_SOURCES = form_sources("Pathways Pioneers")
+
+LEADERSHIP_INNOVATORS_SOURCES = form_sources("Leadership Innovators")
+
+EXCELLENCE_CHAMPIONS_SOURCES = form_sources("Excellence Champions") + [
+    ("GOOGLE_DRIVE_FILE_ID_MEMBERSHIP_LIST", "sheet_csv", MEMBERSHIP_LIST_READ_KWARGS),
+]
+
+def frozen_club_performance_sources() -> list[tuple[str, str]]:
+    """(snapshot label, secret key) of the exports that no longer change: the quarter base and the last quarter."""
+    cq = os.environ.get("Current_Quarter")
+    lq = {"Q2": "Q1", "Q3": "Q2", "Q4": "Q3"}.get(cq)
+
+    frozen = [("BASE_" + str(cq), "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_BASE_" + str(cq))]
+    if lq is not None:
+        frozen.append((lq, "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + lq))
+    return frozen
+
+def club_performance_sources() -> list[tuple[str, str, dict]]:
+    """
+    Sources read by load_data_club_performance for the current quarter.
+    Closed-quarter exports already held in the snapshot store are not downloaded.
+    """
+    cq = os.environ.get("Current_Quarter")
+    season = program_year()
+
+    sources = [
+        ("GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + str(cq), "drive_csv", CLUB_PERFORMANCE_READ_KWARGS),
+        ("GOOGLE_DRIVE_FILE_ID_EDU_ACHIEVEMENTS", "drive_excel", EXCEL_READ_KWARGS),
+    ]
+    for quarter, secret_key in frozen_club_performance_sources():
+        file_id = source_file_id(secret_key, "drive_csv")
+        if file_id is None or find_snapshot(season, quarter, file_id) is None:
+            sources.append((secret_key, "drive_csv", CLUB_PERFORMANCE_READ_KWARGS))
+    return sources
+
+def pipeline_sources() -> list[tuple[str, str, dict]]:
+    """Every source read by get_merged_club_data."""
+    return (
+        club_performance_sources()
+        + PATHWAYS_PIONEERS_SOURCES
+        + LEADERSHIP_INNOVATORS_SOURCES
+        + EXCELLENCE_CHAMPIONS_SOURCES
+    )
 
 def extract_update_date(file_url):
-    """Extract and format the last update date from filename in content-disposition header."""
-    response = requests.get(file_url)
+    """
+    Extract and format the last update date from filename in content-disposition header.
+    Only the response headers are read; the file body is never downloaded.
+    """
+    import requests
+
+    response = requests.head(file_url, allow_redirects=True)
     content_disposition = response.headers.get('content-disposition', '')
+    if not content_disposition:
+        # Some hosts only send the header on GET; stream it so the body is not read
+        with requests.get(file_url, stream=True) as response:
+            content_disposition = response.headers.get('content-disposition', '')
     filename = re.findall("filename=(.+)", content_disposition)
     filename = filename[0] if filename else "Unknown"
     
@@ -25,6 +682,7 @@ def extract_update_date(file_url):
         return date_obj.strftime("%B %d, %Y")
     return "Unknown"
 
+@instrument("load_club_performance_data")
 def load_club_performance_data(secret_key: str) -> pd.DataFrame:
     """
     Loads Club Performance data from Google Drive using a secret key.
@@ -36,23 +694,54 @@ def load_club_performance_data(secret_key: str) -> pd.DataFrame:
         pd.DataFrame: Cleaned DataFrame with valid club names.
     """
     try:
-        file_id = os.environ.get(secret_key)
-        gsheet_url = f"https://drive.google.com/uc?export=download&id={file_id}"
-
-        df = pd.read_csv(gsheet_url)
+        df = fetch_source(secret_key, "drive_csv", **CLUB_PERFORMANCE_READ_KWARGS)
+        # The "Month of ..., As of MM/DD/YYYY" footer is skipped by the declared parse
+        footer = re.search(r"As of (\d{2}/\d{2}/\d{4})", " ".join(df.attrs.get("skipped_rows", [])))
         try:
-            update_date = df.iloc[-1]['Division'][-10:]
+            update_date = footer.group(1) if footer else df.iloc[-1]['Division'][-10:]
         except Exception:
             update_date = "Not available"
 
         df = df[df["Club Name"].notna()]  # Filter rows with non-empty club names
-        df["Club Number"] = df["Club Number"].astype(int)
-        return df, update_date
+        if not pd.api.types.is_integer_dtype(df["Club Number"]):
+            df["Club Number"] = df["Club Number"].astype(int)  # Frames that were not parsed with the declared dtypes
+        return apply_schema(df), update_date
 
     except Exception as e:
-        st.warning(f"Could not load Club Performance data: {e}")
+        warn(f"Could not load Club Performance data: {e}")
         return pd.DataFrame(), 'January 01, 1900'  # Return empty DataFrame on failure
 
+@instrument("load_frozen_club_performance_data")
+def load_frozen_club_performance_data(secret_key: str, quarter: str) -> pd.DataFrame:
+    """
+    Loads a Club Performance export that no longer changes (a quarter base or a closed quarter).
+    The export is read from the local snapshot store when a snapshot of the same file is
+    present; otherwise it is downloaded once and persisted there.
+
+    Args:
+        secret_key (str): The key to access the file ID if no snapshot exists yet.
+        quarter (str): Snapshot label, e.g. "Q1" or "BASE_Q2".
+
+    Returns:
+        pd.DataFrame: Cleaned DataFrame with valid club names, and its update date.
+    """
+    season = program_year()
+    file_id = source_file_id(secret_key, "drive_csv")
+    snapshot = load_snapshot(season, quarter, file_id) if file_id is not None else None
+    if snapshot is not None:
+        count("snapshot.hit")
+        return snapshot
+
+    count("snapshot.miss")
+    df, update_date = load_club_performance_data(secret_key)
+    if not df.empty:
+        try:
+            save_snapshot(df, season, quarter, file_id, update_date)
+        except Exception:
+            pass  # The snapshot store is only an optimisation; the downloaded frame is still valid
+    return df, update_date
+
+@instrument("load_incentive_winners")
 def load_incentive_winners(secret_key: str) -> pd.DataFrame:
     """
     Loads Incentive winners list from Google Drive using a secret key.
@@ -64,15 +753,12 @@ def load_incentive_winners(secret_key: str) -> pd.DataFrame:
         pd.DataFrame
     """
     try:
-        file_id = os.environ.get(secret_key)
-        gsheet_url = f"https://drive.google.com/uc?export=download&id={file_id}"
-
-        df = pd.read_excel(gsheet_url, header=2)
+        df = fetch_source(secret_key, "drive_excel", header=2)
 
         return df
 
     except Exception as e:
-        st.warning(f"Could not Incentive Winners list: {e}")
+        warn(f"Could not Incentive Winners list: {e}")
         return pd.DataFrame()
 
 def get_quarter_delta(df_latest: pd.DataFrame, 
@@ -93,11 +779,7 @@ def get_quarter_delta(df_latest: pd.DataFrame,
         pd.DataFrame: New dataframe with quarter-only values
     """
 
-    # Standardize merge key
-    df_latest[merge_on] = df_latest[merge_on].astype(str).str.strip().str.upper()
-    df_last_quarter[merge_on] = df_last_quarter[merge_on].astype(str).str.strip().str.upper()
-
-    # Merge both snapshots on Club Number
+    # Both exports carry Club Number as the integer parsed at load time
     df_merged = df_latest.merge(
         df_last_quarter,
         on=merge_on,
@@ -140,54 +822,53 @@ def get_csp_improvement(df_latest: pd.DataFrame, df_last_quarter: pd.DataFrame)
         lambda row: 'Y' if row['CSP'] == 'Y' and row.get('CSP_Previous', 'N') != 'Y' else 'N',
         axis=1
     )
-    merged['Club Number'] = merged['Club Number'].astype(int)
     return merged[['Club Number', 'CSP']]
 
-# ------------------ Load and Prepare Data ------------------ #
-def load_data_club_performance(gsheet_url=None):
+# ------------------ Incremental Quarter Delta ------------------ #
+# Between two refreshes of the live export most clubs' numbers do not change. Each club's
+# row is hashed, and only clubs whose hash changed since the previous refresh have their
+# deltas, points and group re-derived; the other rows are reused as they are.
 
-    cq = os.environ.get("Current_Quarter")
-    QUARTER_START_DATE = os.environ.get("QUARTER_START_DATE")
-    QUARTER_END_DATE = os.environ.get("QUARTER_END_DATE")
+_club_rows_cache = {}
+_club_rows_lock = threading.Lock()
 
-    # Map current to last quarter
-    quarter_map = {
-        "Q1": None,
-        "Q2": "Q1",
-        "Q3": "Q2",
-        "Q4": "Q3"
-    }
-    lq = quarter_map.get(cq)
+def frame_digest(df: pd.DataFrame) -> str:
+    """Returns a hash of the content of a frame."""
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()
 
-    # Load common data
-    df_base, quarter_base_date = load_club_performance_data(secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_BASE_" + cq)
-    df_latest, update_date = load_club_performance_data(secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + cq)
+def club_row_hashes(df: pd.DataFrame, columns: list[str], key: str = "Club Number") -> pd.Series:
+    """Returns one hash per club of the given columns, indexed by the club key."""
+    return pd.Series(pd.util.hash_pandas_object(df[columns], index=False).to_numpy(), index=df[key].to_numpy())
 
-    # Column groups
-    base_col = ['District', 'Division', 'Area', 'Club Number', 'Club Name',
-                'Club Status', 'Mem. Base', 'Active Members', 'Net Growth']
-
-    other_col = ['Club Number', 'CSP', 'Goals Met', 'Level 1s', 'Level 2s', 'Add. Level 2s', 'Level 3s',
-                'Level 4s, Path Completions, or DTM Awards',
-                'Add. Level 4s, Path Completions, or DTM award', 'New Members',
-                'Add. New Members', 'Off. Trained Round 1', 'Off. Trained Round 2',
-                'Mem. dues on time Oct', 'Mem. dues on time Apr', 'Off. List On Time',
-                'Club Distinguished Status']
-
-    # Compute current quarter-only data
-    if lq is None:
+@instrument("derive_club_rows")
+def derive_club_rows(df_base: pd.DataFrame,
+                     df_latest: pd.DataFrame,
+                     df_last_quarter,
+                     base_col: list[str],
+                     other_col: list[str]) -> pd.DataFrame:
+    """
+    Builds the quarter-only rows of the given clubs: base columns, quarter deltas,
+    CSP improvement, performance points and club group.
+
+    Parameters:
+        df_base (pd.DataFrame): Quarter base export
+        df_latest (pd.DataFrame): Latest YTD export
+        df_last_quarter (pd.DataFrame | None): Closed last quarter export, None in Q1
+
+    Returns:
+        pd.DataFrame: One row per club of df_base, followed by clubs only in df_latest
+    """
+    if df_last_quarter is None:
         # First quarter — use latest as-is
-        df_current_only = df_latest[other_col].copy()
+        df_current_only = df_latest[[x for x in other_col if x != "CSP"]].copy()
+        df_last_quarter = pd.DataFrame({'Club Number': pd.Series(dtype=int), 'CSP': pd.Series(dtype=object)})
     else:
-        # Load last quarter data and compute delta
-        df_last_quarter, _ = load_club_performance_data(secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + lq)
         df_current_only = get_quarter_delta(
             df_latest=df_latest,
             df_last_quarter=df_last_quarter,
             cols_to_diff=[x for x in other_col if x not in ["Club Number", "CSP"]],
             merge_on="Club Number"
         )
-        df_current_only["Club Number"] = df_current_only["Club Number"].astype(int)
 
     df = df_base[base_col].merge(df_current_only, on='Club Number', how='left')
 
@@ -198,49 +879,203 @@ def load_data_club_performance(gsheet_url=None):
 
     df = pd.concat([df, new_clubs], ignore_index=True)
 
-    df["Club Number"] = df["Club Number"].astype(int)
+    df = calculate_performance_points(df)
+    return assign_grouping(df)
+
+@instrument("incremental_club_rows")
+def incremental_club_rows(df_base: pd.DataFrame,
+                          df_latest: pd.DataFrame,
+                          df_last_quarter,
+                          base_col: list[str],
+                          other_col: list[str]) -> pd.DataFrame:
+    """
+    Same rows as derive_club_rows, but only clubs whose latest row changed since the
+    previous call are re-derived. A change of quarter, base export or last quarter
+    export invalidates every row. Dtypes inferred from a few clubs can differ from those
+    of a full derivation (e.g. float64 for a text column missing for all of them);
+    apply_schema makes them the same.
+
+    Returns:
+        pd.DataFrame: A private copy of the derived rows, safe to modify.
+    """
+    context = (
+        os.environ.get("Current_Quarter"),
+        frame_digest(df_base[base_col]),
+        frame_digest(df_last_quarter) if df_last_quarter is not None else None,
+    )
+
+    # Clubs only present in the base export have no latest row; they hash to 0
+    latest_hashes = club_row_hashes(df_latest, other_col)
+    clubs = pd.Index(df_base["Club Number"]).append(latest_hashes.index.difference(df_base["Club Number"])).drop_duplicates()
+    hashes = latest_hashes[~latest_hashes.index.duplicated(keep="last")].reindex(clubs, fill_value=0)
+
+    with _club_rows_lock:
+        entry = _club_rows_cache.get("club_performance")
+
+    if entry is None or entry["context"] != context:
+        unchanged = clubs[:0]
+    else:
+        common = clubs.intersection(entry["hashes"].index)
+        unchanged = common[entry["hashes"][common].to_numpy() == hashes[common].to_numpy()]
+    changed = clubs.difference(unchanged)
+    count("club_rows.reused", len(unchanged))
+    count("club_rows.changed", len(changed))
+
+    def only_changed(df):
+        return df[df["Club Number"].isin(changed)]
+
+    df_changed = derive_club_rows(
+        only_changed(df_base),
+        only_changed(df_latest),
+        only_changed(df_last_quarter) if df_last_quarter is not None else None,
+        base_col,
+        other_col
+    )
+    if len(unchanged):
+        df_kept = entry["rows"][entry["rows"]["Club Number"].isin(unchanged)]
+        df = pd.concat([df_kept, df_changed], ignore_index=True)
+    else:
+        df = df_changed
+
+    # Keep the base-then-new-clubs order of a full derivation
+    df = df.iloc[clubs.get_indexer(df["Club Number"]).argsort(kind="stable")].reset_index(drop=True)
+
+    with _club_rows_lock:
+        _club_rows_cache["club_performance"] = {"context": context, "hashes": hashes, "rows": df}
+    return df.copy()
+
+# ------------------ Load and Prepare Data ------------------ #
+class ClubPerformanceUnavailable(RuntimeError):
+    """Raised when a club performance export the ranking needs has no usable copy at all."""
+
+def _require_export(df: pd.DataFrame, secret_key: str) -> pd.DataFrame:
+    if df.empty:
+        raise ClubPerformanceUnavailable(
+            f"The club performance export {secret_key} could not be loaded and no earlier copy is "
+            "available, so the leaderboards cannot be computed. Try again once Google Drive responds."
+        )
+    return df
+
+@instrument("load_data_club_performance")
+def load_data_club_performance(gsheet_url=None):
+
+    cq = os.environ.get("Current_Quarter")
+    QUARTER_START_DATE = os.environ.get("QUARTER_START_DATE")
+    QUARTER_END_DATE = os.environ.get("QUARTER_END_DATE")
+
+    # Map current to last quarter
+    quarter_map = {
+        "Q1": None,
+        "Q2": "Q1",
+        "Q3": "Q2",
+        "Q4": "Q3"
+    }
+    lq = quarter_map.get(cq)
+
+    # Download every source this function needs in parallel before reading them
+    prefetch_sources(club_performance_sources())
+
+    # Load common data; without these exports there is nothing to rank
+    df_base, quarter_base_date = load_frozen_club_performance_data(
+        secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_BASE_" + cq, quarter="BASE_" + cq
+    )
+    _require_export(df_base, "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_BASE_" + cq)
+    # Only the live export goes over the network on every run
+    df_latest, update_date = load_club_performance_data(secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + cq)
+    _require_export(df_latest, "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + cq)
 
-    df_edu_achievements = load_excel_data("GOOGLE_DRIVE_FILE_ID_EDU_ACHIEVEMENTS", ["Club", "Name", "Award", "Date"], sheet_name="Sheet1")
+    # Column groups
+    base_col = CLUB_BASE_COLUMNS
+    other_col = CLUB_OTHER_COLUMNS
+
+    # Load last quarter data; quarter deltas are then re-derived only for clubs that changed
+    df_last_quarter = None
+    if lq is not None:
+        df_last_quarter, _ = load_frozen_club_performance_data(
+            secret_key="GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + lq, quarter=lq
+        )
+        _require_export(df_last_quarter, "GOOGLE_DRIVE_FILE_ID_CLUB_PERFORMANCE_" + lq)
+
+    df = incremental_club_rows(df_base, df_latest, df_last_quarter, base_col, other_col)
+
+    df_edu_achievements = load_excel_data("GOOGLE_DRIVE_FILE_ID_EDU_ACHIEVEMENTS", ["Club", "Name", "Award", "Date", "Member"], sheet_name="Sheet1")
     df_edu_achievements.rename(columns={"Club": "Club Number"}, inplace=True)
 
     df_edu_achievements['Date'] = pd.to_datetime(df_edu_achievements['Date'])
-    df_edu_achievements = df_edu_achievements[df_edu_achievements['Date'].between(QUARTER_START_DATE, QUARTER_END_DATE)]
 
-    df_tc = load_excel_data("GOOGLE_DRIVE_FILE_ID_TRIPLE_CROWN", ["Club Name", "Member"], sheet_name="Sheet1")
-    df_tc = df[['Club Name', 'Club Number']].merge(df_tc, how = 'inner')
-    df = calculate_points(df, df_edu_achievements, df_tc)
-    df = assign_grouping(df)
+    # Triple Crowns completed this quarter, using the program year so far to see earlier levels
+    year_start = program_year().split("-")[0] + "-07-01"
+    df_edu_year = df_edu_achievements[df_edu_achievements['Date'].between(year_start, QUARTER_END_DATE)]
+    df_tc = compute_triple_crown_points(df_edu_year, start_date=datetime.strptime(QUARTER_START_DATE, "%Y-%m-%d"))
+
+    df_edu_achievements = df_edu_achievements[df_edu_achievements['Date'].between(QUARTER_START_DATE, QUARTER_END_DATE)]
+    df = apply_schema(merge_award_points(df, df_edu_achievements, df_tc))
     # df = df[df['Group'] != 'Unknown']
     return df, update_date
 
-def load_csv_from_secret(secret_key: str, columns: list[str]) -> pd.DataFrame:
+@instrument("load_csv_from_secret")
+def load_csv_from_secret(secret_key: str, columns: list[str], read_kwargs: dict = None) -> pd.DataFrame:
     """
     Loads a CSV from Google Drive using a file ID stored in Streamlit secrets.
-    If loading fails, returns an empty DataFrame with the given columns.
+    If loading fails, returns an empty DataFrame with the given columns; a source that is
+    configured but has no good copy yet is also reported, so its clubs do not silently score zero.
     """
+    if source_file_id(secret_key, "sheet_csv") is None:
+        return pd.DataFrame(columns=columns)  # Not configured for this district
     try:
-        file_id = os.environ.get(secret_key)
-        gsheet_url = f"https://docs.google.com/spreadsheets/d/{file_id}/export?format=csv"
-        df = pd.read_csv(gsheet_url)
+        df = fetch_source(secret_key, "sheet_csv", **(read_kwargs or {}))
     except Exception as e:
-        # st.warning(f"Could not load file for {secret_key}: {e}")
+        warn(f"Could not load {secret_key}: {e}")
         df = pd.DataFrame(columns=columns)
     return df
 
+@instrument("load_excel_data")
 def load_excel_data(secret_key: str, columns: list[str], sheet_name="Sheet1") -> pd.DataFrame:
     """
     Loads a CSV from Google Drive using a file ID stored in Streamlit secrets.
-    If loading fails, returns an empty DataFrame with the given columns.
+    If loading fails, returns an empty DataFrame with the given columns and reports it.
     """
+    if source_file_id(secret_key, "drive_excel") is None:
+        return pd.DataFrame(columns=columns)  # Not configured for this district
     try:
-        file_id = os.environ.get(secret_key)
-        gsheet_url = f"https://drive.google.com/uc?export=download&id={file_id}"
-        df = pd.read_excel(gsheet_url, sheet_name=sheet_name, skiprows=1)
+        df = fetch_source(secret_key, "drive_excel", **{**EXCEL_READ_KWARGS, "sheet_name": sheet_name})
     except Exception as e:
-        # st.warning(f"Could not load Education Achievements data: {e}")
+        warn(f"Could not load Education Achievements data: {e}")
         df = pd.DataFrame(columns=columns)
     return df
 
+@instrument("load_form_points")
+def load_form_points(tier: str) -> pd.DataFrame:
+    """
+    Loads the form responses used by one tier and scores all of its rules at once.
+
+    Returns:
+        pd.DataFrame: One row per club with 'Club Number' and one points column per rule.
+    """
+    rules = rules_for_tier(tier)
+    sources = form_sources(tier)
+    prefetch_sources(sources)
+
+    frames = {key: load_csv_from_secret(key, ["Select Your Club"], read_kwargs) for key, _, read_kwargs in sources}
+    return evaluate_scoring_rules(frames, rules)
+
+# Point columns of each tier, in display order; a tier's points are their sum
+TIER_POINT_COLUMNS = {
+    'Pathways Pioneers': ['L1 Points', 'L2 Points', 'L3 Points', 'L4 Points', 'L5 Points', 'DTM Points', 'TC Points',
+                          'Humorous Contest', 'TableTopics Contest', 'Evaluation Contest', 'International Contest'],
+    'Leadership Innovators': ['COT R1 Points', 'COT R2 Points', 'MOT',
+                              'Pathways_Completion_Celebration', 'Mentorship_Programme',
+                              'President_Distinguished', 'Smedley_Distinguished',
+                              'Distinguished_Club_Partners', 'Successful_Transition_Handover'],
+    'Excellence Champions': ['Club_Success_Plan', 'FirstTime_Distinguished', 'Early10_Distinguished',
+                             'Quality_Initiatives', '100%_Pathway_Registration', 'Member_Onboarding'],
+}
+
+def tier_columns(tier: str) -> list[str]:
+    """Columns of a tier's detail frame: the club, its tier points, then the point columns."""
+    return ['Club Name', 'Club Number', 'Club Group', 'Active Members', tier] + TIER_POINT_COLUMNS[tier]
+
+@instrument("prepare_pathways_pioneers_data")
 def prepare_pathways_pioneers_data(df_club_performance):
     """
     Process club performance data and merge with contest data to create pathways pioneers leaderboard.
@@ -251,31 +1086,25 @@ def prepare_pathways_pioneers_data(df_club_performance):
     Returns:
         DataFrame with processed pathways pioneers data
     """
-    df = df_club_performance.copy()
+    # The merge builds a new frame, so the shared club frame is not copied first
+    contests_points = load_form_points("Pathways Pioneers")
 
-    df_contests = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_CONTESTS", ["Select Your Club", "Humorous Contest", "TableTopics Contest", "Evaluation Contest", "International Contest"])
-    
-    contests_points = calculate_contest_points(df_contests)
-
-    df_pathways_pioneers = df.merge(contests_points, left_on="Club Number", right_on="Club Number", how="left")
+    df_pathways_pioneers = df_club_performance.merge(contests_points, left_on="Club Number", right_on="Club Number", how="left")
 
-    df_pathways_pioneers = df_pathways_pioneers.fillna(0)
+    df_pathways_pioneers = fill_numeric(df_pathways_pioneers)
 
     # Add tier points
-    df_pathways_pioneers['Pathways Pioneers'] = (
-        df_pathways_pioneers[['L1 Points', 'L2 Points', 'L3 Points', 'L4 Points', 'L5 Points', 'DTM Points', 'TC Points', 
-               'Humorous Contest', 'TableTopics Contest', 'Evaluation Contest', 'International Contest']].sum(axis=1)
-    )
+    df_pathways_pioneers['Pathways Pioneers'] = df_pathways_pioneers[TIER_POINT_COLUMNS['Pathways Pioneers']].sum(axis=1)
 
     # Select columns and format
-    columns = ['Club Name', 'Club Number', 'Club Group', 'Active Members', 'Pathways Pioneers',
-               'L1 Points', 'L2 Points', 'L3 Points', 'L4 Points', 'L5 Points', 'DTM Points', 'TC Points',
-               'Humorous Contest', 'TableTopics Contest', 'Evaluation Contest', 'International Contest']
-    
+    columns = tier_columns('Pathways Pioneers')
+
     # Sort and reset index
     df_pathways_pioneers = df_pathways_pioneers[df_pathways_pioneers['Active Members'] >= 8]
-    return df_pathways_pioneers[columns].sort_values(by='Club Name').reset_index(drop=True)
+    df_pathways_pioneers = df_pathways_pioneers[columns].sort_values(by='Club Name').reset_index(drop=True)
+    return apply_schema(df_pathways_pioneers, points=columns[5:])
 
+@instrument("prepare_leadership_innovators_data")
 def prepare_leadership_innovators_data(df_club_performance):
     """
     Process club performance data and merge with MOT data to create leadership innovators leaderboard.
@@ -286,33 +1115,9 @@ def prepare_leadership_innovators_data(df_club_performance):
     Returns:
         DataFrame with processed leadership innovators data
     """
-    df = df_club_performance.copy()
-
-    # Load and process MOT data
-    df_mot = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_MOMENTS_OF_TRUTH", ["Select Your Club", "MOT"])
-    df_mot_scores = mot_scores(df_mot)
-
-    df_leadership_innovators = df.merge(df_mot_scores, left_on="Club Number", right_on="Club Number", how="left")
-
-    # Load and process PCC data
-    df_pcc = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_PATHWAYS_COMPLETION_CELEBRATION", ["Select Your Club", "Pathways_Completion_Celebration"])
-    df_pcc_scores = pathways_completion_scores(df_pcc)
-    df_leadership_innovators = df_leadership_innovators.merge(df_pcc_scores, left_on="Club Number", right_on="Club Number", how="left")
-
-    # Load and process Mentorship Program data
-    df_mp = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_MENTORSHIP_PROGRAM", ["Select Your Club", "Mentorship_Programme"])
-    df_mp_scores = mentorship_programme_scores(df_mp)
-    df_leadership_innovators = df_leadership_innovators.merge(df_mp_scores, left_on="Club Number", right_on="Club Number", how="left")
-
-    # Load and process dcp data
-    df_dcp = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_DCP", ["Select Your Club", "Distinguished_Club_Partners"])
-    df_dcp_scores = distinguished_club_partners_scores(df_dcp)
-    df_leadership_innovators = df_leadership_innovators.merge(df_dcp_scores, left_on="Club Number", right_on="Club Number", how="left")
-
-    # Load and process sth data
-    df_sth = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_STH", ["Select Your Club", "Successful_Transition_Handover"])
-    df_sth_scores = successful_handover_scores(df_sth)
-    df_leadership_innovators = df_leadership_innovators.merge(df_sth_scores, left_on="Club Number", right_on="Club Number", how="left")
+    # MOT, Pathways Completion Celebration, Mentorship Programme, DCP and handover forms
+    df_form_points = load_form_points("Leadership Innovators")
+    df_leadership_innovators = df_club_performance.merge(df_form_points, left_on="Club Number", right_on="Club Number", how="left")
 
     # Extract President (P) and Smedley (M) Distinguished status from 'Club Distinguished Status' column
     # P = Presidents Distinguished Club (50 points), M = Smedley Distinguished Club (100 points)
@@ -323,27 +1128,20 @@ def prepare_leadership_innovators_data(df_club_performance):
         lambda x: 100 if isinstance(x, str) and 'S' in x.upper() else 0
     )
 
-    df_leadership_innovators = df_leadership_innovators.fillna(0)
+    df_leadership_innovators = fill_numeric(df_leadership_innovators)
 
     # Add tier points
-    df_leadership_innovators['Leadership Innovators'] = (
-        df_leadership_innovators[['COT R1 Points', 'COT R2 Points', 'MOT', 
-                                  'Pathways_Completion_Celebration','Mentorship_Programme',
-                                  'President_Distinguished', 'Smedley_Distinguished',
-                                  'Distinguished_Club_Partners', 'Successful_Transition_Handover']].sum(axis=1)
-    )
+    df_leadership_innovators['Leadership Innovators'] = df_leadership_innovators[TIER_POINT_COLUMNS['Leadership Innovators']].sum(axis=1)
 
     # Select columns and format
-    columns = ['Club Name', 'Club Number', 'Club Group', 'Active Members', 'Leadership Innovators',
-               'COT R1 Points', 'COT R2 Points', 'MOT', 
-                'Pathways_Completion_Celebration','Mentorship_Programme',
-                'President_Distinguished', 'Smedley_Distinguished',
-                'Distinguished_Club_Partners', 'Successful_Transition_Handover']
-    
+    columns = tier_columns('Leadership Innovators')
+
     # Sort and reset index
     df_leadership_innovators = df_leadership_innovators[df_leadership_innovators['Active Members'] >= 8]
-    return df_leadership_innovators[columns].sort_values(by='Club Name').reset_index(drop=True)
+    df_leadership_innovators = df_leadership_innovators[columns].sort_values(by='Club Name').reset_index(drop=True)
+    return apply_schema(df_leadership_innovators, points=columns[5:])
 
+@instrument("prepare_excellence_champions_data")
 def prepare_excellence_champions_data(df_club_performance):
     """
     Process club performance data and merge with Club Success Plan data to create excellence champions leaderboard.
@@ -354,17 +1152,9 @@ def prepare_excellence_champions_data(df_club_performance):
     Returns:
         DataFrame with processed excellence champions data
     """
-    df = df_club_performance.copy()
-
-    df_qis = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_QIS", ["Select Your Club", "Quality_Initiatives"])
-
-    df_qis_scores = quality_initiatives_scores(df_qis)
-    df_excellence_champions = df.merge(df_qis_scores, left_on="Club Number", right_on="Club Number", how="left")
-
-    df_mo = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_MEMBER_ONBOARDING", ["Select Your Club", "Member_Onboarding"])
-
-    df_mo_scores = member_onboarding_scores(df_mo)
-    df_excellence_champions = df_excellence_champions.merge(df_mo_scores, left_on="Club Number", right_on="Club Number", how="left")
+    # Quality Initiatives and Member Onboarding forms
+    df_form_points = load_form_points("Excellence Champions")
+    df_excellence_champions = df_club_performance.merge(df_form_points, left_on="Club Number", right_on="Club Number", how="left")
 
     df_excellence_champions["Club_Success_Plan"] = df_excellence_champions["CSP"].apply(
     lambda x: 20 if str(x).strip().upper() == "Y" else 0
@@ -372,133 +1162,177 @@ def prepare_excellence_champions_data(df_club_performance):
 
     df_excellence_champions['FirstTime_Distinguished'] = 0
 
-    df_pr = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_MEMBERSHIP_LIST", ["Club Number", "100%_Pathway_Registration"])
-    df_pr = pathway_enrollment_scores(df_pr)
+    # Streamed into per-club scores as it is parsed
+    df_pr = load_csv_from_secret("GOOGLE_DRIVE_FILE_ID_MEMBERSHIP_LIST", ["Club Number", "100%_Pathway_Registration"],
+                                 read_kwargs=MEMBERSHIP_LIST_READ_KWARGS)
     df_excellence_champions = df_excellence_champions.merge(df_pr, left_on="Club Number", right_on="Club Number", how="left")
 
     # Replace NaN values with 0
-    df_excellence_champions = df_excellence_champions.fillna(0)
+    df_excellence_champions = fill_numeric(df_excellence_champions)
 
     # Add tier points
-    df_excellence_champions['Excellence Champions'] = (
-        df_excellence_champions[['Club_Success_Plan', 'FirstTime_Distinguished', 'Early10_Distinguished', 'Quality_Initiatives', '100%_Pathway_Registration', 'Member_Onboarding']].sum(axis=1)
-    )
-    
+    df_excellence_champions['Excellence Champions'] = df_excellence_champions[TIER_POINT_COLUMNS['Excellence Champions']].sum(axis=1)
+
     # Select columns and format
-    columns = ['Club Name', 'Club Number', 'Club Group', 'Active Members', 'Excellence Champions', 'Club_Success_Plan', 'FirstTime_Distinguished', 'Early10_Distinguished', 'Quality_Initiatives', '100%_Pathway_Registration', 'Member_Onboarding']
+    columns = tier_columns('Excellence Champions')
 
     # Sort and reset index
     df_excellence_champions = df_excellence_champions[df_excellence_champions['Active Members'] >= 8]
-    return df_excellence_champions[columns].sort_values(by='Club Name').reset_index(drop=True)
+    df_excellence_champions = df_excellence_champions[columns].sort_values(by='Club Name').reset_index(drop=True)
+    return apply_schema(df_excellence_champions, points=columns[5:])
+
+# ------------------ Shared Results ------------------ #
+# The club frame, the tier frames and the merged frame are computed once per data version
+# for the whole server process (see utils/shared_cache.py) and shared by every session.
+
+TIER_PREPARERS = {
+    'Pathways Pioneers': prepare_pathways_pioneers_data,
+    'Leadership Innovators': prepare_leadership_innovators_data,
+    'Excellence Champions': prepare_excellence_champions_data,
+}
+
+PIPELINE_SETTINGS = ["Current_Quarter", "QUARTER_START_DATE", "QUARTER_END_DATE", "PROGRAM_YEAR", "DISTRICT"]
+
+def pipeline_version() -> str:
+    """
+    Refreshes every pipeline source (downloads only what expired) and returns a version
+    string that changes with any source file or with the quarter settings.
+    """
+    sources = pipeline_sources()
+    # One parallel download round for every source used by the pipeline; the loaders
+    # that follow in this run reuse its outcome rather than retrying failed sources
+    begin_fetch_round()
+    prefetch_sources(sources)
+    # Frozen exports leave the source list once snapshotted; their content does not change, so they are not versioned
+    frozen = {secret_key for _, secret_key in frozen_club_performance_sources()}
+    live = [source for source in sources if source[0] not in frozen]
+    settings = "|".join(os.environ.get(name, "") for name in PIPELINE_SETTINGS)
+    return sources_version(live) + "-" + hashlib.sha1(settings.encode()).hexdigest()[:8]
+
+def get_club_performance_data(version: str = None) -> tuple[pd.DataFrame, str]:
+    """Shared result of load_data_club_performance for the current data version."""
+    return shared_result("club_performance", version or pipeline_version(), load_data_club_performance)
+
+def get_tier_data(tier: str, version: str = None) -> tuple[pd.DataFrame, str]:
+    """
+    Shared detail frame of one tier, as prepared by its prepare_*_data function,
+    and the club performance update date.
+    """
+    version = version or pipeline_version()
+
+    def compute():
+        df_club_performance, update_date = get_club_performance_data(version)
+        return TIER_PREPARERS[tier](df_club_performance), update_date
+
+    return shared_result("tier:" + tier, version, compute)
+
+@instrument("compute_merged_club_data")
+def compute_merged_club_data(version: str = None) -> tuple[pd.DataFrame, str]:
+    """
+    Merges the three tier frames into one row per club with the three tier scores,
+    the point columns of every tier and Total Club Points, plus the club performance update date.
+    """
+    version = version or pipeline_version()
+    df_pathways_pioneers, update_date = get_tier_data('Pathways Pioneers', version)
+    df_leadership_innovators, _ = get_tier_data('Leadership Innovators', version)
+    df_excellence_champions, _ = get_tier_data('Excellence Champions', version)
+    df_merged = df_pathways_pioneers.merge(
+        df_leadership_innovators[['Club Number', 'Leadership Innovators'] + TIER_POINT_COLUMNS['Leadership Innovators']],
+        on='Club Number'
+    ).merge(
+        df_excellence_champions[['Club Number', 'Excellence Champions'] + TIER_POINT_COLUMNS['Excellence Champions']],
+        on='Club Number'
+    )
+    df_merged['Total Club Points'] = (
+        df_merged[['Pathways Pioneers', 'Leadership Innovators', 'Excellence Champions']].sum(axis=1)
+    )
+    return apply_schema(df_merged), update_date
+
+@instrument("get_merged_club_data")
+def get_merged_club_data(version: str = None):
+    """
+    Runs the full pipeline and returns one row per club with the three tier scores
+    and Total Club Points, plus the club performance update date.
+
+    The result is shared across sessions and computed once per data version;
+    callers must not modify the returned frame.
+    """
+    version = version or pipeline_version()
+    return shared_result("merged_club_data", version, lambda: compute_merged_club_data(version))
 
+@instrument("generate_leaderboard_excel")
 def generate_leaderboard_excel(df_merged: pd.DataFrame, group_meta: dict, incentives_tiers: dict) -> BytesIO:
+    """
+    Builds the full leaderboard workbook: one sheet per (Club Group, tier), Top 3 rows highlighted.
+    Rows are streamed with openpyxl's write-only mode and every highlighted cell shares one fill.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import PatternFill
+
     output = BytesIO()
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    wb = Workbook(write_only=True)
+    top3_fill = PatternFill(start_color="FFFACD", end_color="FFFACD", fill_type="solid")
+
+    # Every (group, tier) ranking in one pass; keep all clubs, including those with 0 points
+    tier_names = [tier_info['Name'] for tier_info in incentives_tiers.values()]
+    ranking = rank_leaderboards(df_merged, tier_names, top_n=3)
+    runs = {key: run for key, run in ranking.groupby(['Club Group', 'Tier'], sort=False, observed=True)}
 
     for group_key, group_info in group_meta.items():
         group_name = group_info['Name']
-        df_group = df_merged[df_merged['Club Group'] == group_name].copy()
 
         for tier_key, tier_info in incentives_tiers.items():
             tier_name = tier_info['Name']
             sheet_name = f"{group_name[:15]} - {tier_name[:15]}"
             ws = wb.create_sheet(title=sheet_name)
+            ws.append(['Club Name', 'Club Group', 'Tier Points', 'Total Club Points'])
 
-            # Avoid filtering out clubs with 0 points, keep all clubs
-            df_sorted = df_group.sort_values(
-                by=[tier_name, 'Total Club Points', 'Club Name'],
-                ascending=[False, False, True],
-                kind="mergesort"
-            ).reset_index(drop=True)
-
-            # Add group rank only for clubs with >0 points
-            df_sorted["Group Rank"] = None
-            active_clubs = df_sorted[tier_name] > 0
-            df_sorted.loc[active_clubs, "Group Rank"] = range(1, active_clubs.sum() + 1)
-
-            # Top 3 logic (used only for highlighting)
-            highlight_mask = [False] * len(df_sorted)
-            df_positive = df_sorted[active_clubs]
-            if len(df_positive) >= 3:
-                third_score = df_positive.iloc[2][tier_name]
-                third_points = df_positive.iloc[2]["Total Club Points"]
-                highlight_mask = (
-                    (df_sorted[tier_name] > third_score) |
-                    ((df_sorted[tier_name] == third_score) &
-                     (df_sorted["Total Club Points"] >= third_points))
-                ).tolist()
-            else:
-                highlight_mask = active_clubs.tolist()
+            run = runs.get((group_name, tier_name))
+            if run is None:
+                continue
 
             # Final export columns (no Top 3 column)
-            df_export = df_sorted[['Club Name', 'Club Group', tier_name, 'Total Club Points']].copy()
-            df_export.columns = ['Club Name', 'Club Group', 'Tier Points', 'Total Club Points']
-
-            # Write to Excel
-            for r_idx, row in enumerate(dataframe_to_rows(df_export, index=False, header=True), start=1):
-                for c_idx, value in enumerate(row, start=1):
-                    cell = ws.cell(row=r_idx, column=c_idx, value=value)
-                    # Highlight only active clubs marked for top 3
-                    if r_idx > 1 and highlight_mask[r_idx - 2]:  # row index adjusted
-                        cell.fill = PatternFill(start_color="FFFACD", end_color="FFFACD", fill_type="solid")
+            df_export = df_merged[['Club Name', 'Club Group', tier_name, 'Total Club Points']].iloc[run['Row'].to_numpy()]
+
+            # Stream rows to Excel
+            for highlight, row in zip(run['Top N'].to_numpy(), df_export.itertuples(index=False, name=None)):
+                if highlight:
+                    cells = []
+                    for value in row:
+                        cell = WriteOnlyCell(ws, value=value)
+                        cell.fill = top3_fill
+                        cells.append(cell)
+                    ws.append(cells)
+                else:
+                    ws.append(list(row))
 
     wb.save(output)
     output.seek(0)
     return output
 
+_leaderboard_excel_cache = {}
+_leaderboard_excel_lock = threading.Lock()
 
-# ------------------ Q1 WINNERS MODAL ------------------ #
-def show_incentive_winners_modal(quarter: str, secret_key: str):
-    st.markdown("<p style='text-align: center; color: #666; margin-bottom: 30px;'>Click on a Club Group to view winners</p>", unsafe_allow_html=True)
-    
-    df_results = load_incentive_winners(secret_key=secret_key)
-
-    if df_results.empty:
-        st.error(f"No {quarter} data available")
-        return
-
-    club_groups = sorted(df_results['Club Group'].unique())
-    icons = ["🏛️", "🏢", "⭐", "💎", "🎯", "🚀", "🌟", "🌐"]
-    cols = st.columns(len(club_groups))
-
-    for idx, group in enumerate(club_groups):
-        group_df = df_results[df_results['Club Group'] == group]
-        num_winners = len(group_df)
-        group_icon = icons[idx % len(icons)]
-
-        with cols[idx]:
-            st.markdown(
-                f"""
-                <div style="text-align: center; padding: 25px 15px; border-radius: 12px; 
-                     background-color: var(--background-color); border: 2px solid var(--secondary-background-color); 
-                     margin-bottom: 15px;">
-                    <div style="font-size: 60px; margin-bottom: 12px;">{group_icon}</div>
-                    <div style="font-size: 18px; font-weight: bold; margin: 8px 0;">{group}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-
-            with st.expander("View Winners", expanded=False):
-                group_df_sorted = group_df.sort_values('Tier Points', ascending=False)
-                tiers = group_df_sorted['Incentive Tiers'].unique()
-
-                for tier in tiers:
-                    tier_winners = group_df_sorted[group_df_sorted['Incentive Tiers'] == tier]
-                    tier_lower = str(tier).lower()
-
-                    if 'gold' in tier_lower or 'platinum' in tier_lower:
-                        tier_emoji = "🥇"
-                    elif 'silver' in tier_lower:
-                        tier_emoji = "🥈"
-                    elif 'bronze' in tier_lower:
-                        tier_emoji = "🥉"
-                    else:
-                        tier_emoji = "🏅"
-
-                    st.markdown(f"**{tier_emoji} {tier}**")
-                    for _, winner in tier_winners.iterrows():
-                        st.markdown(f"{winner['Club Name']}")
-                    st.markdown("")  # Spacer
-
+def leaderboard_excel_bytes(df_merged: pd.DataFrame, group_meta: dict, incentives_tiers: dict) -> bytes:
+    """
+    Returns the leaderboard workbook as bytes, cached under a hash of the merged data
+    so repeated downloads of the same data do not rebuild it.
+    """
+    data_hash = hashlib.sha1(pd.util.hash_pandas_object(df_merged, index=True).values.tobytes()).hexdigest()
+    cache_key = (data_hash, repr(group_meta), repr(incentives_tiers))
+
+    with _leaderboard_excel_lock:
+        cached = _leaderboard_excel_cache.get(cache_key)
+    if cached is not None:
+        count("excel_cache.hit")
+        return cached
+
+    count("excel_cache.miss")
+    content = generate_leaderboard_excel(df_merged, group_meta, incentives_tiers).getvalue()
+    with _leaderboard_excel_lock:
+        # Only the workbooks of the most recent data versions are worth keeping
+        while len(_leaderboard_excel_cache) >= 4:
+            _leaderboard_excel_cache.pop(next(iter(_leaderboard_excel_cache)))
+        _leaderboard_excel_cache[cache_key] = content
+    return content
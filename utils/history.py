@@ -0,0 +1,216 @@
+import os
+import re
+import hashlib
+import threading
+from typing import Optional
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from utils.snapshots import latest_snapshot, snapshot_dir
+from utils.schema import apply_schema
+
+# ------------------ Club History ------------------ #
+# Every archived club performance export (the "(YYYY-YYYY)/MM.csv" tree under HISTORY_DIR,
+# plus the closed quarters in the snapshot store) is folded into one club x period table.
+# The table is persisted as Parquet next to the snapshots and rebuilt only when one of
+# its source files changes, so trend queries never re-read the CSVs.
+
+QUARTER_OF_MONTH = {"09": "Q1", "12": "Q2", "03": "Q3", "06": "Q4"}
+
+# Older dashboard exports name the Level 4 columns after Level 5s
+LEGACY_COLUMNS = {
+    "Level 4s, Level 5s, or DTM award": "Level 4s, Path Completions, or DTM Awards",
+    "Add. Level 4s, Level 5s, or DTM award": "Add. Level 4s, Path Completions, or DTM award",
+}
+
+HISTORY_COLUMNS = ['Club Number', 'Club Name', 'Division', 'Area', 'Club Status', 'Mem. Base',
+                   'Active Members', 'Goals Met', 'Level 1s', 'Level 2s', 'Add. Level 2s', 'Level 3s',
+                   'Level 4s, Path Completions, or DTM Awards', 'Add. Level 4s, Path Completions, or DTM award',
+                   'New Members', 'Add. New Members', 'Off. Trained Round 1', 'Off. Trained Round 2',
+                   'Club Distinguished Status']
+
+# Year-to-date counts; their quarter-only value is the difference to the previous quarter of the season
+SEASON_CUMULATIVE = ['Level 1s', 'Level 2s', 'Add. Level 2s', 'Level 3s',
+                     'Level 4s, Path Completions, or DTM Awards', 'Add. Level 4s, Path Completions, or DTM award',
+                     'New Members', 'Add. New Members']
+
+_history = None
+_history_lock = threading.Lock()
+
+def history_dir() -> str:
+    return os.environ.get("HISTORY_DIR", os.path.join("testdata", "clubperformance"))
+
+def history_path() -> str:
+    return os.path.join(snapshot_dir(), "history.parquet")
+
+def period_ordinal(season: str, quarter: str) -> int:
+    """Sortable number of a (season, quarter): 2024-2025 Q2 -> 2024 * 4 + 1."""
+    return int(season.split("-")[0]) * 4 + int(quarter[1]) - 1
+
+def archived_exports() -> list[tuple[str, str, str]]:
+    """
+    Lists every archived export as (season, quarter, path). A quarter present in both
+    HISTORY_DIR and the snapshot store is read from HISTORY_DIR.
+    """
+    exports = {}
+    root = history_dir()
+    if os.path.isdir(root):
+        for folder in sorted(os.listdir(root)):
+            match = re.fullmatch(r"\((\d{4}-\d{4})\)", folder)
+            if not match:
+                continue
+            for filename in sorted(os.listdir(os.path.join(root, folder))):
+                quarter = QUARTER_OF_MONTH.get(filename[:-4]) if filename.endswith(".csv") else None
+                if quarter:
+                    exports[(match.group(1), quarter)] = os.path.join(root, folder, filename)
+
+    store = snapshot_dir()
+    if os.path.isdir(store):
+        for season in sorted(os.listdir(store)):
+            for quarter in ("Q1", "Q2", "Q3", "Q4"):
+                if (season, quarter) in exports:
+                    continue
+                path = latest_snapshot(season, quarter)
+                if path is not None:
+                    exports[(season, quarter)] = path
+
+    return [(season, quarter, path) for (season, quarter), path in sorted(exports.items())]
+
+def sources_fingerprint(exports: list[tuple[str, str, str]]) -> str:
+    """Hash of the paths, sizes and modification times of the archived exports."""
+    parts = []
+    for season, quarter, path in exports:
+        stat = os.stat(path)
+        parts.append(f"{season}|{quarter}|{path}|{stat.st_size}|{stat.st_mtime_ns}")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+def _read_export(path: str) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        df = pq.read_table(path, memory_map=True).to_pandas()
+    else:
+        df = pd.read_csv(path)
+    df = df.rename(columns=LEGACY_COLUMNS)
+    df = df[df["Club Name"].notna()]
+    df = df.reindex(columns=HISTORY_COLUMNS)
+    df["Club Number"] = pd.to_numeric(df["Club Number"], errors="coerce")
+    return df.dropna(subset=["Club Number"]).astype({"Club Number": int})
+
+def build_history(exports: list[tuple[str, str, str]] = None) -> pd.DataFrame:
+    """
+    Reads every archived export into one club x period table.
+
+    Besides the export columns, each row holds its 'Season', 'Quarter', 'Period' ordinal
+    and 'Period Label', the quarter-only value of every year-to-date count ('<column> (Quarter)'),
+    'Membership Growth' since the club's previous period, and the tier points that can be
+    derived from the export alone ('Pathways Pioneers (Export)', 'Leadership Innovators (Export)').
+
+    Returns:
+        pd.DataFrame: Sorted by Club Number and Period.
+    """
+    exports = archived_exports() if exports is None else exports
+    frames = []
+    for season, quarter, path in exports:
+        df = _read_export(path)
+        df["Season"] = season
+        df["Quarter"] = quarter
+        df["Period"] = period_ordinal(season, quarter)
+        frames.append(df)
+
+    if not frames:
+        return pd.DataFrame(columns=HISTORY_COLUMNS + ['Season', 'Quarter', 'Period', 'Period Label'])
+
+    df = pd.concat(frames, ignore_index=True)
+    numeric = [c for c in HISTORY_COLUMNS if c not in ('Club Number', 'Club Name', 'Division', 'Area', 'Club Status', 'Club Distinguished Status')]
+    df[numeric] = df[numeric].apply(pd.to_numeric, errors="coerce").fillna(0)
+    df = df.sort_values(["Club Number", "Period"], kind="mergesort").reset_index(drop=True)
+    df["Period Label"] = df["Season"] + " " + df["Quarter"]
+
+    # Quarter-only counts: the first export of a season is already quarter-only
+    in_season = df.groupby(["Club Number", "Season"], sort=False)
+    for col in SEASON_CUMULATIVE:
+        df[f"{col} (Quarter)"] = df[col] - in_season[col].shift(fill_value=0)
+
+    df["Membership Growth"] = df["Active Members"] - df.groupby("Club Number", sort=False)["Active Members"].shift()
+
+    df["Pathways Pioneers (Export)"] = (
+        df["Level 1s (Quarter)"] * 10
+        + (df["Level 2s (Quarter)"] + df["Add. Level 2s (Quarter)"]) * 20
+        + df["Level 3s (Quarter)"] * 30
+    )
+    status = df["Club Distinguished Status"].fillna("").astype(str).str.upper()
+    first_half = df["Quarter"].isin(["Q1", "Q2"]).to_numpy()
+    df["Leadership Innovators (Export)"] = (
+        np.where(first_half & (df["Off. Trained Round 1"] >= 7), 20, 0)
+        + np.where(~first_half & (df["Off. Trained Round 2"] >= 7), 20, 0)
+        + np.where(status.str.contains("P"), 50, 0)
+        + np.where(status.str.contains("S"), 100, 0)
+    )
+
+    schema_points = [c for c in df.columns if c.endswith("(Quarter)") or c.endswith("(Export)")]
+    return apply_schema(df, points=schema_points)
+
+def _save_history(df: pd.DataFrame, fingerprint: str) -> None:
+    path = history_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"fingerprint": fingerprint.encode()})
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+def _load_saved_history(fingerprint: str) -> Optional[pd.DataFrame]:
+    path = history_path()
+    if not os.path.exists(path):
+        return None
+    table = pq.read_table(path, memory_map=True)
+    if (table.schema.metadata or {}).get(b"fingerprint", b"").decode() != fingerprint:
+        return None
+    return table.to_pandas()
+
+def load_history() -> pd.DataFrame:
+    """
+    Returns the club x period table, rebuilding it only if an archived export changed.
+    The table is held in memory and on disk; callers must not modify it.
+    """
+    global _history
+
+    exports = archived_exports()
+    fingerprint = sources_fingerprint(exports)
+
+    with _history_lock:
+        if _history is not None and _history[0] == fingerprint:
+            return _history[1]
+
+        df = _load_saved_history(fingerprint)
+        if df is None:
+            df = build_history(exports)
+            try:
+                _save_history(df, fingerprint)
+            except Exception:
+                pass  # The on-disk copy only saves the next process a rebuild
+        _history = (fingerprint, df)
+        return df
+
+# ------------------ Trend Queries ------------------ #
+def club_trend(history: pd.DataFrame, club_number: int) -> pd.DataFrame:
+    """All periods of one club, oldest first."""
+    return history[history["Club Number"] == club_number].sort_values("Period").reset_index(drop=True)
+
+def period_over_period(history: pd.DataFrame, column: str, periods: int = 1) -> pd.Series:
+    """Change of `column` over the previous `periods` periods of each club, aligned with history."""
+    return history.groupby("Club Number", sort=False)[column].diff(periods)
+
+def rolling_mean(history: pd.DataFrame, column: str, window: int = 4) -> pd.Series:
+    """Mean of `column` over each club's last `window` periods, aligned with history."""
+    return (
+        history.groupby("Club Number", sort=False)[column]
+        .rolling(window, min_periods=1).mean()
+        .reset_index(level=0, drop=True)
+        .reindex(history.index)
+    )
+
+def district_trend(history: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """District totals of `columns` per period, oldest first, indexed by Period Label."""
+    totals = history.groupby(["Period", "Period Label"], observed=True)[columns].sum().reset_index()
+    return totals.sort_values("Period").set_index("Period Label")[columns]
@@ -0,0 +1,136 @@
+import os
+import time
+import threading
+import numpy as np
+import pandas as pd
+from utils.helpers import get_merged_club_data, pipeline_version
+from utils.diagnostics import count
+from utils.shared_cache import single_flight
+from utils.metrics import rank_leaderboards
+from utils.groups import group_meta, incentives_tiers
+
+def _ranked_frame(df_merged: pd.DataFrame, run: pd.DataFrame, tier_name: str) -> pd.DataFrame:
+    """Builds one leaderboard from a run of the ranking kernel; rows are taken by position, no merge."""
+    df_ranked = df_merged.iloc[run['Row'].to_numpy()].reset_index(drop=True)
+    df_ranked["Group Rank"] = run['Group Rank'].to_numpy()
+    df_ranked["Top 3"] = run['Top N'].to_numpy()
+    df_ranked[['Total Club Points', tier_name]] = df_ranked[['Total Club Points', tier_name]].astype(int)
+    return df_ranked
+
+def rank_all_leaderboards(df_merged: pd.DataFrame) -> dict:
+    """
+    Ranks every (Club Group, tier) leaderboard with one pass of the ranking kernel.
+
+    Returns:
+        dict: (group name, tier name) -> all clubs of the group in display order with 'Group Rank' and 'Top 3'.
+    """
+    tier_names = [tier_info['Name'] for tier_info in incentives_tiers.values()]
+    ranking = rank_leaderboards(df_merged, tier_names, top_n=3)
+    runs = {key: run for key, run in ranking.groupby(['Club Group', 'Tier'], sort=False, observed=True)}
+
+    empty_run = ranking.iloc[:0]
+    return {
+        (group_info['Name'], tier_name): _ranked_frame(df_merged, runs.get((group_info['Name'], tier_name), empty_run), tier_name)
+        for group_info in group_meta.values()
+        for tier_name in tier_names
+    }
+
+TOP3_MARKER = "🏅"
+
+def leaderboard_display_frame(df_ranked: pd.DataFrame, tier_name: str) -> pd.DataFrame:
+    """
+    The table shown on the leaderboard page: Top 3 clubs are marked in a text column
+    rather than by a per-row Styler, so rendering is plain data whatever the group size.
+    """
+    return pd.DataFrame({
+        'Top 3': np.where(df_ranked['Top 3'].to_numpy(dtype=bool), TOP3_MARKER, ""),
+        'Club Name': df_ranked['Club Name'].to_numpy(),
+        tier_name: df_ranked[tier_name].to_numpy(),
+        'Total Club Points': df_ranked['Total Club Points'].to_numpy(),
+    })
+
+# ------------------ Leaderboard Materializer ------------------ #
+# The full pipeline runs once per change in the source data; every (Club Group, tier)
+# ranking is stored so that page reruns are a dictionary lookup. Builds are numbered in
+# the order their sources were checked, so a slow build of older data never replaces a newer one.
+
+_materialized = None
+_materialized_sequence = 0
+_build_sequence = 0
+_materialize_lock = threading.Lock()
+_refresh_thread = None
+
+def _build_leaderboards(version: str) -> dict:
+    df_merged, update_date = get_merged_club_data(version)
+    leaderboards = rank_all_leaderboards(df_merged)
+    return {
+        'version': version,
+        'merged': df_merged,
+        'update_date': update_date,
+        'built_at': time.time(),
+        'leaderboards': leaderboards,
+        'display': {key: leaderboard_display_frame(df_ranked, key[1]) for key, df_ranked in leaderboards.items()},
+    }
+
+def materialize_leaderboards(force: bool = False) -> dict:
+    """
+    Rebuilds the ranked leaderboards if the source data changed since the last build.
+    Sources are refreshed and the build runs without holding the lock, so readers keep
+    getting the previous build meanwhile; the lock is only taken to swap in the new one,
+    unless a build of newer sources was swapped in first.
+
+    Returns:
+        dict: {'version', 'merged', 'update_date', 'built_at', 'leaderboards', 'display'} where
+        'leaderboards' maps (group name, tier name) to the ranked frame and 'display'
+        to its leaderboard_display_frame.
+    """
+    global _materialized, _materialized_sequence, _build_sequence
+
+    version = pipeline_version()
+    with _materialize_lock:
+        _build_sequence += 1
+        sequence = _build_sequence
+    current = _materialized
+    if not force and current is not None and current['version'] == version:
+        count("leaderboards.reused")
+        return current
+
+    count("leaderboards.rebuilt")
+    # Callers that find the same new version wait for one build
+    built = single_flight(("leaderboards", version), lambda: _build_leaderboards(version))
+    with _materialize_lock:
+        if _materialized is None or sequence >= _materialized_sequence:
+            _materialized, _materialized_sequence = built, sequence
+        else:
+            count("leaderboards.stale_build_dropped")
+        return _materialized
+
+def _refresh_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            materialize_leaderboards()
+        except Exception:
+            pass  # Keep serving the previous build; the next cycle retries
+
+def start_background_materializer() -> None:
+    """
+    Starts (once per process) a daemon thread that re-checks the sources every
+    LEADERBOARD_REFRESH_SECONDS and rebuilds the leaderboards when they change.
+    """
+    global _refresh_thread
+
+    with _materialize_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return
+        interval = float(os.environ.get("LEADERBOARD_REFRESH_SECONDS", os.environ.get("SOURCE_CACHE_TTL_SECONDS", 300)))
+        _refresh_thread = threading.Thread(target=_refresh_loop, args=(interval,), daemon=True, name="leaderboard-materializer")
+        _refresh_thread.start()
+
+def get_materialized_leaderboards() -> dict:
+    """
+    Returns the latest materialized leaderboards without recomputing them.
+    The first call in a process builds them synchronously and starts the background refresh.
+    """
+    start_background_materializer()
+    return _materialized if _materialized is not None else materialize_leaderboards()
@@ -1,51 +1,94 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime
-import streamlit as st
+from typing import Optional
 import os
+import warnings
+from pandas.tseries.api import guess_datetime_format
+from utils.diagnostics import instrument
+from utils.schema import POINTS_DTYPE, fill_numeric
 
-def compute_has_TC(
+# ---- Triple Crown ---- #
+# A member earns a Triple Crown by completing any 3 consecutive levels (1-2-3, 2-3-4 or 3-4-5)
+# of the same path. Levels completed per (club, member, path) are folded into a 5-bit mask,
+# so a run of three is simply mask & (mask >> 1) & (mask >> 2).
+TC_POINTS_PER_MEMBER = 60
+
+def _has_level_run(masks: np.ndarray) -> np.ndarray:
+    return (masks & (masks >> 1) & (masks >> 2)) != 0
+
+def triple_crown_members(
     df: pd.DataFrame,
-    col_club: str = "Name",
+    start_date: Optional[datetime] = None,
+    col_club: str = "Club Number",
     col_member: str = "Member",
-    col_award: str = "Award"
-) -> pd.Series:
+    col_award: str = "Award",
+    col_date: str = "Date"
+) -> pd.DataFrame:
     """
-    Compute has_TC flag:
-    A club gets TC if any single Member has the same prefix
-    with ANY 3 consecutive level numbers (e.g., 1-2-3, 2-3-4, or 3-4-5).
+    Finds members who completed 3 consecutive levels of one path.
+
+    Args:
+        df (pd.DataFrame): Education achievements log, one row per award.
+        start_date (datetime, optional): If given, only runs completed on or after this date
+            count; members whose run already existed before it are excluded.
+
+    Returns:
+        pd.DataFrame: Unique (club, member) pairs holding a Triple Crown.
     """
+    if df.empty or col_member not in df.columns:
+        return pd.DataFrame(columns=[col_club, col_member])
+
+    # Parse each distinct award code once: "PM3" -> path "PM", level bit 1 << 2
+    award_codes, awards = pd.factorize(df[col_award])
+    parsed = pd.Series(awards).astype(str).str.upper().str.strip().str.extract(r"^([A-Z]+)([1-5])$")
+    path_of_award, _ = pd.factorize(parsed[0])
+    level_of_award = pd.to_numeric(parsed[1]).fillna(0).astype(np.int64).to_numpy()
+    bit_of_award = np.where(level_of_award > 0, np.left_shift(1, np.maximum(level_of_award - 1, 0)), 0)
+
+    valid = (award_codes >= 0) & df[col_club].notna().to_numpy() & df[col_member].notna().to_numpy()
+    valid[valid] = bit_of_award[award_codes[valid]] > 0
+
+    club_codes, clubs = pd.factorize(df[col_club])
+    member_codes, members = pd.factorize(df[col_member])
+    levels = pd.DataFrame({
+        "club": club_codes[valid],
+        "member": member_codes[valid],
+        "path": path_of_award[award_codes[valid]],
+        "bit": bit_of_award[award_codes[valid]],
+    })
+    if start_date is not None:
+        levels["prior"] = (pd.to_datetime(df[col_date]) < start_date).to_numpy()[valid]
 
-    # Extract prefix and numeric level (1–5)
-    s = df[col_award].astype(str).str.upper().str.strip()
-    extracted = s.str.extract(r"^([A-Z]+)([1-5])$")
-    df["_prefix"], df["_lvl"] = extracted[0], extracted[1]
-
-    # Convert level to int for numeric comparison
-    df["_lvl"] = df["_lvl"].astype(float)
-
-    # For each Name + Member + prefix → check if any 3 consecutive levels exist
-    def has_three_consecutive(levels):
-        levels = sorted(set(int(l) for l in levels if not pd.isna(l)))
-        return any(
-            levels[i] + 1 in levels and levels[i] + 2 in levels
-            for i in range(len(levels))
-        )
-
-    tc_per_member_prefix = (
-        df.dropna(subset=["_prefix", "_lvl", col_member])
-          .groupby([col_club, col_member, "_prefix"])["_lvl"]
-          .apply(has_three_consecutive)
-          .reset_index(name="has_TC_member_prefix_full")
-    )
+    # OR the level bits per (club, member, path); bits are distinct after de-duplication, so sum == OR
+    keys = ["club", "member", "path"]
+    masks = levels.drop_duplicates(keys + ["bit"]).groupby(keys, sort=False)["bit"].sum()
+    earned = pd.Series(_has_level_run(masks.to_numpy()), index=masks.index)
 
-    # A Name earns TC if any single member completes 3 consecutive levels in one prefix
-    has_tc_by_name = (
-        tc_per_member_prefix.groupby(col_club)["has_TC_member_prefix_full"]
-                            .any()
-    )
+    if start_date is not None:
+        prior = levels[levels["prior"]].drop_duplicates(keys + ["bit"]).groupby(keys, sort=False)["bit"].sum()
+        prior_masks = prior.reindex(masks.index, fill_value=0).to_numpy()
+        earned &= ~_has_level_run(prior_masks)
+
+    winners = earned[earned].index.to_frame(index=False)[["club", "member"]].drop_duplicates()
+    return pd.DataFrame({
+        col_club: clubs.take(winners["club"].to_numpy()),
+        col_member: members.take(winners["member"].to_numpy()),
+    })
+
+@instrument("compute_triple_crown_points")
+def compute_triple_crown_points(df: pd.DataFrame, start_date: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    Returns Club Number | TC Points
+    - 60 points for every member of the club who earned a Triple Crown
+    """
+    CLUB_NUMBER = "Club Number"
 
-    return df[col_club].map(has_tc_by_name).fillna(False)
+    tc_members = triple_crown_members(df, start_date=start_date, col_club=CLUB_NUMBER)
+    tc_points = tc_members.groupby(CLUB_NUMBER).size() * TC_POINTS_PER_MEMBER
+    return tc_points.rename("TC Points").reset_index()
 
+@instrument("compute_award_points")
 def compute_award_points(df: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
     """
     Compute award-based points per club.
@@ -56,7 +99,7 @@ def compute_award_points(df: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
     - Level 5 (50 points): if ANY of these codes appear: 
         EC5, EH5, IP5, LD5, MS5, PM5, SR5, VC5
     - DTM (60 points)
-    - TC  (60 points, computed separately from df_tc)
+    - TC  (60 points per member, precomputed in df_tc by compute_triple_crown_points)
     - FF  (30 points)
     """
 
@@ -64,13 +107,12 @@ def compute_award_points(df: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
 
     # Case when df is empty: return TC scores only
     if df.empty:
-        tc_scores = calculate_club_points_only_tc(df_tc)
         return pd.DataFrame({
-            CLUB_NUMBER: tc_scores[CLUB_NUMBER],
+            CLUB_NUMBER: df_tc[CLUB_NUMBER],
             "L4 Points": 0,
             "L5 Points": 0,
             "DTM Points": 0,
-            "TC Points": tc_scores["TC Points"].astype(int),
+            "TC Points": df_tc["TC Points"].astype(int),
             "Early10_Distinguished": 0
         })
 
@@ -91,7 +133,9 @@ def compute_award_points(df: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
         .reset_index()
     )
 
-    club_flags["TC Points"] = calculate_club_points(club_flags, df_tc)
+    club_flags = club_flags.merge(df_tc, on=CLUB_NUMBER, how="outer")
+    club_flags[["has_L4", "has_L5", "has_DTM", "has_FF"]] = club_flags[["has_L4", "has_L5", "has_DTM", "has_FF"]].fillna(False).astype(bool)
+    club_flags["TC Points"] = club_flags["TC Points"].fillna(0)
 
     return pd.DataFrame({
         CLUB_NUMBER: club_flags[CLUB_NUMBER],
@@ -104,7 +148,11 @@ def compute_award_points(df: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
 
 
 
-def calculate_points(df: pd.DataFrame, df_edu: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
+@instrument("calculate_performance_points")
+def calculate_performance_points(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds the points that depend only on a club's own performance row (levels and officer training).
+    """
     # L1
     df['L1 Points'] = df['Level 1s'] * 10
     
@@ -114,8 +162,6 @@ def calculate_points(df: pd.DataFrame, df_edu: pd.DataFrame, df_tc: pd.DataFrame
     # L3
     df['L3 Points'] = df['Level 3s'] * 30
 
-    df_edu_points = compute_award_points(df_edu, df_tc)
-
     # COT Training Rounds
     current_quarter = os.environ.get("Current_Quarter")
     df['COT R1 Points'] = df['Off. Trained Round 1'].apply(
@@ -124,71 +170,187 @@ def calculate_points(df: pd.DataFrame, df_edu: pd.DataFrame, df_tc: pd.DataFrame
     df['COT R2 Points'] = df['Off. Trained Round 2'].apply(
         lambda x: 20 if x >= 7 and current_quarter in ["Q3", "Q4"] else 0
     )
-    
-    df = df.merge(df_edu_points, left_on="Club Number", right_on="Club Number", how="left").fillna(0)
-
     return df
 
-# ---- 1. Helper to check date range ---- #
-def is_within_time_period(x: pd.Series, start_date: datetime, end_date: datetime) -> bool:
+@instrument("merge_award_points")
+def merge_award_points(df: pd.DataFrame, df_edu: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
     """
-    Returns True if at least one valid contest date falls within given range.
+    Adds the education award points (L4, L5, DTM, TC, FF) computed from the achievements log.
     """
-    if x.empty or x.dropna().empty:
-        return False
-
-    dates = pd.to_datetime(x, errors='coerce', dayfirst=False)
-    return (dates.notna() & (dates >= start_date) & (dates <= end_date)).any()
+    df_edu_points = compute_award_points(df_edu, df_tc)
+    return fill_numeric(df.merge(df_edu_points, left_on="Club Number", right_on="Club Number", how="left"))
 
+def calculate_points(df: pd.DataFrame, df_edu: pd.DataFrame, df_tc: pd.DataFrame) -> pd.DataFrame:
+    df = calculate_performance_points(df)
+    return merge_award_points(df, df_edu, df_tc)
 
-def calculate_contest_points(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Returns one row per club with four contest scores as columns.
-    Score = 10 if contest happened within given date window, otherwise 0.
-    No double points for duplicates (handled by groupby).
-    """
+# ---- 1. Helpers to check date range ---- #
 
-    # ---- 2. load date window from secrets ---- #
+def quarter_window() -> tuple[datetime, datetime]:
+    """Returns the (start, end) datetimes of the current quarter from the environment."""
     start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
     end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
+    return start_date, end_date
 
-    COL_CLUB = "Select Your Club"
-    CLUB_NUMBER = "Club Number"
+def _swap_day_month(fmt: str) -> str:
+    return fmt.replace("%d", "%_").replace("%m", "%d").replace("%_", "%m")
 
-    date_cols = {
-        "Humorous Contest": "Date the Humorous Speech Contest was held",
-        "TableTopics Contest": "Date the Table Topics Contest was held",
-        "Evaluation Contest": "Date the Evaluation Contest was held",
-        "International Contest": "Date the International Speech Contest was held",
-    }
+def _detect_date_format(values: pd.Series) -> Optional[tuple[str, bool]]:
+    """
+    Detects (format, dayfirst) for a column of date strings.
+    Numeric day/month dates are read day-first only if some value cannot be month-first.
+    """
+    sample = values.dropna().astype(str).str.strip()
+    sample = sample[sample != ""]
+    if sample.empty:
+        return None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # The day/month order is settled below
+        fmt = guess_datetime_format(sample.iloc[0], dayfirst=False)
+
+    dayfirst = False
+    if fmt is not None and fmt[:2] in ("%d", "%m"):
+        fields = sample.str.extract(r"^(\d{1,2})\D(\d{1,2})\D").apply(pd.to_numeric, errors="coerce")
+        dayfirst = bool((fields[0] > 12).any() and not (fields[1] > 12).any())
+        if fmt.startswith("%d") != dayfirst:
+            fmt = _swap_day_month(fmt)
+    return fmt, dayfirst
+
+def parse_dates(x: pd.Series) -> pd.Series:
+    """
+    Parses a column of dates in a single vectorized pass.
 
-    # ---- 3. Handle empty input ---- #
-    if df.empty:
-        return pd.DataFrame(columns=[CLUB_NUMBER] + list(date_cols.keys()))
+    The format is detected from the column itself on every call: columns with the same
+    name in different sheets (e.g. "Timestamp") need not share a format. Values that do
+    not match it are parsed individually. Timezone-aware values are converted to naive
+    UTC so they compare with plain datetimes.
+    """
+    detected = _detect_date_format(x)
+    fmt, dayfirst = detected if detected is not None else (None, False)
+    if fmt is not None:
+        dates = pd.to_datetime(x, errors='coerce', format=fmt, utc=True)
+        unparsed = dates.isna() & x.notna()
+        if unparsed.any():
+            dates[unparsed] = pd.to_datetime(x[unparsed], errors='coerce', format='mixed', dayfirst=dayfirst, utc=True)
+    else:
+        dates = pd.to_datetime(x, errors='coerce', format='mixed', dayfirst=dayfirst, utc=True)
+
+    return dates.dt.tz_localize(None)
+
+def date_window_mask(x: pd.Series, start_date: datetime, end_date: datetime) -> pd.Series:
+    """
+    Returns a boolean mask that is True where the date falls within the given range.
+    """
+    if x.empty:
+        return pd.Series(False, index=x.index)
 
-    # ---- 4. Extract club number + name ---- #
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split("---- ").str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(" ----").str[0].str.strip()
+    dates = parse_dates(x)
+    return dates.notna() & (dates >= start_date) & (dates <= end_date)
 
-    # ---- 5. Base scoring DF ---- #
-    scores = pd.DataFrame()
-    scores[CLUB_NUMBER] = df[CLUB_NUMBER].unique()
+def is_within_time_period(x: pd.Series, start_date: datetime, end_date: datetime) -> bool:
+    """
+    Returns True if at least one valid contest date falls within given range.
+    """
+    return bool(date_window_mask(x, start_date, end_date).any())
+
+
+# ---- 2. Form scoring rules ---- #
+# Each rule awards points to a club for its Google Form submissions dated within the quarter.
+#   source:   env var holding the form responses sheet ID
+#   date_col: column holding the date that must fall within the quarter
+#   agg:      "max" awards the points once, "sum" once per submission,
+#             "count" once per submission up to `cap` submissions
+SCORING_RULES = [
+    {"name": "Humorous Contest", "tier": "Pathways Pioneers", "source": "GOOGLE_DRIVE_FILE_ID_CONTESTS",
+     "date_col": "Date the Humorous Speech Contest was held", "points": 10, "agg": "max"},
+    {"name": "TableTopics Contest", "tier": "Pathways Pioneers", "source": "GOOGLE_DRIVE_FILE_ID_CONTESTS",
+     "date_col": "Date the Table Topics Contest was held", "points": 10, "agg": "max"},
+    {"name": "Evaluation Contest", "tier": "Pathways Pioneers", "source": "GOOGLE_DRIVE_FILE_ID_CONTESTS",
+     "date_col": "Date the Evaluation Contest was held", "points": 10, "agg": "max"},
+    {"name": "International Contest", "tier": "Pathways Pioneers", "source": "GOOGLE_DRIVE_FILE_ID_CONTESTS",
+     "date_col": "Date the International Speech Contest was held", "points": 10, "agg": "max"},
+    {"name": "MOT", "tier": "Leadership Innovators", "source": "GOOGLE_DRIVE_FILE_ID_MOMENTS_OF_TRUTH",
+     "date_col": "Date the MOT session was conducted", "points": 15, "agg": "max"},
+    {"name": "Pathways_Completion_Celebration", "tier": "Leadership Innovators", "source": "GOOGLE_DRIVE_FILE_ID_PATHWAYS_COMPLETION_CELEBRATION",
+     "date_col": "Date of the celebration event", "points": 10, "agg": "max"},
+    {"name": "Mentorship_Programme", "tier": "Leadership Innovators", "source": "GOOGLE_DRIVE_FILE_ID_MENTORSHIP_PROGRAM",
+     "date_col": "Timestamp", "points": 10, "agg": "max"},
+    {"name": "Distinguished_Club_Partners", "tier": "Leadership Innovators", "source": "GOOGLE_DRIVE_FILE_ID_DCP",
+     "date_col": "Timestamp", "points": 50, "agg": "max"},
+    {"name": "Successful_Transition_Handover", "tier": "Leadership Innovators", "source": "GOOGLE_DRIVE_FILE_ID_STH",
+     "date_col": "Date the transition meeting or handover session took place", "points": 20, "agg": "max"},
+    {"name": "Quality_Initiatives", "tier": "Excellence Champions", "source": "GOOGLE_DRIVE_FILE_ID_QIS",
+     "date_col": "Timestamp", "points": 15, "agg": "sum"},
+    {"name": "Member_Onboarding", "tier": "Excellence Champions", "source": "GOOGLE_DRIVE_FILE_ID_MEMBER_ONBOARDING",
+     "date_col": "Timestamp", "points": 10, "agg": "max"},
+]
+
+def rules_for_tier(tier: str) -> list[dict]:
+    return [rule for rule in SCORING_RULES if rule["tier"] == tier]
+
+def club_numbers_from_form(df: pd.DataFrame, col_club: str = "Select Your Club") -> pd.Series:
+    """
+    Extracts the numeric Club Number from form answers like 'Club Name ---- 1234567'.
+    Answers without a valid number become NaN.
+    """
+    return pd.to_numeric(df[col_club].astype(str).str.split('---- ').str[-1].str.strip(), errors='coerce')
 
-    # ---- 6. Compute contest scores ---- #
-    for contest, col in date_cols.items():
-        scores_contest = (
-            df.groupby(CLUB_NUMBER)[col]
-              .apply(lambda x: 10 if is_within_time_period(x, start_date, end_date) else 0)
-              .reset_index(name=contest)
-        )
+@instrument("evaluate_scoring_rules")
+def evaluate_scoring_rules(frames: dict[str, pd.DataFrame], rules: list[dict]) -> pd.DataFrame:
+    """
+    Scores every rule in one vectorized pass.
+
+    Args:
+        frames (dict): Form responses keyed by rule source.
+        rules (list[dict]): Rules from SCORING_RULES.
+
+    Returns:
+        pd.DataFrame: One row per club with 'Club Number' and one points column per rule.
+    """
+    CLUB_NUMBER = "Club Number"
+    start_date, end_date = quarter_window()
+
+    # ---- Collect (club, rule) pairs for every qualifying submission ---- #
+    hits = []
+    for source in dict.fromkeys(rule["source"] for rule in rules):
+        df = frames.get(source)
+        if df is None or df.empty or "Select Your Club" not in df.columns:
+            continue
+
+        club_numbers = club_numbers_from_form(df)
+        for rule in (r for r in rules if r["source"] == source):
+            if rule["date_col"] not in df.columns:
+                continue
+            mask = date_window_mask(df[rule["date_col"]], start_date, end_date) & club_numbers.notna()
+            hits.append(pd.DataFrame({CLUB_NUMBER: club_numbers[mask].astype(int), "rule": rule["name"]}))
+
+    names = [rule["name"] for rule in rules]
+    if not hits:
+        return pd.DataFrame(columns=[CLUB_NUMBER] + names)
+
+    # ---- Count submissions per club and rule, then cap and weight per rule ---- #
+    counts = (
+        pd.concat(hits, ignore_index=True)
+          .groupby([CLUB_NUMBER, "rule"]).size()
+          .unstack(fill_value=0)
+          .reindex(columns=names, fill_value=0)
+    )
 
-        scores = scores.merge(scores_contest, on=CLUB_NUMBER)
+    def submission_cap(rule):
+        if rule["agg"] == "max":
+            return 1
+        if rule["agg"] == "count":
+            return rule["cap"]
+        return float("inf")
 
-    # Numeric club number
-    scores[CLUB_NUMBER] = scores[CLUB_NUMBER].astype(int)
+    caps = pd.Series({rule["name"]: submission_cap(rule) for rule in rules})
+    points = pd.Series({rule["name"]: rule["points"] for rule in rules})
 
-    return scores
+    scores = counts.clip(upper=caps, axis=1).mul(points, axis=1).astype(POINTS_DTYPE)
+    return scores.rename_axis(columns=None).reset_index()
 
+@instrument("assign_grouping")
 def assign_grouping(df: pd.DataFrame) -> pd.DataFrame:
     # Define group by active members
     def get_group(members):
@@ -224,294 +386,141 @@ def assign_grouping(df: pd.DataFrame) -> pd.DataFrame:
 
     return df
 
-def mot_scores(df: pd.DataFrame) -> pd.DataFrame:
-    COL_CLUB = "Select Your Club"
-    COL_DATE = "Date the MOT session was conducted"
+# The membership list has one row per member of the district, so it is folded into a
+# per-club aggregate one chunk at a time: the running state is a sorted array of club
+# numbers and a parallel boolean array telling whether every member seen so far is enrolled.
+PATHWAY_ENROLLMENT_POINTS = 10
 
-    # If input is empty → return empty with expected columns
-    if df.empty:
-        return pd.DataFrame(columns=["Club Name", "MOT"])
-    
-    CLUB_NUMBER = "Club Number"
-    COL_DATE = "Date the MOT session was conducted"
+def empty_pathway_enrollment() -> tuple[np.ndarray, np.ndarray]:
+    """The running aggregate before any member has been seen."""
+    return np.empty(0, dtype=np.int64), np.empty(0, dtype=bool)
 
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split('---- ').str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(' ----').str[0].str.strip()
-
-    start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
-    end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
-
-    df = df[df[COL_DATE].apply(lambda x: is_within_time_period(pd.Series([x]), start_date, end_date))]
-
-    df_out = pd.DataFrame({
-        CLUB_NUMBER: df[CLUB_NUMBER],
-        "MOT": 15
-    })
-
-    df_out[CLUB_NUMBER] = df_out[CLUB_NUMBER].astype(int)
-
-    return df_out.groupby(CLUB_NUMBER, as_index=False).max()
-
-def pathways_completion_scores(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Returns Club | Pathways_Completion_Celebration
-    - 10 points if the club is listed (i.e., participated)
+def update_pathway_enrollment(
+    state: tuple[np.ndarray, np.ndarray],
+    club_numbers: pd.Series,
+    enrolled: pd.Series
+) -> tuple[np.ndarray, np.ndarray]:
     """
+    Folds one chunk of members into the running per-club aggregate.
 
-    COL_CLUB = "Select Your Club"
-    CLUB_NUMBER = "Club Number"
-    COL_DATE = "Date of the celebration event"
-
-    if df.empty:
-        return pd.DataFrame(columns=["Club Number", "Pathways_Completion_Celebration"])
-
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split('---- ').str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(' ----').str[0].str.strip()
-
-    start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
-    end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
-
-    df = df[df[COL_DATE].apply(lambda x: is_within_time_period(pd.Series([x]), start_date, end_date))]
+    Args:
+        state: (club numbers, all enrolled) from empty_pathway_enrollment or a previous call.
+        club_numbers (pd.Series): Club number of each member, as text or numbers.
+        enrolled (pd.Series): "Is Pathways Enrolled" of each member; only "Yes" counts.
 
-    df_out = pd.DataFrame({
-        CLUB_NUMBER: df[CLUB_NUMBER],
-        "Pathways_Completion_Celebration": 10
-    })
-
-    df_out[CLUB_NUMBER] = df_out[CLUB_NUMBER].astype(int)
-
-    return df_out.groupby(CLUB_NUMBER, as_index=False).max()
-
-def mentorship_programme_scores(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Returns Club | Mentorship_Programme
-    - 10 points if the club is listed (i.e., participated)
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The updated state.
     """
+    numbers = pd.to_numeric(club_numbers.astype("string").str.strip(), errors="coerce")
+    valid = numbers.notna().to_numpy()
+    yes = enrolled.astype("string").str.strip().str.lower().eq("yes").fillna(False).to_numpy(dtype=bool)
 
-    COL_CLUB = "Select Your Club"
-    CLUB_NUMBER = "Club Number"
-    COL_DATE = "Timestamp"
-
-    if df.empty:
-        return pd.DataFrame(columns=["Club Number", "Mentorship_Programme"])
-
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split('---- ').str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(' ----').str[0].str.strip()
-
-    start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
-    end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
-
-    df = df[df[COL_DATE].apply(lambda x: is_within_time_period(pd.Series([x]), start_date, end_date))]
-
-    df_out = pd.DataFrame({
-        CLUB_NUMBER: df[CLUB_NUMBER],
-        "Mentorship_Programme": 10
-    })
+    clubs = np.concatenate([state[0], numbers.to_numpy()[valid].astype(np.int64)])
+    flags = np.concatenate([state[1], yes[valid]])
+    order = np.argsort(clubs, kind="stable")
+    clubs, flags = clubs[order], flags[order]
 
-    df_out[CLUB_NUMBER] = df_out[CLUB_NUMBER].astype(int)
+    starts = np.flatnonzero(np.r_[True, clubs[1:] != clubs[:-1]]) if len(clubs) else np.empty(0, dtype=np.intp)
+    return clubs[starts], np.logical_and.reduceat(flags, starts)
 
-    return df_out.groupby(CLUB_NUMBER, as_index=False).max()
-
-def distinguished_club_partners_scores(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Returns Club | Distinguished_Club_Partners
-    - 50 points if the club is listed (i.e., helped another club become distinguished)
-    """
-    COL_CLUB = "Select Your Club"
-    CLUB_NUMBER = "Club Number"
-    COL_DATE = "Timestamp"
-
-    if df.empty:
-        return pd.DataFrame(columns=["Club Number", "Distinguished_Club_Partners"])
-
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split('---- ').str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(' ----').str[0].str.strip()
-
-    start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
-    end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
-
-    df = df[df[COL_DATE].apply(lambda x: is_within_time_period(pd.Series([x]), start_date, end_date))]
-
-    df_out = pd.DataFrame({
-        "Club Number": df[CLUB_NUMBER],
-        "Distinguished_Club_Partners": 50
-    })
-
-    df_out[CLUB_NUMBER] = df_out[CLUB_NUMBER].astype(int)
-
-    return df_out.groupby(CLUB_NUMBER, as_index=False).max()
-
-def successful_handover_scores(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Returns Club | Successful_Transition_Handover
-    - 20 points if the club is listed (i.e., submitted handover report)
-    """
-    COL_CLUB = "Select Your Club"
-    CLUB_NUMBER = "Club Number"
-    COL_DATE = "Date the transition meeting or handover session took place"
-
-    if df.empty:
-        return pd.DataFrame(columns=["Club Number", "Successful_Transition_Handover"])
-
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split('---- ').str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(' ----').str[0].str.strip()
-
-    start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
-    end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
-
-    df = df[df[COL_DATE].apply(lambda x: is_within_time_period(pd.Series([x]), start_date, end_date))]
-
-    df_out = pd.DataFrame({
-        CLUB_NUMBER: df[CLUB_NUMBER],
-        "Successful_Transition_Handover": 20
-    })
-
-    df_out[CLUB_NUMBER] = df_out[CLUB_NUMBER].astype(int)
-
-    return df_out.groupby(CLUB_NUMBER, as_index=False).max()
-
-def quality_initiatives_scores(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Returns Club | Quality_Initiatives
-    - 15 points for every entry a club submits a quality initiative (e.g., Speakathon, themed meeting)
-    """
-    COL_CLUB = "Select Your Club"
-    CLUB_NUMBER = "Club Number"
-    COL_DATE = "Timestamp"
-
-    if df.empty:
-        return pd.DataFrame(columns=["Club Number", "Quality_Initiatives"])
-
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split('---- ').str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(' ----').str[0].str.strip()
-
-    start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
-    end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
-
-    df = df[df[COL_DATE].apply(lambda x: is_within_time_period(pd.Series([x]), start_date, end_date))]
-
-    df_out = pd.DataFrame({
-        "Club Number": df[CLUB_NUMBER],
-        "Quality_Initiatives": 15
-    })
-
-    df_out[CLUB_NUMBER] = df_out[CLUB_NUMBER].astype(int)
-
-    return df_out.groupby(CLUB_NUMBER, as_index=False).sum()
-
-def member_onboarding_scores(df: pd.DataFrame) -> pd.DataFrame:
-    """
-    Returns Club | Member_Onboarding
-    - 10 points if the club reported having a member onboarding program
-    """
-    COL_CLUB = "Select Your Club"
-    CLUB_NUMBER = "Club Number"
-    COL_DATE = "Timestamp"
-
-    if df.empty:
-        return pd.DataFrame(columns=["Club Number", "Member_Onboarding"])
-
-    df[CLUB_NUMBER] = df[COL_CLUB].str.split('---- ').str[-1].str.strip()
-    df[COL_CLUB] = df[COL_CLUB].str.split(' ----').str[0].str.strip()
-
-    start_date = datetime.strptime(os.environ.get("QUARTER_START_DATE"), "%Y-%m-%d")
-    end_date   = datetime.strptime(os.environ.get("QUARTER_END_DATE"), "%Y-%m-%d")
-
-    df = df[df[COL_DATE].apply(lambda x: is_within_time_period(pd.Series([x]), start_date, end_date))]
-
-    df_out = pd.DataFrame({
-        CLUB_NUMBER: df[CLUB_NUMBER],
-        "Member_Onboarding": 10
+def pathway_enrollment_frame(state: tuple[np.ndarray, np.ndarray]) -> pd.DataFrame:
+    """Club Number | 100%_Pathway_Registration of a running aggregate."""
+    clubs, all_enrolled = state
+    return pd.DataFrame({
+        "Club Number": clubs,
+        "100%_Pathway_Registration": np.where(all_enrolled, PATHWAY_ENROLLMENT_POINTS, 0),
     })
 
-    df_out[CLUB_NUMBER] = df_out[CLUB_NUMBER].astype(int)
-
-    return df_out.groupby(CLUB_NUMBER, as_index=False).max()
-
+@instrument("pathway_enrollment_scores")
 def pathway_enrollment_scores(df: pd.DataFrame) -> pd.DataFrame:
     """
     Returns Club Number | 100%_Pathway_Registration
     - 10 points if all members in a club are enrolled in Pathways
+
+    For a membership list already in memory; the loader streams the file through
+    update_pathway_enrollment instead.
     """
-    
+    CLUB_NUMBER = "Club Number"
+    COL_PATHWAYS = "Is Pathways Enrolled"
+
     if df.empty:
-        return pd.DataFrame(columns=["Club Number", "100%_Pathway_Registration"])
+        return pd.DataFrame(columns=[CLUB_NUMBER, "100%_Pathway_Registration"])
 
-    if "Club Number" not in df.columns or "Is Pathways Enrolled" not in df.columns:
-        df.columns = df.iloc[0]   # Set second row as header
-        df = df[1:].reset_index(drop=True)   # Drop the old header row
+    if COL_PATHWAYS not in df.columns or (CLUB_NUMBER not in df.columns and "Club ID" not in df.columns):
+        df = df.set_axis(df.iloc[0], axis=1).iloc[1:]   # Header on the second row
 
-    df.rename(columns={'Club ID': 'Club Number'}, inplace=True)
-    CLUB_NUMBER = "Club Number"
-    COL_PATHWAYS = "Is Pathways Enrolled"
+    df = df.rename(columns={'Club ID': CLUB_NUMBER})
 
     # If either column missing, return empty result
     if CLUB_NUMBER not in df.columns or COL_PATHWAYS not in df.columns:
         return pd.DataFrame(columns=[CLUB_NUMBER, "100%_Pathway_Registration"])
 
-    # Clean
-    df[CLUB_NUMBER] = pd.to_numeric(df[CLUB_NUMBER].astype(str).str.strip(), errors='coerce')
-    df = df.dropna(subset=[CLUB_NUMBER])
-    df[CLUB_NUMBER] = df[CLUB_NUMBER].astype(int)
-    df[COL_PATHWAYS] = df[COL_PATHWAYS].astype(str).str.strip()
+    state = update_pathway_enrollment(empty_pathway_enrollment(), df[CLUB_NUMBER], df[COL_PATHWAYS])
+    return pathway_enrollment_frame(state)
 
-    # Group and score
-    def all_yes(series):
-        return series.str.lower().eq("yes").all()
+# ---- 3. Ranking ---- #
+# Every (Club Group, tier) leaderboard is ranked in one pass: the tier columns are stacked,
+# sorted once by (tier, group, tier points desc, Total Club Points desc, Club Name), and
+# ranks and Top N are derived from positions within each (tier, group) run.
 
-    scores = (
-        df.groupby(CLUB_NUMBER)[COL_PATHWAYS]
-        .apply(all_yes)
-        .reset_index(name="All_Yes")
-    )
-
-    scores["100%_Pathway_Registration"] = scores["All_Yes"].apply(lambda x: 10 if x else 0)
-    scores.drop(columns="All_Yes", inplace=True)
+@instrument("rank_leaderboards")
+def rank_leaderboards(df: pd.DataFrame, tiers: list[str], top_n: int = 3, group_col: str = "Club Group") -> pd.DataFrame:
+    """
+    Ranks the clubs of every group on every tier.
 
-    return scores
+    Only clubs with tier points get a Group Rank. Top N marks every club tied with or
+    ahead of the N-th ranked club on (tier points, Total Club Points); if fewer than N
+    clubs have points, all of them are Top N.
 
-def calculate_club_points(
-        base_df: pd.DataFrame,
-        members_df: pd.DataFrame
-    ):
-    
-    POINTS_PER_MEMBER = 60
+    Args:
+        df (pd.DataFrame): One row per club with group_col, 'Club Name', 'Total Club Points' and the tier columns.
+        tiers (list[str]): Tier columns to rank on.
 
-    if members_df.empty:
-        unique_members_count = pd.DataFrame(columns=["Club Number", "unique_members"])
-    
-    unique_members_count = members_df.groupby('Club Number')['Member'].nunique().reset_index()
-    unique_members_count.columns = ['Club Number', 'unique_members']
-
-    merged_df = base_df.merge(
-        unique_members_count,
-        left_on='Club Number',
-        right_on='Club Number',
-        how='left'
+    Returns:
+        pd.DataFrame: One row per (tier, club) in display order with 'Tier', group_col,
+        'Row' (integer position in df), 'Group Rank' (nullable) and 'Top N'.
+    """
+    group_codes, groups = pd.factorize(df[group_col])
+    name_codes = pd.factorize(df['Club Name'], sort=True)[0]
+    totals = df['Total Club Points'].to_numpy(dtype=np.int64)
+
+    n = len(df)
+    rows = np.tile(np.arange(n), len(tiers))
+    tier_codes = np.repeat(np.arange(len(tiers)), n)
+    scores = np.concatenate([df[tier].to_numpy(dtype=np.int64) for tier in tiers]) if tiers else np.empty(0, np.int64)
+
+    # Clubs without a group are not on any leaderboard
+    keep = group_codes[rows] >= 0
+    rows, tier_codes, scores = rows[keep], tier_codes[keep], scores[keep]
+    run_codes = tier_codes * max(len(groups), 1) + group_codes[rows]
+
+    order = np.lexsort((name_codes[rows], -totals[rows], -scores, run_codes))
+    rows, tier_codes, scores, run_codes = rows[order], tier_codes[order], scores[order], run_codes[order]
+    club_totals = totals[rows]
+
+    # Position within each (tier, group) run; clubs with points come first in their run
+    run_starts = np.flatnonzero(np.r_[True, run_codes[1:] != run_codes[:-1]]) if len(rows) else np.empty(0, np.int64)
+    run_lengths = np.diff(np.r_[run_starts, len(rows)])
+    position = np.arange(len(rows)) - np.repeat(run_starts, run_lengths)
+
+    active = scores > 0
+    n_active = np.repeat(np.add.reduceat(active.astype(np.int64), run_starts) if len(rows) else np.empty(0, np.int64), run_lengths)
+
+    # Score and Total Club Points of the N-th ranked club of each run
+    cutoff = np.repeat(run_starts + top_n - 1, run_lengths).clip(max=max(len(rows) - 1, 0))
+    top = active & (
+        (n_active < top_n) |
+        (scores > scores[cutoff]) |
+        ((scores == scores[cutoff]) & (club_totals >= club_totals[cutoff]))
     )
-    
-    # Fill NaN values with 0 (clubs with no members)
-    merged_df['unique_members'] = merged_df['unique_members'].fillna(0)
-    
-    # Calculate points: unique_members * 60
-    merged_df['points'] = merged_df['unique_members'].astype(int) * POINTS_PER_MEMBER
-    
-    # Convert to integer and return as list
-    points_list = merged_df['points'].tolist()
-    
-    return points_list
-
-def calculate_club_points_only_tc(members_df: pd.DataFrame) -> pd.DataFrame:
-    
-    POINTS_PER_MEMBER = 60
 
-    if members_df.empty:
-        unique_members_count = pd.DataFrame(columns=["Club Number", "TC Points"])
-    
-    unique_members_count = members_df.groupby('Club Number')['Member'].nunique().reset_index()
-    unique_members_count.columns = ['Club Number', 'unique_members']
-    
-    # Calculate points: unique_members * 60
-    unique_members_count['TC Points'] = unique_members_count['unique_members'].astype(int)  * POINTS_PER_MEMBER
+    group_rank = pd.array(position + 1, dtype="Int32")
+    group_rank[~active] = pd.NA
 
-    return unique_members_count[['Club Number', 'TC Points']]
\ No newline at end of file
+    return pd.DataFrame({
+        'Tier': np.asarray(tiers, dtype=object)[tier_codes],
+        group_col: groups.take(group_codes[rows]),
+        'Row': rows,
+        'Group Rank': group_rank,
+        'Top N': top,
+    })
@@ -0,0 +1,81 @@
+import pandas as pd
+
+# ------------------ Compact Club Frame Schema ------------------ #
+# Low-cardinality text is categorical and counts and points are small integers, so a
+# district frame (and every copy a session or the history holds) stays a fraction of
+# its object/float64 size. Missing numbers are 0, as everywhere else in the pipeline.
+# Quarter deltas can be negative, so counts stay signed.
+
+COUNT_DTYPE = "int16"
+POINTS_DTYPE = "int16"
+TOTAL_DTYPE = "int32"
+
+CLUB_PERFORMANCE_SCHEMA = {
+    'District': 'category',
+    'Division': 'category',
+    'Area': 'category',
+    'Club Status': 'category',
+    'Club Distinguished Status': 'category',
+    'CSP': 'category',
+    'Group': 'category',
+    'Club Group': 'category',
+    'Group Description': 'category',
+    'Mem. Base': COUNT_DTYPE,
+    'Active Members': COUNT_DTYPE,
+    'Net Growth': COUNT_DTYPE,
+    'Goals Met': 'int8',
+    'Level 1s': COUNT_DTYPE,
+    'Level 2s': COUNT_DTYPE,
+    'Add. Level 2s': COUNT_DTYPE,
+    'Level 3s': COUNT_DTYPE,
+    'Level 4s, Path Completions, or DTM Awards': COUNT_DTYPE,
+    'Add. Level 4s, Path Completions, or DTM award': COUNT_DTYPE,
+    'New Members': COUNT_DTYPE,
+    'Add. New Members': COUNT_DTYPE,
+    'Off. Trained Round 1': 'int8',
+    'Off. Trained Round 2': 'int8',
+    'Mem. dues on time Oct': 'int8',
+    'Mem. dues on time Apr': 'int8',
+    'Off. List On Time': 'int8',
+    'L1 Points': POINTS_DTYPE,
+    'L2 Points': POINTS_DTYPE,
+    'L3 Points': POINTS_DTYPE,
+    'L4 Points': POINTS_DTYPE,
+    'L5 Points': POINTS_DTYPE,
+    'DTM Points': POINTS_DTYPE,
+    'TC Points': POINTS_DTYPE,
+    'COT R1 Points': POINTS_DTYPE,
+    'COT R2 Points': POINTS_DTYPE,
+    'Early10_Distinguished': POINTS_DTYPE,
+    'Pathways Pioneers': TOTAL_DTYPE,
+    'Leadership Innovators': TOTAL_DTYPE,
+    'Excellence Champions': TOTAL_DTYPE,
+    'Total Club Points': TOTAL_DTYPE,
+}
+
+def fill_numeric(df: pd.DataFrame, value=0) -> pd.DataFrame:
+    """
+    Fills missing values of the numeric columns only. Categorical columns keep NaN,
+    since filling them with a value outside their categories is not allowed.
+    """
+    numeric = df.select_dtypes("number").columns
+    df[numeric] = df[numeric].fillna(value)
+    return df
+
+def apply_schema(df: pd.DataFrame, schema: dict = None, points: list[str] = ()) -> pd.DataFrame:
+    """
+    Casts the columns of df that appear in the schema (CLUB_PERFORMANCE_SCHEMA by default),
+    plus any extra `points` columns, to their compact dtype. Columns not listed are left as they are.
+
+    Returns:
+        pd.DataFrame: The same frame, cast in place.
+    """
+    schema = {**(schema or CLUB_PERFORMANCE_SCHEMA), **{col: POINTS_DTYPE for col in points}}
+    for col, dtype in schema.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        if dtype == 'category':
+            df[col] = df[col].astype('category')
+        else:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype(dtype)
+    return df
@@ -0,0 +1,118 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+import pandas as pd
+from utils.diagnostics import count
+
+# ------------------ Process-Wide Shared Cache ------------------ #
+# Every Streamlit session runs the page script on its own thread of the same server
+# process. Results are kept here once per (name, data version), so sessions share them,
+# and a result that is being computed is awaited rather than computed a second time
+# (single flight). A new version of a name evicts the older ones; beyond
+# SHARED_CACHE_MAX_MB the least recently used entries are dropped.
+
+_entries = OrderedDict()  # (name, version) -> (value, nbytes)
+_in_flight = {}           # key -> Future of the running computation
+_shared_cache_lock = threading.Lock()
+
+def _max_bytes() -> int:
+    return int(float(os.environ.get("SHARED_CACHE_MAX_MB", 512)) * 2**20)
+
+def estimate_size(value) -> int:
+    """Approximate memory held by a cached value; frames are measured deeply."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sum(estimate_size(item) for item in value.values())
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+def single_flight(key, compute):
+    """
+    Runs compute() for key unless a call for the same key is already running,
+    in which case its result (or exception) is awaited and returned instead.
+    Nothing is kept once the call finishes.
+    """
+    with _shared_cache_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+
+    if not leader:
+        count("single_flight.joined")
+        return future.result()
+
+    try:
+        result = compute()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _shared_cache_lock:
+            _in_flight.pop(key, None)
+
+def shared_result(name: str, version: str, compute):
+    """
+    Returns the cached result of compute() for (name, version), computing it at most
+    once across all sessions. The result is shared by every caller and must not be modified.
+
+    Args:
+        name (str): What is computed, e.g. "merged_club_data".
+        version (str): Version of the data it is computed from.
+        compute (callable): Builds the value when it is not cached.
+    """
+    key = (name, version)
+    with _shared_cache_lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+    if entry is not None:
+        count("shared_cache.hit")
+        return entry[0]
+
+    def compute_and_store():
+        with _shared_cache_lock:
+            entry = _entries.get(key)  # Stored by a flight that finished just before this one started
+        if entry is not None:
+            return entry[0]
+        count("shared_cache.miss")
+        value = compute()
+        _store(key, value)
+        return value
+
+    return single_flight(("shared", key), compute_and_store)
+
+def _store(key: tuple, value) -> None:
+    nbytes = estimate_size(value)
+    with _shared_cache_lock:
+        # Older versions of the same name are superseded
+        for stale in [k for k in _entries if k[0] == key[0] and k != key]:
+            del _entries[stale]
+            count("shared_cache.evicted")
+        _entries[key] = (value, nbytes)
+
+        max_bytes = _max_bytes()
+        total = sum(size for _, size in _entries.values())
+        while total > max_bytes and len(_entries) > 1:
+            _, (_, size) = _entries.popitem(last=False)
+            total -= size
+            count("shared_cache.evicted")
+
+def shared_cache_info() -> list[dict]:
+    """One row per cached entry: name, version and approximate size."""
+    with _shared_cache_lock:
+        return [{'Name': name, 'Version': version, 'Bytes': nbytes} for (name, version), (_, nbytes) in _entries.items()]
+
+def clear_shared_cache() -> None:
+    """Drops every cached result; computations in flight finish normally."""
+    with _shared_cache_lock:
+        _entries.clear()
@@ -0,0 +1,159 @@
+import os
+import numpy as np
+import pandas as pd
+from utils.diagnostics import instrument
+from utils.groups import incentives_tiers
+from utils.helpers import TIER_POINT_COLUMNS, get_merged_club_data, pipeline_version
+from utils.metrics import PATHWAY_ENROLLMENT_POINTS, SCORING_RULES, TC_POINTS_PER_MEMBER
+from utils.shared_cache import shared_result
+
+# ------------------ What-If Simulator ------------------ #
+# The point columns of every club are kept as one integer vector per column, built once
+# per data version from the shared merged frame. A what-if only changes a few points of
+# one club, so its tier points and Total Club Points are the stored ones plus the
+# difference, and its Group Rank is found by comparing it with the other clubs of its
+# group; nothing is reloaded, merged or re-ranked.
+#
+# A lever is one hypothetical achievement:
+#   column: point column it adds to
+#   points: points per achievement
+#   kind:   "count" adds points for every achievement (at most `cap` in total, if set),
+#           "once" awards the points if the club does not have them yet
+
+def _form_lever(rule: dict) -> dict:
+    if rule["agg"] == "max":
+        return {"label": rule["name"].replace("_", " "), "column": rule["name"], "points": rule["points"], "kind": "once"}
+    return {"label": rule["name"].replace("_", " ") + " submissions", "column": rule["name"], "points": rule["points"],
+            "kind": "count", "cap": rule.get("cap")}
+
+def simulator_levers() -> dict[str, list[dict]]:
+    """Levers of each tier; the officer training lever is the round that scores this quarter."""
+    cot_round = "COT R1 Points" if os.environ.get("Current_Quarter") in ["Q1", "Q2"] else "COT R2 Points"
+    levers = {
+        'Pathways Pioneers': [
+            # Points per level as in calculate_performance_points and compute_award_points
+            {"label": "Level 1s", "column": "L1 Points", "points": 10, "kind": "count"},
+            {"label": "Level 2s", "column": "L2 Points", "points": 20, "kind": "count"},
+            {"label": "Level 3s", "column": "L3 Points", "points": 30, "kind": "count"},
+            {"label": "Level 4 award", "column": "L4 Points", "points": 40, "kind": "once"},
+            {"label": "Level 5 award", "column": "L5 Points", "points": 50, "kind": "once"},
+            {"label": "DTM award", "column": "DTM Points", "points": 60, "kind": "once"},
+            {"label": "Triple Crown members", "column": "TC Points", "points": TC_POINTS_PER_MEMBER, "kind": "count"},
+        ],
+        'Leadership Innovators': [
+            {"label": "7 officers trained this round", "column": cot_round, "points": 20, "kind": "once"},
+            {"label": "President's Distinguished", "column": "President_Distinguished", "points": 50, "kind": "once"},
+            {"label": "Smedley Distinguished", "column": "Smedley_Distinguished", "points": 100, "kind": "once"},
+        ],
+        'Excellence Champions': [
+            {"label": "Club Success Plan", "column": "Club_Success_Plan", "points": 20, "kind": "once"},
+            {"label": "Early Distinguished (FF)", "column": "Early10_Distinguished", "points": 30, "kind": "once"},
+            {"label": "100% Pathways registration", "column": "100%_Pathway_Registration",
+             "points": PATHWAY_ENROLLMENT_POINTS, "kind": "once"},
+        ],
+    }
+    for rule in SCORING_RULES:
+        levers[rule["tier"]].append(_form_lever(rule))
+    return levers
+
+@instrument("build_simulation_base")
+def build_simulation_base(version: str) -> dict:
+    """
+    Collects the point vectors of every club from the shared merged frame.
+
+    Returns:
+        dict: {'clubs' (Club Number, Club Name, Club Group per row), 'row_of' (Club Number -> row),
+        'points' (point column -> int64 array), 'tiers' (tier -> int64 array), 'total',
+        'group_rows' (group code -> rows), 'group_codes', 'name_codes', 'update_date'}.
+    """
+    df_merged, update_date = get_merged_club_data(version)
+    numbers = df_merged['Club Number'].to_numpy()
+    group_codes = pd.factorize(df_merged['Club Group'])[0]
+    return {
+        'clubs': df_merged[['Club Number', 'Club Name', 'Club Group']].reset_index(drop=True),
+        'row_of': {number: row for row, number in enumerate(numbers)},
+        'points': {column: df_merged[column].to_numpy(dtype=np.int64)
+                   for columns in TIER_POINT_COLUMNS.values() for column in columns},
+        'tiers': {tier: df_merged[tier].to_numpy(dtype=np.int64) for tier in TIER_POINT_COLUMNS},
+        'total': df_merged['Total Club Points'].to_numpy(dtype=np.int64),
+        'group_rows': {code: np.flatnonzero(group_codes == code) for code in np.unique(group_codes) if code >= 0},
+        'group_codes': group_codes,
+        'name_codes': pd.factorize(df_merged['Club Name'], sort=True)[0],
+        'update_date': update_date,
+    }
+
+def get_simulation_base(version: str = None) -> dict:
+    """Shared simulation base for the current data version; callers must not modify it."""
+    version = version or pipeline_version()
+    return shared_result("simulation_base", version, lambda: build_simulation_base(version))
+
+def lever_points(lever: dict, current: int, value) -> int:
+    """Points of a lever's column once `value` more achievements (or True for a "once" lever) are added."""
+    if lever["kind"] == "once":
+        return max(current, lever["points"]) if value else current
+    simulated = current + int(value) * lever["points"]
+    if lever.get("cap") is not None:
+        simulated = min(simulated, max(current, lever["cap"] * lever["points"]))
+    return simulated
+
+def _group_standing(base: dict, row: int, tier: str, score: int, total: int, top_n: int = 3):
+    """
+    Group Rank and Top N of one club with the given tier points and Total Club Points,
+    the other clubs of its group unchanged. Ordered as in rank_leaderboards.
+    """
+    code = base['group_codes'][row]
+    if code < 0 or score <= 0:
+        return None, False
+
+    others = base['group_rows'][code]
+    others = others[others != row]
+    scores = base['tiers'][tier][others]
+    totals = base['total'][others]
+    names = base['name_codes'][others]
+    name = base['name_codes'][row]
+
+    active = scores > 0
+    strictly_ahead = active & ((scores > score) | ((scores == score) & (totals > total)))
+    tied = active & (scores == score) & (totals == total)
+    ahead = strictly_ahead | (tied & ((names < name) | ((names == name) & (others < row))))
+    return int(ahead.sum()) + 1, int(strictly_ahead.sum()) < top_n
+
+@instrument("simulate_club")
+def simulate_club(base: dict, club_number: int, changes: dict) -> pd.DataFrame:
+    """
+    Applies hypothetical achievements to one club and recomputes its standing.
+
+    Args:
+        base (dict): From get_simulation_base.
+        club_number (int): Club to simulate.
+        changes (dict): Point column -> simulated points of that column for this club.
+
+    Returns:
+        pd.DataFrame: One row per tier and one for Total Club Points with the current and
+        simulated points, the change and the Group Rank and Top 3 before and after.
+    """
+    row = base['row_of'][club_number]
+    delta_by_tier = {
+        tier: sum(changes[column] - int(base['points'][column][row]) for column in columns if column in changes)
+        for tier, columns in TIER_POINT_COLUMNS.items()
+    }
+    total = int(base['total'][row])
+    simulated_total = total + sum(delta_by_tier.values())
+
+    records = []
+    for tier in incentives_tiers:
+        score = int(base['tiers'][tier][row])
+        simulated = score + delta_by_tier[tier]
+        rank, top = _group_standing(base, row, tier, score, total)
+        simulated_rank, simulated_top = _group_standing(base, row, tier, simulated, simulated_total)
+        records.append({
+            'Points': tier, 'Current': score, 'What-If': simulated, 'Change': simulated - score,
+            'Group Rank': rank, 'What-If Rank': simulated_rank, 'Top 3': top, 'What-If Top 3': simulated_top,
+        })
+    records.append({
+        'Points': 'Total Club Points', 'Current': total, 'What-If': simulated_total,
+        'Change': simulated_total - total, 'Group Rank': None, 'What-If Rank': None, 'Top 3': None, 'What-If Top 3': None,
+    })
+    df = pd.DataFrame(records)
+    df[['Group Rank', 'What-If Rank']] = df[['Group Rank', 'What-If Rank']].astype("Int32")
+    return df
@@ -0,0 +1,121 @@
+import os
+import hashlib
+from datetime import datetime
+from typing import Optional
+import pandas as pd
+
+# ------------------ Club Performance Snapshot Store ------------------ #
+# Parsed club performance exports are frozen once their quarter has closed, so they are
+# persisted as Parquet under <SNAPSHOT_DIR>/<season>/<quarter>/<file>/<as-of date>.parquet
+# and read back with memory mapping instead of being downloaded again. <file> is a digest
+# of the export's file ID, so pointing a quarter at another file takes a new snapshot.
+
+def snapshot_dir() -> str:
+    return os.environ.get("SNAPSHOT_DIR", os.path.join("data", "snapshots"))
+
+def program_year(date_str: Optional[str] = None) -> str:
+    """
+    Returns the Toastmasters program year ("2025-2026") a date falls in.
+    Program years run from July to June. PROGRAM_YEAR overrides the derived value.
+    """
+    if os.environ.get("PROGRAM_YEAR"):
+        return os.environ["PROGRAM_YEAR"]
+
+    date_str = date_str or os.environ.get("QUARTER_START_DATE")
+    date = datetime.strptime(date_str, "%Y-%m-%d") if date_str else datetime.today()
+    start_year = date.year if date.month >= 7 else date.year - 1
+    return f"{start_year}-{start_year + 1}"
+
+def parse_as_of(update_date: str) -> str:
+    """
+    Converts the 'As of MM/DD/YYYY' footer of a club performance export to ISO format.
+    Falls back to today's date when the footer is missing.
+    """
+    try:
+        return datetime.strptime(str(update_date).strip(), "%m/%d/%Y").strftime("%Y-%m-%d")
+    except ValueError:
+        return datetime.today().strftime("%Y-%m-%d")
+
+def file_tag(file_id: str) -> str:
+    """Folder name of a file ID; IDs of the local backend are paths, so they are hashed."""
+    return hashlib.sha1(str(file_id).encode()).hexdigest()[:12]
+
+def snapshot_path(season: str, quarter: str, file_id: str, as_of: str) -> str:
+    return os.path.join(snapshot_dir(), season, quarter, file_tag(file_id), f"{as_of}.parquet")
+
+def find_snapshot(season: str, quarter: str, file_id: str) -> Optional[str]:
+    """Returns the path of the most recent snapshot stored for (season, quarter, file ID), if any."""
+    folder = os.path.join(snapshot_dir(), season, quarter, file_tag(file_id))
+    if not os.path.isdir(folder):
+        return None
+
+    snapshots = sorted(f for f in os.listdir(folder) if f.endswith(".parquet"))
+    return os.path.join(folder, snapshots[-1]) if snapshots else None
+
+def latest_snapshot(season: str, quarter: str) -> Optional[str]:
+    """
+    Returns the newest snapshot of (season, quarter) whatever file it was taken from:
+    the latest as-of date, and of those the one written last (e.g. a corrected export).
+    """
+    folder = os.path.join(snapshot_dir(), season, quarter)
+    if not os.path.isdir(folder):
+        return None
+
+    snapshots = [
+        os.path.join(folder, tag, f)
+        for tag in os.listdir(folder) if os.path.isdir(os.path.join(folder, tag))
+        for f in os.listdir(os.path.join(folder, tag)) if f.endswith(".parquet")
+    ]
+    if not snapshots:
+        return None
+    return max(snapshots, key=lambda path: (os.path.basename(path), os.stat(path).st_mtime_ns))
+
+def save_snapshot(df: pd.DataFrame, season: str, quarter: str, file_id: str, update_date: str) -> str:
+    """
+    Persists a parsed club performance export under (season, quarter, file ID, as-of date).
+
+    Args:
+        df (pd.DataFrame): Parsed export, as returned by load_club_performance_data.
+        season (str): Program year, e.g. "2025-2026".
+        quarter (str): Snapshot label, e.g. "Q1" or "BASE_Q2".
+        file_id (str): File ID the export was read from.
+        update_date (str): 'MM/DD/YYYY' as-of date from the export footer.
+
+    Returns:
+        str: Path of the written Parquet file.
+    """
+    path = snapshot_path(season, quarter, file_id, parse_as_of(update_date))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Write to a temporary file first so readers never see a partial snapshot
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           b"update_date": str(update_date).encode(), b"file_id": str(file_id).encode()})
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+def load_snapshot(season: str, quarter: str, file_id: str) -> Optional[tuple[pd.DataFrame, str]]:
+    """
+    Reads the most recent snapshot for (season, quarter, file ID) from local disk using memory mapping.
+    A snapshot whose metadata names another file is ignored.
+
+    Returns:
+        tuple | None: (DataFrame, update_date) or None if no snapshot exists.
+    """
+    path = find_snapshot(season, quarter, file_id)
+    if path is None:
+        return None
+
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(path, memory_map=True)
+    metadata = table.schema.metadata or {}
+    if metadata.get(b"file_id", b"").decode() != str(file_id):
+        return None
+    update_date = metadata.get(b"update_date", b"Not available").decode()
+    return table.to_pandas(), update_date
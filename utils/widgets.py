@@ -0,0 +1,99 @@
+import time
+from contextlib import contextmanager
+import streamlit as st
+from utils.helpers import ClubPerformanceUnavailable, load_incentive_winners, stale_sources
+
+# Streamlit-only widgets live here so that utils.helpers stays importable without Streamlit
+
+# ------------------ Q1 WINNERS MODAL ------------------ #
+def show_incentive_winners_modal(quarter: str, secret_key: str):
+    st.markdown("<p style='text-align: center; color: #666; margin-bottom: 30px;'>Click on a Club Group to view winners</p>", unsafe_allow_html=True)
+    
+    df_results = load_incentive_winners(secret_key=secret_key)
+
+    if df_results.empty:
+        st.error(f"No {quarter} data available")
+        return
+
+    club_groups = sorted(df_results['Club Group'].unique())
+    icons = ["🏛️", "🏢", "⭐", "💎", "🎯", "🚀", "🌟", "🌐"]
+    cols = st.columns(len(club_groups))
+
+    for idx, group in enumerate(club_groups):
+        group_df = df_results[df_results['Club Group'] == group]
+        num_winners = len(group_df)
+        group_icon = icons[idx % len(icons)]
+
+        with cols[idx]:
+            st.markdown(
+                f"""
+                <div style="text-align: center; padding: 25px 15px; border-radius: 12px; 
+                     background-color: var(--background-color); border: 2px solid var(--secondary-background-color); 
+                     margin-bottom: 15px;">
+                    <div style="font-size: 60px; margin-bottom: 12px;">{group_icon}</div>
+                    <div style="font-size: 18px; font-weight: bold; margin: 8px 0;">{group}</div>
+                </div>
+                """,
+                unsafe_allow_html=True
+            )
+
+            with st.expander("View Winners", expanded=False):
+                group_df_sorted = group_df.sort_values('Tier Points', ascending=False)
+                tiers = group_df_sorted['Incentive Tiers'].unique()
+
+                for tier in tiers:
+                    tier_winners = group_df_sorted[group_df_sorted['Incentive Tiers'] == tier]
+                    tier_lower = str(tier).lower()
+
+                    if 'gold' in tier_lower or 'platinum' in tier_lower:
+                        tier_emoji = "🥇"
+                    elif 'silver' in tier_lower:
+                        tier_emoji = "🥈"
+                    elif 'bronze' in tier_lower:
+                        tier_emoji = "🥉"
+                    else:
+                        tier_emoji = "🏅"
+
+                    st.markdown(f"**{tier_emoji} {tier}**")
+                    for _, winner in tier_winners.iterrows():
+                        st.markdown(f"{winner['Club Name']}")
+                    st.markdown("")  # Spacer
+
+
+# ------------------ DATA FRESHNESS ------------------ #
+def _age(seconds: float) -> str:
+    minutes = int(seconds // 60)
+    if minutes < 60:
+        return f"{minutes} min"
+    if minutes < 48 * 60:
+        return f"{minutes // 60} h {minutes % 60} min"
+    return f"{minutes // (24 * 60)} days"
+
+def show_data_freshness():
+    """
+    Warns when some sources could not be refreshed: those with a last good copy are shown
+    from it, those without one are missing from the page until they load.
+    """
+    stale = stale_sources()
+    fallback = [row['Last Good'] for row in stale if row['Last Good'] is not None]
+    missing = len(stale) - len(fallback)
+    if fallback:
+        st.warning(
+            f"⚠️ {len(fallback)} data source(s) could not be refreshed; showing the last good copy "
+            f"from {_age(time.time() - min(fallback))} ago. "
+            "The leaderboard updates automatically once Google Drive responds again."
+        )
+    if missing:
+        st.warning(
+            f"⚠️ {missing} data source(s) could not be loaded and have no earlier copy; "
+            "their points are counted as zero until Google Drive responds again."
+        )
+
+@contextmanager
+def stop_if_data_unavailable():
+    """Shows an error and stops the page when the club performance data cannot be loaded at all."""
+    try:
+        yield
+    except ClubPerformanceUnavailable as e:
+        st.error(f"⚠️ {e}")
+        st.stop()